@@ -1,52 +1,195 @@
 """
 Main entry point for the web scraping collection.
-Lists available scrapers organized by category.
+Lists available scrapers organized by category and runs them.
+
+Usage:
+    python main.py                          # list scrapers
+    python main.py run amazon flipkart      # run scrapers by name
+    python main.py run --category content   # run every scraper in a category
+    python main.py run --all --jobs 8       # run everything
+
+Scrapers that hit different sites run concurrently; scrapers that share a
+site are run one after another so they never compete for the same host.
+Scrapers are looked up in scrapers.registry, so listing them imports no
+scraper module and only the scrapers being run are loaded.
 """
 
+import argparse
 import os
+import sys
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+PROJECT_ROOT = Path(__file__).parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from scrapers import registry
+from scrapers.registry import CATEGORIES
+
 
 def list_scrapers():
     """List all available scrapers organized by category."""
-    scrapers_dir = Path(__file__).parent / "scrapers"
-    
-    categories = {
-        "ecommerce": "E-commerce Websites",
-        "job_boards": "Job Boards",
-        "educational": "Educational Platforms",
-        "social_media": "Social Media & Developer Platforms",
-        "content": "Content & Media",
-        "misc": "Miscellaneous"
-    }
-    
+    scrapers = registry.all_scrapers()
+
     print("=" * 60)
     print("Web Scraping Collection - Available Scrapers")
     print("=" * 60)
     print()
-    
-    for category_dir, category_name in categories.items():
-        category_path = scrapers_dir / category_dir
-        if category_path.exists():
-            py_files = sorted(category_path.glob("*.py"))
-            if py_files:
-                print(f"\n📁 {category_name}")
-                print("-" * 60)
-                for py_file in py_files:
-                    if py_file.name != "__init__.py":
-                        print(f"  • {category_dir}/{py_file.name}")
-    
+
+    for category_dir, category_name in CATEGORIES.items():
+        specs = [spec for spec in scrapers if spec.category == category_dir]
+        if specs:
+            print(f"\n📁 {category_name}")
+            print("-" * 60)
+            for spec in specs:
+                note = "" if spec.unattended else " (manual)"
+                print(f"  • {spec.key}.py - {spec.description}{note}")
+
     print("\n" + "=" * 60)
     print("\nUsage:")
     print("  python scrapers/<category>/<scraper_name>.py")
+    print("  python main.py run <scraper_name> [...]")
+    print("  python main.py run --category <category> | --all [--jobs N]")
     print("\nExample:")
     print("  python scrapers/ecommerce/flipkart.py")
+    print("  python main.py run flipkart amazon")
     print("=" * 60)
 
 
+def resolve(names, category=None, run_all=False):
+    """
+    Turn command line selections into scraper specs.
+
+    Args:
+        names: Scraper names ('amazon' or 'ecommerce/amazon')
+        category: Category to run in full
+        run_all: Run every unattended scraper
+
+    Returns:
+        List of ScraperSpec ordered by key
+    """
+    scrapers = registry.all_scrapers()
+    selected = {}
+    for name in names:
+        matches = [spec for spec in scrapers if name in (spec.key, spec.name)]
+        if not matches:
+            raise SystemExit(f"Unknown scraper: {name}")
+        selected.update((spec.key, spec) for spec in matches)
+    if category:
+        if category not in CATEGORIES:
+            raise SystemExit(f"Unknown category: {category}")
+        selected.update((spec.key, spec) for spec in scrapers
+                        if spec.category == category and spec.unattended)
+    if run_all:
+        selected.update((spec.key, spec) for spec in scrapers if spec.unattended)
+    return [selected[key] for key in sorted(selected)]
+
+
+def group_by_site(specs):
+    """
+    Group scrapers so each site is only crawled by one of them at a time.
+
+    Args:
+        specs: Scraper specs
+
+    Returns:
+        Dict mapping site to the list of specs that use it
+    """
+    groups = {}
+    for spec in specs:
+        groups.setdefault(spec.site, []).append(spec)
+    return groups
+
+
+def run_one(spec):
+    """
+    Import and run a single scraper in this process.
+
+    Args:
+        spec: Scraper spec
+
+    Returns:
+        (key, ok, seconds, error message)
+    """
+    start = time.monotonic()
+    try:
+        spec.run()
+    except KeyboardInterrupt:
+        raise
+    except BaseException as e:  # scrapers may call sys.exit or raise anything
+        if isinstance(e, SystemExit) and not e.code:
+            return spec.key, True, time.monotonic() - start, ""
+        traceback.print_exc()
+        return spec.key, False, time.monotonic() - start, f"{type(e).__name__}: {e}"
+    return spec.key, True, time.monotonic() - start, ""
+
+
+def run_group(specs):
+    """
+    Run the scrapers of one site one after another.
+
+    Args:
+        specs: Scraper specs sharing a site
+
+    Returns:
+        List of run_one results
+    """
+    return [run_one(spec) for spec in specs]
+
+
+def run_scrapers(specs, jobs=4):
+    """
+    Run scrapers, overlapping those that hit different sites.
+
+    Args:
+        specs: Scraper specs to run
+        jobs: Maximum number of sites crawled at the same time
+
+    Returns:
+        True if every scraper succeeded
+    """
+    # scrapers write to paths relative to the project root and must not see our arguments
+    os.chdir(PROJECT_ROOT)
+    sys.argv = [sys.argv[0]]
+
+    groups = group_by_site(specs)
+    print(f"▶ Running {len(specs)} scraper(s) across {len(groups)} site(s) with {jobs} worker(s)")
+    results = []
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        futures = [pool.submit(run_group, group) for group in groups.values()]
+        for future in as_completed(futures):
+            for key, ok, seconds, error in future.result():
+                status = "✅" if ok else "❌"
+                print(f"{status} {key} finished in {seconds:.1f}s {error}".rstrip())
+                results.append(ok)
+    failed = results.count(False)
+    print(f"\n{len(results) - failed} succeeded, {failed} failed")
+    return failed == 0
+
+
 def main():
     """Main entry point."""
-    list_scrapers()
+    parser = argparse.ArgumentParser(description="Web scraping collection")
+    subparsers = parser.add_subparsers(dest="command")
+    subparsers.add_parser("list", help="list available scrapers")
+    run_parser = subparsers.add_parser("run", help="run scrapers in-process")
+    run_parser.add_argument("names", nargs="*", help="scraper names, e.g. amazon or ecommerce/amazon")
+    run_parser.add_argument("--category", choices=sorted(CATEGORIES), help="run every scraper in a category")
+    run_parser.add_argument("--all", action="store_true", help="run every scraper that needs no console input")
+    run_parser.add_argument("--jobs", type=int, default=4, help="sites crawled concurrently (default: 4)")
+    args = parser.parse_args()
+
+    if args.command != "run":
+        list_scrapers()
+        return
+
+    specs = resolve(args.names, category=args.category, run_all=args.all)
+    if not specs:
+        run_parser.error("nothing to run: give scraper names, --category or --all")
+    if not run_scrapers(specs, jobs=args.jobs):
+        sys.exit(1)
 
 
 if __name__ == "__main__":
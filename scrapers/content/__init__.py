@@ -1,2 +1,14 @@
 """Content and media website scrapers."""
 
+from scrapers.registry import register
+
+register("books_toscrape", "content", "scrapers.content.books_toscrape:main", "toscrape.com",
+         "Book catalogue from books.toscrape.com")
+register("imdb", "content", "scrapers.content.imdb:main", "imdb.com",
+         "IMDb top rated movies")
+register("openlibrary_books", "content", "scrapers.content.openlibrary_books:main", "openlibrary.org",
+         "Open Library search results")
+register("quotes_toscrape", "content", "scrapers.content.quotes_toscrape:scrape_all_quotes", "toscrape.com",
+         "Quotes from quotes.toscrape.com")
+register("wikipedia", "content", "scrapers.content.wikipedia:main", "wikipedia.org",
+         "Largest companies table from Wikipedia")
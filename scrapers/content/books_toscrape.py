@@ -6,22 +6,27 @@
 # I tried to explain each part of the script
 
 # importing all the required libraries
-import requests                # to send HTTP requests and get web pages
-from bs4 import BeautifulSoup  # to parse HTML content
-import pandas as pd            # to store data in table format and save as CSV
-import time, random            # for delay between requests
+import argparse
+import sys
+from pathlib import Path
 from urllib.parse import urljoin  # to handle relative URLs
 
+# the shared fetch engine keeps connections alive and sends browser-like headers
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from scrapers.utils.archive import default_archive_path, reextract
+from scrapers.utils.http import enable_archive, enable_cache, fetch
+from scrapers.utils.parsing import parse_html  # BeautifulSoup on the fastest parser available
+from scrapers.utils.ratelimit import set_rate
+
 # this is the main website from where we will scrape data
 base_url = "https://books.toscrape.com/"
 
-# creating a session helps us reuse the same connection
-session = requests.Session()
+# the only parts of a page we read: the book cards and the "next" button
+PAGE_PARTS = ["article.product_pod", "li.next"]
 
-# adding a fake user-agent to look like a real browser
-session.headers.update({
-    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0"
-})
+# at most one request every ~1.5 seconds to avoid overloading the server;
+# the limiter only waits if parsing the last page took less time than that
+set_rate("books.toscrape.com", rate=1 / 1.5)
 
 # function to extract all books from a single page
 def get_books_from_page(soup):
@@ -71,10 +76,10 @@ def scrape_all_books():
     # continue scraping until no next page found
     while page_url:
         print("Scraping page:", page_url)
-        response = session.get(page_url)
+        response = fetch(page_url)
         
-        # parse HTML content using BeautifulSoup
-        soup = BeautifulSoup(response.text, "lxml")
+        # parse only the book cards and the pagination link, skipping the rest of the page
+        soup = parse_html(response.text, only=PAGE_PARTS)
         
         # extract data from this page
         books = get_books_from_page(soup)
@@ -85,9 +90,6 @@ def scrape_all_books():
         if next_page:
             # join the relative link with base URL
             page_url = urljoin(page_url, next_page["href"])
-            
-            # add delay to avoid overloading the server
-            time.sleep(random.uniform(1, 2))
         else:
             page_url = None   # stop the loop
     
@@ -95,11 +97,30 @@ def scrape_all_books():
 
 
 # main function (starting point)
-if __name__ == "__main__":
-    print("Starting scraper...")
+def main():
+    import pandas as pd  # to store data in table format and save as CSV
     
-    # call the function to get all book data
-    data = scrape_all_books()
+    parser = argparse.ArgumentParser(description="Scrape all books from books.toscrape.com")
+    parser.add_argument("--reextract", action="store_true",
+                        help="re-parse the archived pages instead of crawling the site again")
+    args = parser.parse_args()
+    archive_path = default_archive_path("books_toscrape")
+    
+    if args.reextract:
+        # run get_books_from_page over every archived page on all cores
+        print("Re-extracting from", archive_path)
+        data = [book for _, books in reextract(archive_path, get_books_from_page) for book in books]
+    else:
+        print("Starting scraper...")
+        
+        # keep pages on disk for a week; re-runs revalidate instead of downloading again
+        enable_cache(ttl=7 * 24 * 60 * 60)
+        
+        # keep the raw pages so a broken selector can be fixed without re-crawling
+        enable_archive(archive_path)
+        
+        # call the function to get all book data
+        data = scrape_all_books()
     
     # convert list of dictionaries to DataFrame
     df = pd.DataFrame(data)
@@ -109,3 +130,7 @@ if __name__ == "__main__":
     
     print(f"Scraping completed. Total books found: {len(df)}")
     print("Data saved to books_toscrape_data.csv")
+
+
+if __name__ == "__main__":
+    main()
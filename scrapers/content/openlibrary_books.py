@@ -4,13 +4,26 @@ Outputs:
 
 Requirements:
     pip install requests
+    pip install ijson   (parses each page incrementally as it downloads)
 """
 
-import requests
-import csv
-import time
+import argparse
+import sys
+import threading
+from contextlib import closing
 from pathlib import Path
 
+try:
+    import ijson
+except ImportError:  # optional speed-up
+    ijson = None
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from scrapers.utils.http import enable_cache, fetch, is_recording
+from scrapers.utils.pagination import iter_pages
+from scrapers.utils.ratelimit import set_rate
+from scrapers.utils.sinks import open_sink
+
 BASE_URL = "https://openlibrary.org"
 API_SEARCH_URL = "https://openlibrary.org/search.json"
 # Get project root (go up from scrapers/content/)
@@ -18,24 +31,57 @@ project_root = Path(__file__).parent.parent.parent
 OUTPUT_CSV = project_root / "output" / "openlibrary_books.csv"
 OUTPUT_CSV.parent.mkdir(exist_ok=True)
 USER_AGENT = "OpenLibraryScraper/1.0 (+your_email@example.com)"
-CRAWL_DELAY = 1  # seconds
+REQUESTS_PER_SECOND = 1  # polite crawl rate for openlibrary.org
 MAX_PAGES = 50   # Number of pages to fetch 
+CONCURRENCY = 4  # pages in flight at once
+CACHE_TTL = 24 * 60 * 60  # seconds before a cached page is revalidated
+PAGE_SIZE = 100
+# Only the fields extract_book_data reads; a full search doc carries dozens more
+SEARCH_FIELDS = ("key", "title", "author_name", "subject", "first_publish_year")
 
+set_rate("openlibrary.org", rate=REQUESTS_PER_SECOND)
 
-def fetch_books(page=1):
+
+def search_params(page):
     """
-    Fetch books from OpenLibrary API by page.
+    Query string of one search page, asking only for SEARCH_FIELDS.
     """
-    params = {
+    return {
         "q": "the",  # generic query to get lots of books
         "page": page,
-        "limit": 100
+        "limit": PAGE_SIZE,
+        "fields": ",".join(SEARCH_FIELDS),
     }
+
+def fetch_books(page=1):
+    """
+    Fetch books from OpenLibrary API by page.
+    """
     headers = {"User-Agent": USER_AGENT}
-    resp = requests.get(API_SEARCH_URL, params=params, headers=headers, timeout=15)
+    resp = fetch(API_SEARCH_URL, params=search_params(page), headers=headers, timeout=15)
     resp.raise_for_status()
     return resp.json()
 
+def iter_docs(page=1):
+    """
+    Yield the docs of one search page.
+
+    With ijson installed and neither the response cache nor the archive
+    enabled, the response is streamed and each doc is decoded as its bytes
+    arrive, so the page is never held in memory as a whole. Streamed responses
+    bypass the cache and the archive, so while either is on the page is
+    fetched and decoded in one go and can be cached and revalidated.
+    """
+    if ijson is None or is_recording():
+        yield from fetch_books(page).get("docs", [])
+        return
+    headers = {"User-Agent": USER_AGENT}
+    resp = fetch(API_SEARCH_URL, params=search_params(page), headers=headers, timeout=15, stream=True)
+    with closing(resp):
+        resp.raise_for_status()
+        resp.raw.decode_content = True  # let urllib3 undo gzip before ijson reads
+        yield from ijson.items(resp.raw, "docs.item", use_float=True)
+
 def extract_book_data(doc):
     """
     Extract required fields from a book doc.
@@ -62,30 +108,65 @@ def extract_book_data(doc):
     }
 
 
+def fetch_page_books(page, write):
+    """
+    Fetch one page and hand each book to write() as soon as its doc is decoded.
+
+    Returns the number of books written, or None if the request failed (books
+    written before the failure are kept).
+    """
+    print(f"[+] Fetching page {page}...")
+    count = 0
+    try:
+        for doc in iter_docs(page):
+            write(extract_book_data(doc))
+            count += 1
+    except Exception as e:
+        print(f"  ! Failed to fetch page {page}: {e}")
+        return None
+    return count
+
+
+def crawl_books(sink, max_pages=MAX_PAGES, concurrency=CONCURRENCY):
+    """
+    Stream the books of up to max_pages search pages into sink.
+
+    Pages are fetched concurrently and their rows go to the sink as they are
+    parsed, so rows of pages in flight may interleave.
+    """
+    lock = threading.Lock()
+
+    def write(row):
+        with lock:
+            sink.write(row)
+
+    # a failed page is skipped; an empty page means we ran past the last result
+    pages = iter_pages(lambda page: fetch_page_books(page, write), range(1, max_pages + 1),
+                       concurrency=concurrency, is_empty=lambda count: count == 0)
+    for _ in pages:
+        pass
+
+
 def main():
-    all_books = []
+    """Scrape the Open Library search pages into OUTPUT_CSV."""
+    parser = argparse.ArgumentParser(description="Scrape books from the Open Library search API")
+    parser.add_argument("--pages", type=int, default=MAX_PAGES, help="search pages to fetch (default: %(default)s)")
+    parser.add_argument("--concurrency", type=int, default=CONCURRENCY,
+                        help="pages in flight at once; the request rate stays capped (default: %(default)s)")
+    parser.add_argument("--cache", action="store_true",
+                        help="cache and revalidate pages; cached pages are decoded whole instead of streamed")
+    args = parser.parse_args()
+
     print("[+] Starting OpenLibrary scraper...")
+    if args.cache:
+        enable_cache(ttl=CACHE_TTL)
+
+    keys = ["Title", "Author", "Subjects", "PublishYear", "Link"]
+    with open_sink(OUTPUT_CSV, fieldnames=keys) as sink:
+        crawl_books(sink, args.pages, args.concurrency)
 
-    for page in range(1, MAX_PAGES + 1):
-        print(f"[+] Fetching page {page}...")
-        try:
-            data = fetch_books(page)
-            docs = data.get("docs", [])
-            for doc in docs:
-                book = extract_book_data(doc)
-                all_books.append(book)
-        except Exception as e:
-            print(f"  ! Failed to fetch page {page}: {e}")
-        
-        time.sleep(CRAWL_DELAY)  # polite delay
-
-    if all_books:
-        keys = ["Title", "Author", "Subjects", "PublishYear", "Link"]
-        with open(str(OUTPUT_CSV), "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=keys)
-            writer.writeheader()
-            writer.writerows(all_books)
-        print(f"[+] Saved {len(all_books)} books to {OUTPUT_CSV}")
+    if sink.count:
+        print(f"[+] Saved {sink.count} books to {OUTPUT_CSV}")
     else:
         print("[!] No books scraped")
 
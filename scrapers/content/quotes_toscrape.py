@@ -1,12 +1,18 @@
+import sys
+from pathlib import Path
 import requests
-from bs4 import BeautifulSoup
-import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from scrapers.utils.http import fetch
+from scrapers.utils.parsing import parse_html
 
 def scrape_all_quotes():
     """
     Scrapes all quotes, authors, and tags from all pages of quotes.toscrape.com
     and saves them to a CSV file.
     """
+    import pandas as pd
+
     base_url = 'https://quotes.toscrape.com'
     current_url = '/'
     all_quotes = []
@@ -19,11 +25,11 @@ def scrape_all_quotes():
 
         try:
             # Send a GET request to the URL
-            response = requests.get(scrape_url)
+            response = fetch(scrape_url)
             response.raise_for_status()
 
-            # Parse the HTML content
-            soup = BeautifulSoup(response.content, 'html.parser')
+            # Parse only the quotes and the 'Next' button
+            soup = parse_html(response.content, only=['div.quote', 'li.next'])
 
             # Find all the quote containers on the page
             quote_containers = soup.find_all('div', class_='quote')
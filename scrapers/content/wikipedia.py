@@ -1,8 +1,13 @@
 import requests
-from bs4 import BeautifulSoup
 import csv
 import os
 import re
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from scrapers.utils.http import enable_cache, fetch
+from scrapers.utils.parsing import parse_html
 
 def scrape_wikipedia_table(url, output_filename):
     """
@@ -15,10 +20,10 @@ def scrape_wikipedia_table(url, output_filename):
         }
         
         print(f"Fetching data from {url}...")
-        response = requests.get(url, headers=headers, timeout=10)
+        response = fetch(url, headers=headers, timeout=10)
         response.raise_for_status()
 
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = parse_html(response.content, only='table.wikitable')  # Skip the article body
         table = soup.find('table', {'class': 'wikitable'})
         if not table:
             print("❌ Error: No table with class 'wikitable' found on the page.")
@@ -76,7 +81,14 @@ def scrape_wikipedia_table(url, output_filename):
         print(f"❌ An unexpected error occurred: {e}")
 
 
-if __name__ == '__main__':
-    WIKIPEDIA_URL = "https://en.wikipedia.org/wiki/List_of_largest_companies_by_revenue"
-    OUTPUT_FILE = "output/wikipedia.csv"
+WIKIPEDIA_URL = "https://en.wikipedia.org/wiki/List_of_largest_companies_by_revenue"
+OUTPUT_FILE = "output/wikipedia.csv"
+
+
+def main():
+    enable_cache(ttl=24 * 60 * 60)  # re-runs within a day are served from disk
     scrape_wikipedia_table(WIKIPEDIA_URL, OUTPUT_FILE)
+
+
+if __name__ == '__main__':
+    main()
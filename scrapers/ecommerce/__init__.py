@@ -1,2 +1,10 @@
 """E-commerce website scrapers."""
 
+from scrapers.registry import register
+
+register("amazon", "ecommerce", "scrapers.ecommerce.amazon:main", "amazon.in",
+         "Amazon.in product search results")
+register("flipkart", "ecommerce", "scrapers.ecommerce.flipkart:main", "flipkart.com",
+         "Flipkart product search results")
+register("olx", "ecommerce", "scrapers.ecommerce.olx:main", "olx.in",
+         "OLX listings from the JSON search API")
@@ -1,83 +1,138 @@
-import requests
-from bs4 import BeautifulSoup
-import csv
-import time
-import os
-from pathlib import Path
-
-headers = {
-    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-    'Accept-Language': 'en-US,en;q=0.9',
-    'Accept-Encoding': 'gzip, deflate, br',
-    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-    'Referer': 'https://www.amazon.in/'
-}
-
-products = []
-search_queries = ['laptops', 'smartphones', 'headphones']
-
-for query in search_queries:
-    print(f"\n--- Scraping for query: '{query}' ---")
-    
-    for page in range(1, 26): 
-        print(f"Scraping page {page} for {query}...")
-        
-        url = f"https://www.amazon.in/s?k={query}&page={page}"
-        
-        response = requests.get(url, headers=headers)
-        
-        if "api-services-support@amazon.com" in response.text:
-            print(f"Blocked by Amazon on page {page}. Moving to next query.")
-            break
-            
-        soup = BeautifulSoup(response.text, 'lxml')
-
-        containers = soup.find_all('div', attrs={'data-component-type': 's-search-result'})
-
-        if not containers:
-            print(f"No more products found at page {page}. Moving to next query.")
-            break
-
-        for container in containers:
-            product_data = {}
-
-            try:
-                name_element = container.find('h2') # Was: container.find('span', class_='a-text-normal')
-                product_data['Name'] = name_element.get_text().strip()
-            except AttributeError:
-                product_data['Name'] = 'N/A'
-
-            try:
-                price_element = container.find('span', class_='a-price-whole')
-                product_data['Price'] = f"₹{price_element.get_text().strip()}"
-            except AttributeError:
-                product_data['Price'] = 'N/A'
-
-            try:
-                rating_element = container.find('span', class_='a-icon-alt')
-                product_data['Rating'] = rating_element.get_text().strip().split(' ')[0]
-            except AttributeError:
-                product_data['Rating'] = 'N/A'
-            
-            if product_data['Name'] != 'N/A':
-                products.append(product_data)
-                
-        time.sleep(1.5)
-
-if products:
-    fieldnames = ['Name', 'Price', 'Rating']
-    
-    # Get project root (go up from scrapers/ecommerce/)
-    project_root = Path(__file__).parent.parent.parent
-    output_dir = project_root / 'output'
-    output_dir.mkdir(exist_ok=True)
-    csv_path = output_dir / 'Amazon.csv' 
-    
-    with open(csv_path, 'w', encoding="utf-8", newline='') as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(products)
-        
-    print(f"\nSuccessfully saved {len(products)} total products to {csv_path}")
-else:
-    print("\nNo products were scraped. Amazon may have changed its HTML or blocked the request.")
+import argparse
+import sys
+from bs4 import BeautifulSoup
+from functools import partial
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from scrapers.utils.archive import default_archive_path, reextract
+from scrapers.utils.http import enable_archive, fetch
+from scrapers.utils.pagination import iter_pages
+from scrapers.utils.ratelimit import set_rate
+from scrapers.utils.sinks import open_sink
+
+set_rate('www.amazon.in', rate=1 / 1.5)  # one request every 1.5s per host
+
+headers = {
+    'User-Agent': ('Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+                   '(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'),
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Referer': 'https://www.amazon.in/'
+}
+
+search_queries = ['laptops', 'smartphones', 'headphones']
+MAX_PAGES = 25
+CONCURRENCY = 4  # pages in flight per query; the rate limiter still paces the host
+
+
+def parse_products(soup):
+    """Extract products from a parsed result page. Returns None if it has no result cards."""
+    containers = soup.find_all('div', attrs={'data-component-type': 's-search-result'})
+
+    if not containers:
+        return None
+
+    page_products = []
+    for container in containers:
+        product_data = {}
+
+        try:
+            name_element = container.find('h2') # Was: container.find('span', class_='a-text-normal')
+            product_data['Name'] = name_element.get_text().strip()
+        except AttributeError:
+            product_data['Name'] = 'N/A'
+
+        try:
+            price_element = container.find('span', class_='a-price-whole')
+            product_data['Price'] = f"₹{price_element.get_text().strip()}"
+        except AttributeError:
+            product_data['Price'] = 'N/A'
+
+        try:
+            rating_element = container.find('span', class_='a-icon-alt')
+            product_data['Rating'] = rating_element.get_text().strip().split(' ')[0]
+        except AttributeError:
+            product_data['Rating'] = 'N/A'
+        
+        if product_data['Name'] != 'N/A':
+            page_products.append(product_data)
+    return page_products
+
+
+def scrape_page(query, page):
+    """Scrape one result page. Returns None when there are no more results."""
+    print(f"Scraping page {page} for {query}...")
+    
+    url = f"https://www.amazon.in/s?k={query}&page={page}"
+    
+    response = fetch(url, headers=headers)
+    
+    if "api-services-support@amazon.com" in response.text:
+        print(f"Blocked by Amazon on page {page}. Moving to next query.")
+        return None
+        
+    soup = BeautifulSoup(response.text, 'lxml')
+
+    page_products = parse_products(soup)
+
+    if page_products is None:
+        print(f"No more products found at page {page}. Moving to next query.")
+    return page_products
+
+
+def scrape_products():
+    """Yield products page by page for every search query."""
+    for query in search_queries:
+        print(f"\n--- Scraping for query: '{query}' ---")
+        
+        pages = iter_pages(partial(scrape_page, query), range(1, MAX_PAGES + 1),
+                           concurrency=CONCURRENCY, is_empty=lambda result: result is None)
+        for page, page_products in pages:
+            yield from page_products
+
+
+def reextract_products():
+    """Re-run parse_products over the archived result pages."""
+    for url, page_products in reextract(default_archive_path('amazon'), parse_products,
+                                        url_filter=lambda url: '/s?' in url):
+        yield from page_products or []
+
+
+def save_products(products, output_path=None):
+    """Stream products into the output file (.csv, .jsonl or .parquet) as they are scraped."""
+    fieldnames = ['Name', 'Price', 'Rating']
+    
+    if output_path is None:
+        # Get project root (go up from scrapers/ecommerce/)
+        project_root = Path(__file__).parent.parent.parent
+        output_path = project_root / 'output' / 'Amazon.csv'
+    
+    with open_sink(output_path, fieldnames=fieldnames) as sink:
+        sink.write_many(products)
+        
+    if sink.count:
+        print(f"\nSuccessfully saved {sink.count} total products to {output_path}")
+    else:
+        print("\nNo products were scraped. Amazon may have changed its HTML or blocked the request.")
+
+
+def main():
+    """Scrape the search queries, or re-extract them from the archive with --reextract."""
+    parser = argparse.ArgumentParser(description="Scrape Amazon.in search results")
+    parser.add_argument('--reextract', action='store_true',
+                        help="re-parse archived result pages instead of crawling again")
+    parser.add_argument('-o', '--output',
+                        help="output file; .csv, .jsonl or .parquet (default: output/Amazon.csv)")
+    args = parser.parse_args()
+
+    if args.reextract:
+        save_products(reextract_products(), args.output)
+    else:
+        enable_archive(default_archive_path('amazon'))  # keep raw pages for re-parsing after selector changes
+        save_products(scrape_products(), args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,32 +1,36 @@
-import requests
+import argparse
+import sys
 from bs4 import BeautifulSoup
 import csv
-import time
-import os
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from scrapers.utils.archive import default_archive_path, reextract
+from scrapers.utils.http import enable_archive, fetch
+from scrapers.utils.pagination import iter_pages
+from scrapers.utils.ratelimit import set_rate
+
+set_rate('www.flipkart.com', rate=1.0)  # one request per second
+
 BASE_URL = 'https://www.flipkart.com/search?q=smartphones'
 
 headers = {
-    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+    'User-Agent': ('Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+                   '(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36')
 }
 
-products = []
+MAX_PAGES = 41
+CONCURRENCY = 4  # pages in flight; the rate limiter still paces the host
 
-for page in range(1, 42): 
-    print(f"Scraping page {page}...")
-    
-    url = f"{BASE_URL}&page={page}"
-    
-    response = requests.get(url, headers=headers)
-    soup = BeautifulSoup(response.text, 'lxml')
 
+def parse_products(soup):
+    """Extract products from a parsed result page. Returns None if it has no product cards."""
     containers = soup.find_all('div', class_='cPHDOP') 
 
     if not containers:
-        print(f"No more products found at page {page} (or selectors are broken). Stopping.")
-        break
+        return None
 
+    page_products = []
     for container in containers:
         product_data = {}
 
@@ -53,24 +57,79 @@ for page in range(1, 42):
             product_data['Description'] = None
         
         if product_data['Name']: 
-            products.append(product_data)
-            
-    time.sleep(1)
+            page_products.append(product_data)
+    return page_products
+
 
-if products:
-    fieldnames = ['Name', 'Price', 'Rating', 'Description']
+def scrape_page(page):
+    """Scrape one result page. Returns None when no product cards are found."""
+    print(f"Scraping page {page}...")
     
-    # Get project root (go up from scrapers/ecommerce/)
-    project_root = Path(__file__).parent.parent.parent
-    output_dir = project_root / 'output'
-    output_dir.mkdir(exist_ok=True)
-    csv_path = output_dir / 'flipkart_latest_smartphones.csv' 
+    url = f"{BASE_URL}&page={page}"
     
-    with open(csv_path, 'w', encoding="utf-8", newline='') as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(products)
+    response = fetch(url, headers=headers)
+    soup = BeautifulSoup(response.text, 'lxml')
+
+    page_products = parse_products(soup)
+
+    if page_products is None:
+        print(f"No more products found at page {page} (or selectors are broken). Stopping.")
+    return page_products
+
+
+def scrape_products():
+    """Crawl the search result pages until one has no product cards."""
+    products = []
+
+    for page, page_products in iter_pages(scrape_page, range(1, MAX_PAGES + 1), concurrency=CONCURRENCY,
+                                          is_empty=lambda result: result is None):
+        products.extend(page_products)
+    return products
+
+
+def reextract_products():
+    """Re-run parse_products over the archived search pages."""
+    products = []
+    for url, page_products in reextract(default_archive_path('flipkart'), parse_products,
+                                        url_filter=lambda url: url.startswith(BASE_URL)):
+        products.extend(page_products or [])
+    return products
+
+
+def save_products(products):
+    """Write products to output/flipkart_latest_smartphones.csv."""
+    if products:
+        fieldnames = ['Name', 'Price', 'Rating', 'Description']
         
-    print(f"\nSuccessfully saved {len(products)} products to {csv_path}")
-else:
-    print("\nNo products were scraped. The selectors may need updating again.")
+        # Get project root (go up from scrapers/ecommerce/)
+        project_root = Path(__file__).parent.parent.parent
+        output_dir = project_root / 'output'
+        output_dir.mkdir(exist_ok=True)
+        csv_path = output_dir / 'flipkart_latest_smartphones.csv' 
+        
+        with open(csv_path, 'w', encoding="utf-8", newline='') as csvfile:
+            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(products)
+            
+        print(f"\nSuccessfully saved {len(products)} products to {csv_path}")
+    else:
+        print("\nNo products were scraped. The selectors may need updating again.")
+
+
+def main():
+    """Scrape the smartphone listing, or re-extract it from the archive with --reextract."""
+    parser = argparse.ArgumentParser(description="Scrape Flipkart smartphone listings")
+    parser.add_argument('--reextract', action='store_true',
+                        help="re-parse archived search pages instead of crawling again")
+    args = parser.parse_args()
+
+    if args.reextract:
+        save_products(reextract_products())
+    else:
+        enable_archive(default_archive_path('flipkart'))  # keep raw pages for re-parsing after selector changes
+        save_products(scrape_products())
+
+
+if __name__ == "__main__":
+    main()
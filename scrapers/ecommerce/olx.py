@@ -1,19 +1,24 @@
+import argparse
 import requests
-import csv
 import time
-import os
 import random
+import sys
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from scrapers.utils.archive import default_archive_path, reextract
+from scrapers.utils.http import enable_archive, fetch
+from scrapers.utils.ratelimit import set_rate
+from scrapers.utils.sinks import open_sink
+
 # Get project root (go up from scrapers/ecommerce/)
 project_root = Path(__file__).parent.parent.parent
 OUTPUT_DIR = project_root / "output"
 OUTPUT_DIR.mkdir(exist_ok=True)
 OUTPUT_CSV = OUTPUT_DIR / "olx_listings.csv"
 
-SESSION = requests.Session()
-
 BASE_API = "https://www.olx.in/api/relevance/v4/search"
 
 CATEGORIES = {
@@ -23,9 +28,15 @@ CATEGORIES = {
 
 LIMIT = 40                      
 DESIRED_ROWS = 180 * 10        
-DELAY_BETWEEN_REQUESTS = (1.0, 2.5)
+CATEGORY_QUOTA = DESIRED_ROWS // len(CATEGORIES)   # starting share per category; unused shares move to the others
+SHARDS = 3                    # offset windows of one category in flight at once
+MAX_FAILED_BATCHES = 3        # consecutive failed batches before a category is given up
+REQUESTS_PER_SECOND = 0.6     # about one request every 1.7s
+BURST = 2
 REQUEST_TIMEOUT = 25
 
+set_rate("www.olx.in", rate=REQUESTS_PER_SECOND, burst=BURST)
+
 HEADERS = {
     "User-Agent": "OLX-Android-App/14.2.1 (Android 13)",
     "Accept": "application/json, text/plain, */*",
@@ -44,7 +55,7 @@ def fetch_batch(category_id, offset, retries=3):
     backoff = 1.0
     for attempt in range(1, retries + 1):
         try:
-            resp = SESSION.get(BASE_API, headers=HEADERS, params=params, timeout=REQUEST_TIMEOUT)
+            resp = fetch(BASE_API, headers=HEADERS, params=params, timeout=REQUEST_TIMEOUT)
             resp.raise_for_status()
             return resp.json()
         except requests.RequestException as e:
@@ -105,53 +116,170 @@ def extract_items_from_json(j):
         })
     return out
 
-def save_csv(rows):
-    if not rows:
+def ad_key(entry):
+    """Stable id of one search result, used to drop ads seen at more than one offset."""
+    ad = entry.get("ad") or entry.get("attributes") or entry
+    if not isinstance(ad, dict):
+        return None
+    key = ad.get("ad_id") or ad.get("id") or ad.get("url") or ad.get("slug")
+    return str(key) if key else None
+
+def new_items(j, seen, limit=None):
+    """Rows of at most limit ads in a batch that are not in seen.
+
+    Only the ads returned are added to seen, so ads cut off by the limit can
+    still be collected from a later batch.
+    """
+    rows = []
+    data = j.get("data", []) if isinstance(j, dict) else []
+    for entry in data:
+        if limit is not None and len(rows) >= limit:
+            break
+        key = ad_key(entry) if isinstance(entry, dict) else None
+        if key is not None:
+            if key in seen:
+                continue
+            seen.add(key)
+        rows.extend(extract_items_from_json({"data": [entry]}))
+    return rows
+
+def save_csv(rows, output=OUTPUT_CSV):
+    """Stream rows into the output file (.csv, .jsonl or .parquet) as they arrive."""
+    with open_sink(output) as sink:
+        sink.write_many(rows)
+    if not sink.count:
         print("No rows to save.")
         return
-    keys = list(rows[0].keys())
-    with open(str(OUTPUT_CSV), "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=keys)
-        writer.writeheader()
-        writer.writerows(rows)
-    print(f"\n✅ Saved {len(rows)} listings to {OUTPUT_CSV} at {datetime.now().isoformat()}")
+    print(f"\n✅ Saved {sink.count} listings to {output} at {datetime.now().isoformat()}")
 
-def main():
-    print("🔎 Starting OLX bikes, mobiles, and laptops scraper...")
-    all_rows = []
-
-    for category_name, cat_id in CATEGORIES.items():
-        print(f"\n🚀 Scraping category: {category_name} (cat_id={cat_id})")
-        batch_idx = 0
-        while len(all_rows) < DESIRED_ROWS:
-            offset = batch_idx * LIMIT
-            print(f"→ Fetching offset {offset} ...")
-            j = fetch_batch(cat_id, offset)
-            if not j:
-                print("   (skipped batch due to fetch failures)")
-                time.sleep(2 + random.uniform(0.5, 1.5))
-                batch_idx += 1
-                continue
+def reextract_rows():
+    """Re-run extract_items_from_json over the archived API responses."""
+    archive_path = default_archive_path("olx")
+    print(f"🔁 Re-extracting listings from {archive_path}")
+    for _, items in reextract(archive_path, extract_items_from_json, decode="json",
+                              url_filter=lambda url: url.startswith(BASE_API)):
+        yield from items
 
-            items = extract_items_from_json(j)
-            if not items:
-                print("   No items returned — stopping this category.")
-                break
+class CategoryShard:
+    """Crawl state of one category: next offset, batches in flight, rows still wanted."""
 
-            all_rows.extend(items)
-            print(f"   Got {len(items)} items; total so far: {len(all_rows)}")
+    def __init__(self, name, cat_id, quota):
+        self.name = name
+        self.cat_id = cat_id
+        self.remaining = quota
+        self.collected = 0
+        self.next_offset = 0
+        self.in_flight = 0
+        self.failures = 0
+        self.end_offset = None   # first offset that came back empty
 
-            if len(all_rows) >= DESIRED_ROWS:
-                print(f"   Reached {DESIRED_ROWS} items; stopping.")
-                break
+    @property
+    def exhausted(self):
+        """True once the category has no more listings to give (or keeps failing)."""
+        if self.failures >= MAX_FAILED_BATCHES:
+            return True
+        return self.end_offset is not None and self.next_offset >= self.end_offset
 
-            batch_idx += 1
-            time.sleep(random.uniform(*DELAY_BETWEEN_REQUESTS))
+    def can_start(self, shards):
+        """True if another offset window of this category may be fetched now."""
+        return self.remaining > 0 and self.in_flight < shards and not self.exhausted
 
-        if len(all_rows) >= DESIRED_ROWS:
-            break
+def hand_over_quota(state, states):
+    """Split the unused quota of an exhausted category evenly among the categories still open."""
+    if state.remaining <= 0 or state.in_flight or not state.exhausted:
+        return
+    open_states = [other for other in states if not other.exhausted]
+    leftover, state.remaining = state.remaining, 0
+    if not open_states:
+        return
+    share, extra = divmod(leftover, len(open_states))
+    for i, other in enumerate(open_states):
+        other.remaining += share + (1 if i < extra else 0)
+    print(f"   [{state.name}] ran out; its {leftover} unused listings go to "
+          f"{', '.join(other.name for other in open_states)}")
+
+def crawl_rows(categories=None, quota=CATEGORY_QUOTA, shards=SHARDS):
+    """Yield listings of all categories at once, starting from quota rows per category.
+
+    Every category keeps up to ``shards`` offset windows in flight; all of them
+    share the www.olx.in rate limiter and fetch_batch's retry/backoff. A
+    category that runs out before its quota hands the rest to the categories
+    still open, so the run still aims for quota * len(categories) rows. Ads
+    that show up at more than one offset (the listing shifts while it is
+    crawled) are yielded once.
+    """
+    categories = categories or CATEGORIES
+    states = [CategoryShard(name, cat_id, quota) for name, cat_id in categories.items()]
+    seen = set()   # ad ids already yielded
+    print(f"🚀 Scraping {len(states)} categories, {quota} listings each, {shards} offsets at a time per category")
+
+    with ThreadPoolExecutor(max_workers=max(1, shards * len(states))) as pool:
+        in_flight = {}   # future -> (state, offset)
+
+        def start_more():
+            """Submit batches until every open category has ``shards`` in flight."""
+            started = True
+            while started:          # round robin, so no category runs ahead of the others
+                started = False
+                for state in states:
+                    if state.can_start(shards):
+                        offset = state.next_offset
+                        state.next_offset += LIMIT
+                        state.in_flight += 1
+                        in_flight[pool.submit(fetch_batch, state.cat_id, offset)] = (state, offset)
+                        started = True
 
-    save_csv(all_rows[:DESIRED_ROWS])
+        start_more()
+        while in_flight:
+            finished, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+            for future in finished:
+                state, offset = in_flight.pop(future)
+                state.in_flight -= 1
+                j = future.result()
+                if not j:
+                    state.failures += 1
+                    print(f"   [{state.name}] offset {offset} skipped after retries ({state.failures} in a row)")
+                elif not (j.get("data") if isinstance(j, dict) else None):
+                    state.failures = 0
+                    if state.end_offset is None or offset < state.end_offset:
+                        state.end_offset = offset
+                    print(f"   [{state.name}] no items at offset {offset} — end of category.")
+                elif state.remaining > 0:
+                    state.failures = 0
+                    items = new_items(j, seen, limit=state.remaining)
+                    state.remaining -= len(items)
+                    state.collected += len(items)
+                    yield from items
+                    print(f"   [{state.name}] offset {offset}: {len(items)} new items; {state.remaining} still wanted")
+                    if state.remaining <= 0:
+                        print(f"   [{state.name}] reached its quota.")
+                for other in states:
+                    hand_over_quota(other, states)
+            start_more()
+
+    for state in states:
+        print(f"   {state.name}: {state.collected} listings")
+
+def main():
+    """Crawl the OLX categories, or re-extract them from the archive with --reextract."""
+    parser = argparse.ArgumentParser(description="Scrape OLX listings")
+    parser.add_argument("--reextract", action="store_true",
+                        help="re-parse archived API responses instead of crawling again")
+    parser.add_argument("-o", "--output", default=str(OUTPUT_CSV),
+                        help="output file; .csv, .jsonl or .parquet (default: %(default)s)")
+    parser.add_argument("--per-category", type=int, default=CATEGORY_QUOTA,
+                        help="listings wanted from each category; a category that runs out "
+                             "passes the rest on (default: %(default)s)")
+    parser.add_argument("--shards", type=int, default=SHARDS,
+                        help="offset windows crawled at once per category (default: %(default)s)")
+    args = parser.parse_args()
+    if args.reextract:
+        save_csv(reextract_rows(), args.output)
+        return
+
+    print("🔎 Starting OLX bikes, mobiles, and laptops scraper...")
+    enable_archive(default_archive_path("olx"))
+    save_csv(crawl_rows(quota=args.per_category, shards=args.shards), args.output)
 
 if __name__ == "__main__":
     main()
@@ -1,2 +1,14 @@
 """Educational website scrapers."""
 
+from scrapers.registry import register
+
+register("college_notice_scraper", "educational", "scrapers.educational.college_notice_scraper:main",
+         "rcciit.org", "RCCIIT notice board", unattended=False)
+register("indiabix_networking", "educational", "scrapers.educational.indiabix_networking:main",
+         "indiabix.com", "IndiaBix networking questions")
+register("javaguide", "educational", "scrapers.educational.javaguide:main", "javaguides.net",
+         "Java Guides quiz questions")
+register("sanfoundry", "educational", "scrapers.educational.sanfoundry:main", "sanfoundry.com",
+         "Sanfoundry MCQs")
+register("udemy", "educational", "scrapers.educational.udemy:main", "udemy.com",
+         "Udemy course listings")
@@ -1,17 +1,23 @@
 import csv
-import requests
-from bs4 import BeautifulSoup
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from scrapers.utils.http import fetch
+from scrapers.utils.pagination import iter_pages
+from scrapers.utils.parsing import parse_html
 
 # Base URL for all pages
 BASE_URL = "https://www.indiabix.com/networking/networking-basics/"
 OUTPUT_FILE = 'output/indiabix_networking_data.csv'
 TOTAL_PAGES = 7  # known from site pagination
+CONCURRENCY = 4  # pages fetched at once
 
 def scrape_page(url):
     print(f"Fetching: {url}")
-    response = requests.get(url)
+    response = fetch(url)
     response.raise_for_status()
-    soup = BeautifulSoup(response.text, 'html.parser')
+    soup = parse_html(response.text, only='div.bix-div-container')  # Question blocks only
 
     questions = soup.find_all('div', class_='bix-div-container')
     data = []
@@ -42,12 +48,14 @@ def scrape_page(url):
         })
     return data
 
+def page_url(i):
+    return BASE_URL if i == 1 else f"{BASE_URL}00100{i}"
+
 def scrape_all_pages(output_csv):
     all_data = []
 
-    for i in range(1, TOTAL_PAGES + 1):
-        url = BASE_URL if i == 1 else f"{BASE_URL}00100{i}"
-        page_data = scrape_page(url)
+    urls = [page_url(i) for i in range(1, TOTAL_PAGES + 1)]
+    for url, page_data in iter_pages(scrape_page, urls, concurrency=CONCURRENCY):
         all_data.extend(page_data)
 
     # Write all data to CSV
@@ -59,5 +67,8 @@ def scrape_all_pages(output_csv):
 
     print(f"✅ Scraped {len(all_data)} questions from {TOTAL_PAGES} pages into '{output_csv}'.")
 
-if __name__ == '__main__':
+def main():
     scrape_all_pages(OUTPUT_FILE)
+
+if __name__ == '__main__':
+    main()
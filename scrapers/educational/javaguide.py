@@ -1,16 +1,22 @@
+import sys
+from pathlib import Path
 import requests
-from bs4 import BeautifulSoup
-import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from scrapers.utils.http import fetch
+from scrapers.utils.parsing import parse_html
 
 def extract_quiz_data(url):
+    import pandas as pd
+
     try:
-        response = requests.get(url)
+        response = fetch(url)
         response.raise_for_status()  # Raise an exception for HTTP errors (4xx or 5xx)
     except requests.exceptions.RequestException as e:
         print(f"Error fetching the URL: {e}")
         return None
 
-    soup = BeautifulSoup(response.text, 'html.parser')
+    soup = parse_html(response.text)  # Whole page: questions are walked sibling by sibling
 
     quiz_data = []
 
@@ -68,16 +74,22 @@ def extract_quiz_data(url):
     df = pd.DataFrame(quiz_data)
     return df
 
-# URL of the quiz page
-url = "https://www.javaguides.net/2023/01/spring-boot-quiz-multiple-choice-questions.html"
 
-# Extract data
-quiz_df = extract_quiz_data(url)
+def main():
+    # URL of the quiz page
+    url = "https://www.javaguides.net/2023/01/spring-boot-quiz-multiple-choice-questions.html"
+
+    # Extract data
+    quiz_df = extract_quiz_data(url)
+
+    if quiz_df is not None:
+        # Save to CSV
+        csv_filename = "output/javaguide.csv"
+        quiz_df.to_csv(csv_filename, index=False)
+        print(f"Successfully extracted {len(quiz_df)} questions and saved to {csv_filename}")
+    else:
+        print("Failed to extract quiz data.")
+
 
-if quiz_df is not None:
-    # Save to CSV
-    csv_filename = "output/javaguide.csv"
-    quiz_df.to_csv(csv_filename, index=False)
-    print(f"Successfully extracted {len(quiz_df)} questions and saved to {csv_filename}")
-else:
-    print("Failed to extract quiz data.")
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -1,19 +1,29 @@
-import requests
+import sys
+from pathlib import Path
 from bs4 import BeautifulSoup
-f = open("sanfoundry.csv","w")
-url = "https://www.sanfoundry.com/java-questions-answers-data-type-enums/"
-w =0 
-while True:
-	r = requests.get(url)
-	soup = BeautifulSoup(r.content)
-	g_data = soup.find_all("div",{"class":"entry-content"})
-	for i in g_data:
-		f.write(i.text)
-	w+=1
-	print(w)
-	url_ = soup.find(rel='next')
-	print(url)
-	url = url_.get("href")
-	if url == None:
-		break
-print("success") 
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from scrapers.utils.http import fetch
+
+def main():
+	f = open("sanfoundry.csv","w")
+	url = "https://www.sanfoundry.com/java-questions-answers-data-type-enums/"
+	w =0 
+	while True:
+		r = fetch(url)
+		soup = BeautifulSoup(r.content)
+		g_data = soup.find_all("div",{"class":"entry-content"})
+		for i in g_data:
+			f.write(i.text)
+		w+=1
+		print(w)
+		url_ = soup.find(rel='next')
+		print(url)
+		url = url_.get("href")
+		if url == None:
+			break
+	print("success") 
+
+
+if __name__ == "__main__":
+	main()
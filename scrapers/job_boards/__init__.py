@@ -1,2 +1,16 @@
 """Job board website scrapers."""
 
+from scrapers.registry import register
+
+register("apnajob", "job_boards", "scrapers.job_boards.apnajob:main", "apna.co",
+         "Apna fresher jobs (Playwright)")
+register("craigslist_jobs", "job_boards", "scrapers.job_boards.craigslist_jobs:main", "craigslist.org",
+         "Craigslist job posts")
+register("indeed", "job_boards", "scrapers.job_boards.indeed:scrape_indeed_jobs", "indeed.com",
+         "Indeed job search (Selenium)")
+register("jobhai", "job_boards", "scrapers.job_boards.jobhai:main", "jobhai.com",
+         "JobHai driver jobs (Playwright)")
+register("naukri_jobs", "job_boards", "scrapers.job_boards.naukri_jobs:main", "naukri.com",
+         "Naukri job listings (Playwright)")
+register("welcome_to_the_jungle", "job_boards", "scrapers.job_boards.welcome_to_the_jungle:main",
+         "welcometothejungle.com", "Welcome to the Jungle jobs (Selenium)")
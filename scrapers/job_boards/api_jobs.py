@@ -0,0 +1,159 @@
+"""Map job records from the Apna and JobHai listing APIs to rows.
+
+Neither site documents its API. Only responses of job listing/search
+endpoints are captured (is_listing_api), so recommendation, filter and
+navigation calls never reach the mapper. Within those, records are located by
+shape (any JSON object with a title and a company-like key, see find_records)
+and each field is read from a list of candidate paths. Records that do not
+map to at least a title yield no row; a page whose responses map to nothing
+is parsed from the DOM by the scraper instead.
+"""
+
+import re
+from urllib.parse import urlsplit
+
+from scrapers.utils.capture import find_records, pick
+
+TITLE_PATHS = ('title', 'jobTitle', 'job_title', 'designation', 'jobRole', 'job_role')
+COMPANY_PATHS = ('companyName', 'company_name', 'organization.name', 'organisation.name', 'company.name',
+                 'org_name', 'orgName', 'employerName', 'company')
+SALARY_PATHS = ('salaryText', 'salary_text', 'salaryLabel', 'salary', 'salaryRange', 'salary_range')
+MIN_SALARY_PATHS = ('minSalary', 'min_salary', 'salary.min', 'salary.minimum')
+MAX_SALARY_PATHS = ('maxSalary', 'max_salary', 'salary.max', 'salary.maximum')
+LOCATION_PATHS = ('locationText', 'location_text', 'location', 'locations', 'city', 'cityName', 'city_name',
+                  'address.city', 'locality', 'area')
+EXPERIENCE_PATHS = ('experienceText', 'experience_text', 'experience', 'experienceLabel')
+MIN_EXPERIENCE_PATHS = ('minExperience', 'min_experience', 'experience.min')
+MAX_EXPERIENCE_PATHS = ('maxExperience', 'max_experience', 'experience.max')
+URL_PATHS = ('jobUrl', 'job_url', 'jdURL', 'publicUrl', 'public_url', 'shareUrl', 'share_url', 'url')
+
+# API paths that list or search jobs, and the ones that carry other payloads on the same hosts
+LISTING_PATH = re.compile(r'/(jobs?|search|job-?feed|listings?)(/|$|[-_.]?(search|list|feed))', re.I)
+NON_LISTING_PATH = re.compile(r'recommend|similar|suggest|autocomplete|filter|facet|nav|menu|config|'
+                              r'banner|category|categories|count', re.I)
+
+# Keys that mark an object as a job record: a title and something employer- or pay-like
+RECORD_KEYS = tuple({path.split('.')[0] for path in TITLE_PATHS})
+DETAIL_KEYS = tuple({path.split('.')[0] for path in COMPANY_PATHS + SALARY_PATHS + MIN_SALARY_PATHS})
+
+
+def is_listing_api(url, domain):
+    """
+    Check whether a response URL is a job listing/search call on a site's own backends.
+
+    Args:
+        url: Response URL
+        domain: Site domain, e.g. 'apna.co'; subdomains match too
+
+    Returns:
+        True for listing endpoints, False for other APIs and other hosts
+    """
+    parts = urlsplit(url)
+    host = (parts.hostname or '').lower()
+    if host != domain and not host.endswith('.' + domain):
+        return False
+    return bool(LISTING_PATH.search(parts.path)) and not NON_LISTING_PATH.search(parts.path)
+
+
+def _text(value):
+    """Flatten a picked value (string, number, {'name': ...} or list of those) to display text"""
+    if isinstance(value, dict):
+        value = pick(value, 'name', 'label', 'text', 'title', 'city')
+    if isinstance(value, list):
+        value = ', '.join(filter(None, (_text(item) for item in value)))
+    if value is None or value == '':
+        return None
+    return str(value).strip()
+
+
+def _money(value):
+    try:
+        return f"₹{int(float(value)):,}"
+    except (TypeError, ValueError):
+        return _text(value)
+
+
+def _salary(record):
+    value = pick(record, *SALARY_PATHS)
+    if value is not None and not isinstance(value, (dict, int, float)):
+        return _text(value)
+    low = pick(record, *MIN_SALARY_PATHS)
+    high = pick(record, *MAX_SALARY_PATHS)
+    if low is None and high is None:
+        return _money(value) if isinstance(value, (int, float)) else None
+    if low is not None and high is not None and low != high:
+        return f"{_money(low)} - {_money(high)}"
+    return _money(low if low is not None else high)
+
+
+def _experience(record):
+    value = pick(record, *EXPERIENCE_PATHS)
+    if value is not None and not isinstance(value, (dict, int, float)):
+        return _text(value)
+    low = pick(record, *MIN_EXPERIENCE_PATHS)
+    high = pick(record, *MAX_EXPERIENCE_PATHS)
+    if low is None and high is None:
+        low = value if isinstance(value, (int, float)) else None
+    if low is None and high is None:
+        return None
+    if not low and not high:
+        return 'Fresher'
+    if low is not None and high is not None and low != high:
+        return f"{low}-{high} years"
+    return f"{low if low is not None else high} years"
+
+
+def _job_url(record, base_url):
+    url = _text(pick(record, *URL_PATHS))
+    if not url:
+        return None
+    if url.startswith('http'):
+        return url
+    return f"{base_url.rstrip('/')}/{url.lstrip('/')}"
+
+
+def job_from_record(record, base_url):
+    """
+    Map one API job record to a row.
+
+    Args:
+        record: JSON object describing one job
+        base_url: Site root used to absolutize relative job links
+
+    Returns:
+        Row dict with 'Job Title', 'Company Name', 'Experience', 'Salary',
+        'Location' and 'URL', or None if the record has no title
+    """
+    title = _text(pick(record, *TITLE_PATHS))
+    if not title:
+        return None
+    return {
+        'Job Title': title,
+        'Company Name': _text(pick(record, *COMPANY_PATHS)) or 'N/A',
+        'Experience': _experience(record) or 'N/A',
+        'Salary': _salary(record) or 'N/A',
+        'Location': _text(pick(record, *LOCATION_PATHS)) or 'N/A',
+        'URL': _job_url(record, base_url) or 'N/A',
+    }
+
+
+def jobs_from_payloads(payloads, base_url):
+    """
+    Map every job record found in captured API responses to rows.
+
+    Args:
+        payloads: Decoded JSON responses, e.g. from JsonCapture.payloads()
+        base_url: Site root used to absolutize relative job links
+
+    Returns:
+        List of row dicts in response order
+    """
+    rows = []
+    for payload in payloads:
+        for record in find_records(payload, RECORD_KEYS + DETAIL_KEYS):
+            if not any(key in record for key in RECORD_KEYS):
+                continue
+            row = job_from_record(record, base_url)
+            if row:
+                rows.append(row)
+    return rows
@@ -1,84 +1,175 @@
-from playwright.sync_api import sync_playwright
-from bs4 import BeautifulSoup
-import csv, re, time, random
-
-def classify_detail(text):
-    """Classify text as experience, salary, or location"""
-    t = text.strip()
-    if not t:
+import argparse
+import re, time, random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from scrapers.utils.blocking import block_resources
+from scrapers.utils.browser import scroll_until_loaded
+from scrapers.utils.capture import JsonCapture
+from scrapers.utils.checkpoint import Checkpoint, default_checkpoint_path
+from scrapers.utils.extract import attr, extract_cards, text, texts
+from scrapers.utils.parsing import parse_html
+from scrapers.utils.sinks import open_sink
+from scrapers.job_boards.api_jobs import is_listing_api, jobs_from_payloads
+from scrapers.job_boards.job_details import job_details_from_text, job_details_many, walk_card
+
+APNA_BASE_URL = "https://apna.co"
+
+# Elements counted while scrolling; the CSS form of the card filter used on the parsed page
+CARD_SELECTOR = ", ".join(f'{tag}[class*="{word}" i]' for tag in ('div', 'article', 'li')
+                          for word in ('job', 'card', 'item', 'listing', 'post'))
+
+# Fields read in the page for each card; the CSS forms of the lookups in job_details.walk_card
+CARD_FIELDS = {
+    'title': text(", ".join(f'{tag}[class*="{word}" i]' for tag in ('h2', 'h3', 'a') for word in ('title', 'heading'))),
+    'heading': text('h2, h3'),
+    'company': text(", ".join(f'{tag}[class*="{word}" i]' for tag in ('span', 'div', 'p')
+                              for word in ('company', 'employer'))),
+    'text': text(),
+    'details': texts('li, span, div, p', max_len=150),
+    'link': attr('a[href]', 'href'),
+}
+
+def is_apna_api(url):
+    """Job listing/search calls to Apna's own backends, not its recommendation or filter APIs"""
+    return is_listing_api(url, "apna.co")
+
+def job_row(details, href):
+    """Row from extracted job details and the card's first link; None for navigation blocks"""
+    title, company, salary, location, experience = details
+    if title == 'N/A' and company == 'N/A':   # navigation blocks, not jobs
         return None
-    if re.search(r'₹[\d,]+', t) or re.search(r'\b(lakh|per month|monthly)\b', t, re.I):
-        return ('salary', t)
-    if re.search(r'\b(fresher|experience|exp)\b', t, re.I) or re.search(r'\b\d+(\+|-)?\s*(yrs?|years?|months?)\b', t, re.I):
-        return ('experience', t)
-    if re.search(r'\b(Bangalore|Mumbai|Delhi|Kolkata|Chennai|Hyderabad|Pune|Ahmedabad)\b', t, re.I):
-        return ('location', t)
-    if len(t) <= 50 and not re.search(r'₹|\d+', t):
-        return ('location', t)
-    return None
+    
+    job_url = 'N/A'        # Find job URL
+    if href:
+        if href.startswith('/'):
+            job_url = f"{APNA_BASE_URL}{href}"
+        elif href.startswith('http'):
+            job_url = href
+    
+    return {'Job Title': title, 'Company Name': company, 'Experience': experience, 'Salary': salary,
+            'Location': location, 'URL': job_url}
+
+def read_listing(page):
+    """Rows from the job cards of the rendered listing, read with one in-page call.
+    Returns None when fewer than 5 cards match, so the caller can run the wider parse_listing search."""
+    cards = extract_cards(page, CARD_SELECTOR, CARD_FIELDS)
+    if len(cards) < 5:
+        return None
+    cards = [card for card in cards if len(card['text']) >= 20]
+    details = job_details_many((card['title'] or card['heading'], card['company'], card['text'], card['details'])
+                               for card in cards)
+    rows = []
+    for card, card_details in zip(cards, details):
+        row = job_row(card_details, card['link'])
+        if row:
+            rows.append(row)
+    return rows
 
-def extract_job_details(job_card):
-    title = company = salary = location = experience = 'N/A'    
-    title_elem = job_card.find(['h2', 'h3', 'a'], class_=re.compile(r'title|heading|job-title', re.I))
-    if not title_elem:
-        title_elem = job_card.find(['h2', 'h3'])
-    if title_elem:
-        title = title_elem.get_text(strip=True)
-    company_elem = job_card.find(['span', 'div', 'p'], class_=re.compile(r'company|employer', re.I))
-    if company_elem:
-        company = company_elem.get_text(strip=True)
-    all_text = job_card.get_text(" ", strip=True)  
-    salary_match = re.search(r'₹[\d,]+(?:\s*[-–]\s*₹?[\d,]+)?(?:\s*(?:per month|monthly|lakh|LPA))?', all_text, re.I)
-    if salary_match:
-        salary = salary_match.group(0)
-    location_match = re.search(r'\b(Bangalore|Mumbai|Delhi|Kolkata|Chennai|Hyderabad|Pune|Ahmedabad|NCR|Gurgaon|Noida)\b', all_text, re.I)
-    if location_match:
-        location = location_match.group(0)
-    exp_match = re.search(r'(\d+(\.\d+)?(\+|-)?\s*(yrs?|years?|months?)|fresher|no experience)', all_text, re.I)
-    if exp_match:
-        experience = exp_match.group(0)
+def parse_listing(html):
+    """DOM fallback: rows from the job cards of a rendered listing page"""
+    soup = parse_html(html)
+    container = soup.select_one("body")     # Find job cards
+    job_cards = container.find_all(['div', 'article', 'li'],
+        class_=re.compile(r'job|card|item|listing|post', re.I))
     
-    for elem in job_card.find_all(['li', 'span', 'div', 'p'], recursive=True):
-        txt = elem.get_text(" ", strip=True)
-        if not txt or len(txt) > 150:
-            continue
-        
-        classified = classify_detail(txt)
-        if classified:
-            kind, val = classified
-            if kind == 'salary' and salary == 'N/A':
-                salary = val
-            elif kind == 'location' and location == 'N/A':
-                location = val
-            elif kind == 'experience' and experience == 'N/A':
-                experience = val
+    if len(job_cards) < 5:
+        job_cards = [
+            div for div in container.find_all('div', recursive=True)
+            if div.find(['h2', 'h3', 'a']) and (
+                '₹' in div.get_text() or 
+                re.search(r'\b(experience|fresher)\b', div.get_text(), re.I)
+            )
+        ]
     
-    return title, company, salary, location, experience
+    rows = []
+    for card in job_cards:
+        try:
+            card_text = walk_card(card)     # One pass over the card's strings
+            
+            if len(card_text.all_text) < 20:
+                continue
+            
+            row = job_row(job_details_from_text(*card_text[:4]), card_text.link)
+            if row:
+                rows.append(row)
+        except Exception as e:
+            continue
+    return rows
+
+def find_next_button(page):
+    """Locate the pagination Next button, trying several selectors"""
+    selectors = ["button:has-text('Next')", "a:has-text('Next')", "[aria-label='Next']",
+                 ".pagination button:last-child", "button[class*='next']"]
+    for selector in selectors:
+        try:
+            next_button = page.locator(selector)
+            if next_button.count() > 0:
+                print(f"   ➤ Found Next button with selector: {selector}")
+                return next_button
+        except:
+            continue
+    return None
+
+def skip_to_page(page, target_page):
+    """Click Next until target_page is shown; used on resume when the URL has no page number"""
+    for page_num in range(2, target_page + 1):
+        next_button = find_next_button(page)
+        if not next_button or next_button.is_disabled():
+            return False
+        next_button.click()
+        print(f"   ⏩ Skipped to page {page_num}")
+        time.sleep(random.uniform(2, 3))
+    return True
 
-def scrape_apna_playwright(base_url, max_pages=150, scroll_pause=2, max_scrolls=10):
-    all_jobs_data = []
-    seen_jobs = set()
+def scrape_apna_playwright(base_url, max_pages=150, scroll_pause=2, max_scrolls=10, checkpoint=None, headless=True,
+                           block=True, capture=True):
+    """Crawl Apna listing pages, yielding each new job as a dict as soon as it is parsed.
+    Each page is committed to the checkpoint after Next is clicked, together with the dedup set.
+    With capture set, jobs are mapped from the JSON responses the page loads, and the
+    rendered cards are parsed only when those hold no jobs.
+    With block set, images, fonts, media and trackers are not downloaded."""
+    from playwright.sync_api import sync_playwright
+
+    total_jobs = 0
+    seen_jobs = checkpoint.seen if checkpoint else set()
+    reached_end = False
     
     with sync_playwright() as p:
         browser = p.chromium.launch(
-            headless=False,
-            args=["--disable-blink-features=AutomationControlled","--start-maximized","--disable-dev-shm-usage","--no-sandbox"])
+            headless=headless,
+            args=["--disable-blink-features=AutomationControlled", "--start-maximized", "--disable-dev-shm-usage",
+                  "--no-sandbox"])
         context = browser.new_context(
             user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
                        "AppleWebKit/537.36 (KHTML, like Gecko) "
                        "Chrome/120.0.0.0 Safari/537.36",
             viewport={"width": 1920, "height": 1080}
         )
+        rules = block_resources(context) if block else None
         page = context.new_page()
+        api = JsonCapture(page, is_apna_api) if capture else None
+        api_pages = 0
         print(f"\n🌐 Starting Apna.co scraper")
         print(f"📍 URL: {base_url}")
         failed_pages = 0
         empty_pages = 0
         current_page = 1
+        start_url = base_url
+        if checkpoint and checkpoint.resumed and checkpoint.last_page:
+            current_page = checkpoint.last_page + 1
+            start_url = checkpoint.frontier[0] if checkpoint.frontier else base_url
+            print(f"⏩ Resuming at page {current_page} ({len(seen_jobs)} jobs already seen)")
         
         try:
-            page.goto(base_url, wait_until="domcontentloaded", timeout=60000)
+            page.goto(start_url, wait_until="domcontentloaded", timeout=60000)
             time.sleep(random.uniform(3, 5))
+            if current_page > 1 and start_url == base_url and not skip_to_page(page, current_page):
+                print("⚠️ Could not page forward to the resume point")
+                return
+            if api:
+                api.payloads()     # responses of the pages skipped over
             
             while current_page <= max_pages:
                 print(f"\n{'='*70}")
@@ -87,86 +178,52 @@ def scrape_apna_playwright(base_url, max_pages=150, scroll_pause=2, max_scrolls=
                 
                 try:
                     page.wait_for_selector("body", timeout=10000)
-                    time.sleep(random.uniform(2, 3))   # Scroll to load all content
-                    
-                    for i in range(max_scrolls):
-                        page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                        time.sleep(scroll_pause)     # Scroll to load all content
-                        
-                        if i % 3 == 0:
-                            print(f"   ➤ Scrolling... {i+1}/{max_scrolls}")
                     
-                    html = page.content()     # Get HTML and parse
-                    soup = BeautifulSoup(html, "html.parser")
-                    container = soup.select_one("body")     # Find job cards
-                    job_cards = container.find_all(['div', 'article', 'li'],
-                        class_=re.compile(r'job|card|item|listing|post', re.I))
+                    # Scroll until two scrolls in a row load no new cards (each waits at most scroll_pause)
+                    new_per_scroll = scroll_until_loaded(page, CARD_SELECTOR, max_scrolls=max_scrolls,
+                                                         timeout=scroll_pause)
+                    print(f"   ➤ Scrolled {len(new_per_scroll)}x, new cards per scroll: {new_per_scroll}")
                     
-                    if len(job_cards) < 5:
-                        job_cards = [
-                            div for div in container.find_all('div', recursive=True)
-                            if div.find(['h2', 'h3', 'a']) and (
-                                '₹' in div.get_text() or 
-                                re.search(r'\b(experience|fresher)\b', div.get_text(), re.I)
-                            )
-                        ]
+                    page_rows = jobs_from_payloads(api.payloads(), APNA_BASE_URL) if api else []
+                    if page_rows:
+                        api_pages += 1
+                        print(f"   ➤ {len(page_rows)} jobs from the API responses")
+                    else:
+                        if api:
+                            print("   ⚠️ No jobs in the API responses, parsing the rendered cards")
+                        page_rows = read_listing(page)
+                        if page_rows is None:
+                            page_rows = parse_listing(page.content())
                     
-                    if len(job_cards) == 0:
+                    if len(page_rows) == 0:
                         empty_pages += 1
                         if empty_pages > 3:
                             break
                 
-                    page_jobs_count = 0      # Extract jobs from this page
+                    page_jobs_count = 0      # Keep the jobs not seen yet
                     
-                    for card in job_cards:
-                        try:
-                            card_text = card.get_text(" ", strip=True)
-                            
-                            if len(card_text) < 20:
-                                continue
-                            
-                            title, company, salary, location, experience = extract_job_details(card)
-                            
-                            job_key = f"{title}_{company}_{salary}_{location}_{experience}"
-                            if job_key in seen_jobs:   # Create unique key
-                                continue
-                            seen_jobs.add(job_key)
-                            
-                            job_url = 'N/A'        # Find job URL
-                            link_elem = card.find('a', href=True)
-                            if link_elem:
-                                href = link_elem['href']
-                                if href.startswith('/'):
-                                    job_url = f"https://apna.co{href}"
-                                elif href.startswith('http'):
-                                    job_url = href
-                            
-                            all_jobs_data.append({'Job Title': title,'Company Name': company,'Experience': experience,'Salary': salary,'Location': location,'URL': job_url,'Page Number': current_page})
-                            page_jobs_count += 1
-                            
-                        except Exception as e:
+                    for row in page_rows:
+                        job_key = (f"{row['Job Title']}_{row['Company Name']}_{row['Salary']}_"
+                                   f"{row['Location']}_{row['Experience']}")
+                        if job_key in seen_jobs:   # Create unique key
                             continue
+                        seen_jobs.add(job_key)
+                        
+                        yield {**row, 'Page Number': current_page}
+                        total_jobs += 1
+                        page_jobs_count += 1
                     
                     print(f"✅ Extracted {page_jobs_count} new jobs")
-                    print(f"📊 Total jobs: {len(all_jobs_data)} | Failed: {failed_pages} | Empty: {empty_pages}")
+                    print(f"📊 Total jobs: {total_jobs} | Failed: {failed_pages} | Empty: {empty_pages}")
                 
                     try:      # Click "Next" button to go to next page
-                        next_button = None    # Try multiple selectors for the Next button
-                        selectors = ["button:has-text('Next')","a:has-text('Next')","[aria-label='Next']",".pagination button:last-child","button[class*='next']"]
-                        
-                        for selector in selectors:
-                            try:
-                                next_button = page.locator(selector)
-                                if next_button.count() > 0:
-                                    print(f"   ➤ Found Next button with selector: {selector}")
-                                    break
-                            except:
-                                continue
+                        next_button = find_next_button(page)
                         
-                        if next_button and next_button.count() > 0:
+                        if next_button:
                             is_disabled = next_button.is_disabled()
                             if is_disabled:
                                 print("✅ Reached last page (Next button disabled)")
+                                reached_end = True
                                 break
                             
                             next_button.scroll_into_view_if_needed()   
@@ -175,8 +232,11 @@ def scrape_apna_playwright(base_url, max_pages=150, scroll_pause=2, max_scrolls=
                             print("   ➤ Clicked Next button")
                             
                             time.sleep(random.uniform(3, 5))
+                            if checkpoint:
+                                checkpoint.commit(current_page, frontier=[page.url])
                             current_page += 1
                         else:
+                            reached_end = True
                             break
                             
                     except Exception as e:
@@ -196,24 +256,51 @@ def scrape_apna_playwright(base_url, max_pages=150, scroll_pause=2, max_scrolls=
         
         print(f"\n{'='*70}")
         print(f"🚀 Scraping completed!")
-        print(f"📊 Total jobs collected: {len(all_jobs_data)}")
-      
-    return all_jobs_data
+        print(f"📊 Total jobs collected: {total_jobs}")
+        if api:
+            print(f"📡 {api_pages} pages read from the API responses")
+        if rules:
+            print(f"🛡️ Blocked {rules.blocked} of {rules.blocked + rules.allowed} browser requests")
 
-def save_to_csv(data, filename='apna_jobs.csv'):
-    if not data:
-        print("⚠️ No data to save")
-        return
-    
+    if checkpoint:
+        if reached_end or current_page > max_pages:
+            checkpoint.clear()
+        else:
+            print(f"⚠️ Stopped at page {current_page}; run again with --resume to continue")
+
+def save_to_csv(jobs, filename='apna_jobs.csv', checkpoint=None):
+    """Stream jobs into the file as they are scraped (.csv, .jsonl or .parquet).
+    With a resumed checkpoint the rows are appended to the earlier output."""
     headers = ['Job Title', 'Company Name', 'Experience', 'Salary', 'Location', 'URL', 'Page Number']
     
-    with open(filename, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=headers)
-        writer.writeheader()
-        writer.writerows(data)
+    append = checkpoint.restore_output(filename) if checkpoint else False
+    with open_sink(filename, fieldnames=headers, append=append) as sink:
+        if checkpoint:
+            checkpoint.track(sink)
+        sink.write_many(jobs)
+    if not sink.count:
+        print("⚠️ No data to save")
+        return
     print(f"✅ Data saved to {filename}")
 
-if __name__ == "__main__":
+def main():
+    """Crawl the Apna fresher job listing into a CSV."""
+    parser = argparse.ArgumentParser(description="Scrape Apna fresher jobs")
+    parser.add_argument("--resume", action="store_true",
+                        help="continue an interrupted crawl from its checkpoint")
+    parser.add_argument("--headed", action="store_true", help="show the browser window")
+    parser.add_argument("--no-block", action="store_true",
+                        help="load images, fonts, media and trackers too")
+    parser.add_argument("--dom", action="store_true",
+                        help="parse the rendered job cards instead of the API responses")
+    args = parser.parse_args()
+
     base_url = "https://apna.co/jobs/freshers-jobs?sourcePage=Home+Page"
-    scraped_data = scrape_apna_playwright(base_url=base_url,max_pages=200,scroll_pause=1,max_scrolls=8)
-    save_to_csv(scraped_data, filename='apna_freshers_jobs.csv')
\ No newline at end of file
+    checkpoint = Checkpoint(default_checkpoint_path("apnajob"), resume=args.resume)
+    scraped_data = scrape_apna_playwright(base_url=base_url, max_pages=200, scroll_pause=1, max_scrolls=8,
+                                          checkpoint=checkpoint, headless=not args.headed,
+                                          block=not args.no_block, capture=not args.dom)
+    save_to_csv(scraped_data, filename='apna_freshers_jobs.csv', checkpoint=checkpoint)
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,11 @@
-import requests
 import csv
 import os
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from scrapers.utils.http import fetch
+
 API_URL = "https://sapi.craigslist.org/web/v8/postings/search/full"
 PARAMS = {
     "batch": "86-0-360-0-0",   # 86 = area (Delhi), 0-360 = range (first 360)
@@ -21,37 +24,43 @@ headers = {
                   "(KHTML, like Gecko) Chrome/117.0.0.0 Safari/537.36"
 }
 
-print("Fetching data from API…")
-resp = requests.get(API_URL, params=PARAMS, headers=headers)
-resp.raise_for_status()
-data = resp.json()
 
-items = data.get("data", {}).get("items", [])
-print(f"Found {len(items)} job listings")
+def main():
+    print("Fetching data from API…")
+    resp = fetch(API_URL, params=PARAMS, headers=headers)
+    resp.raise_for_status()
+    data = resp.json()
+
+    items = data.get("data", {}).get("items", [])
+    print(f"Found {len(items)} job listings")
+
+    with open(CSV_FILE, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Title", "Company", "Description", "Link", "ImageURL"])
+
+        for item in items:
+            # Each 'item' is a list, not a dict
+            title = next((x[1] for x in item if isinstance(x, list) and x[0] == 12), "N/A")
+            company = next((x[1] for x in item if isinstance(x, list) and x[0] == 8), "N/A")
+            desc = next((x[1] for x in item if isinstance(x, list) and x[0] == 7), "N/A")
+            slug = next((x[1] for x in item if isinstance(x, list) and x[0] == 6), None)
 
-with open(CSV_FILE, "w", newline="", encoding="utf-8") as f:
-    writer = csv.writer(f)
-    writer.writerow(["Title", "Company", "Description", "Link", "ImageURL"])
+            link = f"https://delhi.craigslist.org/{slug}" if slug else "N/A"
 
-    for item in items:
-        # Each 'item' is a list, not a dict
-        title = next((x[1] for x in item if isinstance(x, list) and x[0] == 12), "N/A")
-        company = next((x[1] for x in item if isinstance(x, list) and x[0] == 8), "N/A")
-        desc = next((x[1] for x in item if isinstance(x, list) and x[0] == 7), "N/A")
-        slug = next((x[1] for x in item if isinstance(x, list) and x[0] == 6), None)
+            # Extract image ID if present
+            img_url = "N/A"
+            for sub in item:
+                if isinstance(sub, list) and sub[0] == 4:
+                    img_parts = sub[1].split("_")
+                    if len(img_parts) > 1:
+                        img_id = img_parts[-1]
+                        img_url = f"https://images.craigslist.org/{img_id}_300x300.jpg"
+                    break
 
-        link = f"https://delhi.craigslist.org/{slug}" if slug else "N/A"
+            writer.writerow([title, company, desc, link, img_url])
 
-        # Extract image ID if present
-        img_url = "N/A"
-        for sub in item:
-            if isinstance(sub, list) and sub[0] == 4:
-                img_parts = sub[1].split("_")
-                if len(img_parts) > 1:
-                    img_id = img_parts[-1]
-                    img_url = f"https://images.craigslist.org/{img_id}_300x300.jpg"
-                break
+    print(f"\n✅ Scraping complete — saved {CSV_FILE}")
 
-        writer.writerow([title, company, desc, link, img_url])
 
-print(f"\n✅ Scraping complete — saved {CSV_FILE}")
+if __name__ == "__main__":
+    main()
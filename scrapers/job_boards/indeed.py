@@ -8,12 +8,26 @@ Also requires ChromeDriver to be available in your system PATH.
 Download from: https://chromedriver.chromium.org/
 """
 
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-import pandas as pd
+import sys
+from pathlib import Path
+from urllib.parse import urljoin
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from scrapers.utils.blocking import block_resources_selenium
+from scrapers.utils.extract import attr, extract_cards_selenium, text
+
+BLOCK_RESOURCES = True  # skip images, fonts, media and trackers; only text is extracted
+
+# Fields read from each job card inside the browser
+JOB_CARD_FIELDS = {
+    'title': text("h2.jobTitle span"),
+    'company': text("span[data-testid='company-name']"),
+    'location': text("div[data-testid='text-location']"),
+    'salary': text("div.metadata.salary-snippet-container"),
+    'description': text("div.job-snippet"),
+    'link': attr("h2.jobTitle a", "href"),
+}
+
 
 def scrape_indeed_jobs():
     """
@@ -22,6 +36,13 @@ def scrape_indeed_jobs():
     Indeed blocks standard HTTP requests, so this uses Selenium with
     a headless Chrome browser to bypass the blocking.
     """
+    from selenium import webdriver
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    import pandas as pd
+
     # Configuration
     query = 'python developer'
     location = 'Remote'
@@ -36,6 +57,8 @@ def scrape_indeed_jobs():
 
     # Initialize the driver
     driver = webdriver.Chrome(options=chrome_options)
+    if BLOCK_RESOURCES:
+        block_resources_selenium(driver)
 
     # Build Indeed search URL
     search_url = f"https://www.indeed.com/jobs?q={query.replace(' ', '+')}&l={location.replace(' ', '+')}"
@@ -51,67 +74,24 @@ def scrape_indeed_jobs():
             EC.presence_of_element_located((By.CLASS_NAME, "job_seen_beacon"))
         )
 
-        # Find all job cards on the page
-        job_cards = driver.find_elements(By.CLASS_NAME, "job_seen_beacon")
-
-        # Limit to requested number of jobs
-        job_cards = job_cards[:num_jobs]
+        # Read every job card in one script call instead of one round trip per field
+        job_cards = extract_cards_selenium(driver, ".job_seen_beacon", JOB_CARD_FIELDS, limit=num_jobs)
 
         print(f"Found {len(job_cards)} job listings")
 
         for idx, card in enumerate(job_cards, 1):
-            try:
-                # Extract job title
-                try:
-                    title = card.find_element(By.CSS_SELECTOR, "h2.jobTitle span").text
-                except:
-                    title = "N/A"
-
-                # Extract company name
-                try:
-                    company = card.find_element(By.CSS_SELECTOR, "span[data-testid='company-name']").text
-                except:
-                    company = "N/A"
-
-                # Extract location
-                try:
-                    job_location = card.find_element(By.CSS_SELECTOR, "div[data-testid='text-location']").text
-                except:
-                    job_location = "N/A"
-
-                # Extract salary (optional field)
-                try:
-                    salary = card.find_element(By.CSS_SELECTOR, "div.metadata.salary-snippet-container").text
-                except:
-                    salary = "Not Listed"
-
-                # Extract job description snippet
-                try:
-                    description = card.find_element(By.CSS_SELECTOR, "div.job-snippet").text
-                except:
-                    description = "N/A"
-
-                # Extract job link
-                try:
-                    link_element = card.find_element(By.CSS_SELECTOR, "h2.jobTitle a")
-                    job_link = link_element.get_attribute("href")
-                except:
-                    job_link = "N/A"
-
-                all_jobs.append({
-                    'Job Title': title,
-                    'Company': company,
-                    'Location': job_location,
-                    'Salary': salary,
-                    'Description': description,
-                    'Job Link': job_link
-                })
-
-                print(f"  [{idx}/{len(job_cards)}] Scraped: {title} at {company}")
-
-            except Exception as e:
-                print(f"  Error scraping job {idx}: {e}")
-                continue
+            title = card['title'] or "N/A"
+            company = card['company'] or "N/A"
+            all_jobs.append({
+                'Job Title': title,
+                'Company': company,
+                'Location': card['location'] or "N/A",
+                'Salary': card['salary'] or "Not Listed",  # optional field
+                'Description': card['description'] or "N/A",
+                'Job Link': urljoin(search_url, card['link']) if card['link'] else "N/A"
+            })
+
+            print(f"  [{idx}/{len(job_cards)}] Scraped: {title} at {company}")
 
     except Exception as e:
         print(f"Error during scraping: {e}")
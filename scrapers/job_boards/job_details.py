@@ -0,0 +1,357 @@
+"""Experience / salary / location detection shared by the job board scrapers.
+
+A DetailClassifier compiles a board's rules into one alternation regex with a
+named group per kind, so each text is scanned once instead of once per
+pattern. classify_many() goes further and scans all the texts of a page in
+one pass over their concatenation:
+
+    kinds = CARD_CLASSIFIER.classify_many(texts)    # [('salary', '₹15,000'), None, ...]
+
+CARD_CLASSIFIER holds the rules of the Apna and JobHai cards, NAUKRI_CLASSIFIER
+those of Naukri's detail rows. Both find locations with the place gazetteer
+(scrapers.utils.gazetteer) instead of guessing from a text's length; on Apna
+and JobHai cards they are reported under their canonical name, so 'Bangalore'
+and 'Bengaluru' land in the same bucket. extract_job_details(),
+job_details_from_text() and the batch job_details_many() turn Apna or JobHai
+cards into (title, company, salary, location, experience) tuples; walk_card()
+collects the strings of a BeautifulSoup card for them in a single traversal.
+"""
+
+import re
+from bisect import bisect_right
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from bs4 import CData, NavigableString, Tag
+
+from scrapers.utils.gazetteer import Gazetteer, default_gazetteer
+
+_SEPARATOR = "\x00"  # joins texts for classify_many(); neither \s nor \w, so no pattern spans two texts
+
+_DIGIT = re.compile(r'₹|\d')
+
+
+class DetailClassifier:
+    """Labels short card texts as experience, salary or location."""
+
+    def __init__(self, rules: Sequence[Tuple[str, str]], fallback_max_len: Optional[int] = None,
+                 fallback_digits: bool = True, gazetteer: Optional[Gazetteer] = None):
+        """
+        Compile a rule set.
+
+        Args:
+            rules: (kind, regex) pairs; when several kinds match a text the
+                kind listed first wins, as with a chain of re.search calls
+            fallback_max_len: Texts matching no rule and at most this long are
+                labelled 'location'; None disables the fallback
+            fallback_digits: Whether fallback locations may contain digits or '₹'
+            gazetteer: Texts matching no rule that name a known place are
+                labelled 'location' (checked before the length fallback)
+        """
+        self.kinds = []
+        patterns = {}
+        for kind, pattern in rules:
+            if kind not in patterns:
+                self.kinds.append(kind)
+                patterns[kind] = []
+            patterns[kind].append(f"(?:{pattern})")
+        self._rank = {kind: rank for rank, kind in enumerate(self.kinds)}
+        self._pattern = re.compile("|".join(f"(?P<{kind}>{'|'.join(patterns[kind])})" for kind in self.kinds), re.I)
+        self.fallback_max_len = fallback_max_len
+        self.fallback_digits = fallback_digits
+        self.gazetteer = gazetteer
+
+    def _fallback(self, text: str, is_place: bool = False) -> Optional[Tuple[str, str]]:
+        if is_place:
+            return ('location', text)
+        if self.fallback_max_len is None or len(text) > self.fallback_max_len:
+            return None
+        if not self.fallback_digits and _DIGIT.search(text):
+            return None
+        return ('location', text)
+
+    def classify(self, text: str) -> Optional[Tuple[str, str]]:
+        """
+        Classify one text.
+
+        Args:
+            text: Text of one element
+
+        Returns:
+            (kind, stripped text), or None if the text is empty or matches nothing
+        """
+        t = text.strip()
+        if not t:
+            return None
+        best = None
+        for match in self._pattern.finditer(t):
+            rank = self._rank[match.lastgroup]
+            if best is None or rank < best:
+                best = rank
+                if rank == 0:
+                    break
+        if best is not None:
+            return (self.kinds[best], t)
+        return self._fallback(t, bool(self.gazetteer and self.gazetteer.find_all(t)))
+
+    def classify_many(self, texts: Iterable[str]) -> List[Optional[Tuple[str, str]]]:
+        """
+        Classify a batch of texts (e.g. every text node of a page) in one regex pass.
+
+        Args:
+            texts: Texts to classify
+
+        Returns:
+            One classify() result per text, in order
+        """
+        stripped = [text.strip() for text in texts]
+        starts, pos = [], 0
+        for t in stripped:
+            starts.append(pos)
+            pos += len(t) + 1
+        joined = _SEPARATOR.join(stripped)
+        best = [None] * len(stripped)
+        for match in self._pattern.finditer(joined):
+            i = bisect_right(starts, match.start()) - 1
+            rank = self._rank[match.lastgroup]
+            if best[i] is None or rank < best[i]:
+                best[i] = rank
+        places = set()
+        if self.gazetteer:
+            places = {bisect_right(starts, place.start) - 1 for place in self.gazetteer.find_all(joined)}
+        results = []
+        for i, (t, rank) in enumerate(zip(stripped, best)):
+            if not t:
+                results.append(None)
+            elif rank is not None:
+                results.append((self.kinds[rank], t))
+            else:
+                results.append(self._fallback(t, i in places))
+        return results
+
+    def first_of_each(self, texts: Iterable[str], max_len: Optional[int] = None) -> Dict[str, str]:
+        """
+        Find the first text of each kind.
+
+        Args:
+            texts: Texts in document order
+            max_len: Ignore texts longer than this
+
+        Returns:
+            Mapping of kind to the first text classified as that kind
+        """
+        if max_len is not None:
+            texts = [t for t in texts if len(t) <= max_len]
+        found = {}
+        for result in self.classify_many(texts):
+            if result and result[0] not in found:
+                found[result[0]] = result[1]
+        return found
+
+
+# Apna and JobHai: salary before experience, then any text naming a known place
+CARD_CLASSIFIER = DetailClassifier([
+    ('salary', r'₹[\d,]+'),
+    ('salary', r'\b(?:lakh|per month|monthly)\b'),
+    ('experience', r'\b(?:fresher|experience|exp)\b'),
+    ('experience', r'\b\d+[+-]?\s*(?:yrs?|years?|months?)\b'),
+], gazetteer=default_gazetteer())
+
+# Naukri: experience before salary, then any text naming a known place.
+# (?<![^\x00]) is '^' that also holds at the start of each text joined by classify_many()
+NAUKRI_CLASSIFIER = DetailClassifier([
+    ('experience', r'\bfreshers?\b'),
+    ('experience', r'\b\d+[+-]?\s*(?:yrs?|years?)\b'),
+    ('experience', r'(?<![^\x00])\d+[-–]\d+\s*(?:yrs?|years?)'),
+    ('salary', r'₹|\b(?:lpa|lakh|lakhs|per annum|pa\b|yearly|k/annum|k p\.a\.)'),
+    ('salary', r'\d+\s*[-–]\s*\d+\s*(?:lakh|lpa|k)\b'),
+], gazetteer=default_gazetteer())
+
+# Whole-card searches run before the per-element pass
+DETAIL_MAX_LEN = 150  # longer element texts are sections of the card, not single details
+_CARD_SALARY = re.compile(r'₹[\d,]+(?:\s*[-–]\s*₹?[\d,]+)?(?:\s*(?:per month|monthly|lakh|LPA))?', re.I)
+_CARD_EXPERIENCE = re.compile(r'\d+(?:\.\d+)?[+-]?\s*(?:yrs?|years?|months?)|fresher|no experience', re.I)
+_TITLE_CLASS = re.compile(r'title|heading|job-title', re.I)
+_DETAIL_TAGS = frozenset(('li', 'span', 'div', 'p'))
+_STRING_TYPES = (NavigableString, CData)  # what get_text() reads; comments and script text are skipped
+_COMPANY_CLASS = re.compile(r'company|employer', re.I)
+
+
+def job_details_many(cards):
+    """
+    Title, company, salary, location and experience of many Apna or JobHai cards.
+
+    The detail texts of all cards go through the classifier in one batch.
+
+    Args:
+        cards: (title, company, all_text, detail_texts) per card, where all_text
+            is the whole text of the card and detail_texts the texts of its
+            li/span/div/p elements in document order; title/company may be None
+
+    Returns:
+        One (title, company, salary, location, experience) tuple per card, 'N/A' where not found
+    """
+    cards = list(cards)
+    flat, bounds = [], []
+    for _, _, _, detail_texts, *_ in cards:
+        start = len(flat)
+        flat.extend(t for t in detail_texts if t and len(t) <= DETAIL_MAX_LEN)
+        bounds.append((start, len(flat)))
+    classified = CARD_CLASSIFIER.classify_many(flat)
+
+    results = []
+    for (title, company, all_text, *_), (start, end) in zip(cards, bounds):
+        details = {}
+        match = _CARD_SALARY.search(all_text)
+        if match:
+            details['salary'] = match.group(0)
+        place = CARD_CLASSIFIER.gazetteer.find(all_text)
+        if place:
+            details['location'] = place
+        match = _CARD_EXPERIENCE.search(all_text)
+        if match:
+            details['experience'] = match.group(0)
+        for result in classified[start:end]:
+            if result:
+                details.setdefault(*result)
+        results.append((title or 'N/A', company or 'N/A', details.get('salary', 'N/A'),
+                        details.get('location', 'N/A'), details.get('experience', 'N/A')))
+    return results
+
+
+def job_details_from_text(title, company, all_text, detail_texts):
+    """
+    Title, company, salary, location and experience from the strings of one card.
+
+    Args:
+        title: Title text, or None
+        company: Company text, or None
+        all_text: Whole text of the card
+        detail_texts: Texts of the card's li/span/div/p elements in document order
+
+    Returns:
+        (title, company, salary, location, experience), 'N/A' where not found
+    """
+    return job_details_many([(title, company, all_text, detail_texts)])[0]
+
+
+class CardText(NamedTuple):
+    """Strings of one card, gathered by walk_card()."""
+    title: Optional[str]
+    company: Optional[str]
+    all_text: str
+    detail_texts: List[Optional[str]]
+    link: Optional[str]
+
+
+class _Text:
+    """Text of one element, built up while its subtree is walked."""
+
+    __slots__ = ("parts", "length", "sep", "max_len")
+
+    def __init__(self, sep, max_len=None):
+        self.parts = []
+        self.length = -len(sep)
+        self.sep = sep
+        self.max_len = max_len
+
+    def add(self, s):
+        """Append a string; False once the text is longer than max_len."""
+        self.parts.append(s)
+        self.length += len(s) + len(self.sep)
+        return self.max_len is None or self.length <= self.max_len
+
+    def value(self):
+        return self.sep.join(self.parts)
+
+
+def _has_class(tag, pattern):
+    return any(pattern.search(c) for c in tag.get("class") or ())
+
+
+def walk_card(card, max_len: int = DETAIL_MAX_LEN) -> CardText:
+    """
+    Gather the strings of a BeautifulSoup card in one pass over its subtree.
+
+    Calling get_text() on the card and then on every nested element re-reads
+    each string once per ancestor, which is quadratic in the nesting depth.
+    Here every string is visited once and handed to the open elements still
+    collecting text. A li/span/div/p element stops collecting once it is
+    longer than max_len (such texts are ignored anyway), so the work per
+    element stays bounded.
+
+    Args:
+        card: BeautifulSoup Tag of one card
+        max_len: Longest element text that is kept
+
+    Returns:
+        CardText with the title and company texts (as get_text(strip=True)),
+        the card's text and the texts of its li/span/div/p elements in
+        document order (as get_text(" ", strip=True), None when longer than
+        max_len), and the href of its first link
+    """
+    all_parts = []
+    detail_texts = []
+    collecting = []    # _Texts of the open elements, except details already over max_len
+    found = {}         # 'title' / 'heading' / 'company' -> _Text of the first such element
+    link = None
+    stack = [(iter(card.contents), None, ())]
+    while stack:
+        node = next(stack[-1][0], None)
+        if node is None:
+            _, slot, texts = stack.pop()
+            for text in texts:
+                if text in collecting:
+                    collecting.remove(text)
+                    if text is texts[0] and slot is not None:
+                        detail_texts[slot] = text.value()
+            continue
+
+        if isinstance(node, Tag):
+            name = node.name
+            slot, texts = None, []
+            if name in _DETAIL_TAGS:
+                slot = len(detail_texts)
+                detail_texts.append(None)
+                texts.append(_Text(" ", max_len))
+            if 'title' not in found and name in ('h2', 'h3', 'a') and _has_class(node, _TITLE_CLASS):
+                found['title'] = _Text("")
+                texts.append(found['title'])
+            if 'heading' not in found and name in ('h2', 'h3'):
+                found['heading'] = _Text("")
+                texts.append(found['heading'])
+            if 'company' not in found and name in ('span', 'div', 'p') and _has_class(node, _COMPANY_CLASS):
+                found['company'] = _Text("")
+                texts.append(found['company'])
+            if link is None and name == 'a' and node.get('href') is not None:
+                link = node['href']
+            collecting.extend(texts)
+            stack.append((iter(node.contents), slot, texts))
+            continue
+
+        if type(node) not in _STRING_TYPES:
+            continue
+        s = node.strip()
+        if not s:
+            continue
+        all_parts.append(s)
+        full = [text for text in collecting if not text.add(s)]
+        for text in full:
+            collecting.remove(text)
+
+    title = found.get('title') or found.get('heading')
+    company = found.get('company')
+    return CardText(title.value() if title else None, company.value() if company else None,
+                    " ".join(all_parts), detail_texts, link)
+
+
+def extract_job_details(job_card):
+    """
+    Title, company, salary, location and experience of a BeautifulSoup Apna or JobHai card.
+
+    Args:
+        job_card: BeautifulSoup Tag of one card
+
+    Returns:
+        (title, company, salary, location, experience), 'N/A' where not found
+    """
+    return job_details_from_text(*walk_card(job_card)[:4])
@@ -1,62 +1,26 @@
-from playwright.sync_api import sync_playwright
-from bs4 import BeautifulSoup
-import csv, re, time, random
+import argparse
+import asyncio
+import re, random
+import sys
 from datetime import datetime
+from functools import partial
+from pathlib import Path
 
-def classify_detail(text):   #Helpers
-    """Classify text as experience, salary, or location"""
-    t = text.strip()
-    if not t:
-        return None
-    if re.search(r'₹[\d,]+', t) or re.search(r'\b(lakh|per month|monthly)\b', t, re.I):
-        return ('salary', t)
-    if re.search(r'\b(fresher|experience|exp)\b', t, re.I) or re.search(r'\b\d+(\+|-)?\s*(yrs?|years?|months?)\b', t, re.I):
-        return ('experience', t)
-    if re.search(r'\b(Bangalore|Mumbai|Delhi|Kolkata|Chennai|Hyderabad|Pune|Ahmedabad)\b', t, re.I):
-        return ('location', t)
-    if len(t) <= 50 and not re.search(r'₹|\d+', t):
-        return ('location', t)
-    return None
-
-def extract_job_details(job_card):
-    """Extract title, company, salary, location, experience from job card"""
-    title = company = salary = location = experience = 'N/A'
-    
-    title_elem = job_card.find(['h2', 'h3', 'a'], class_=re.compile(r'title|heading|job-title', re.I))
-    if not title_elem:
-        title_elem = job_card.find(['h2', 'h3'])
-    if title_elem:
-        title = title_elem.get_text(strip=True)
-    company_elem = job_card.find(['span', 'div', 'p'], class_=re.compile(r'company|employer', re.I))
-    if company_elem:
-        company = company_elem.get_text(strip=True)
-    all_text = job_card.get_text(" ", strip=True)
-    salary_match = re.search(r'₹[\d,]+(?:\s*[-–]\s*₹?[\d,]+)?(?:\s*(?:per month|monthly|lakh|LPA))?', all_text, re.I)
-    if salary_match:
-        salary = salary_match.group(0)
-    location_match = re.search(r'\b(Bangalore|Mumbai|Delhi|Kolkata|Chennai|Hyderabad|Pune|Ahmedabad|NCR|Gurgaon|Noida)\b', all_text, re.I)
-    if location_match:
-        location = location_match.group(0)
-    exp_match = re.search(r'(\d+(\.\d+)?(\+|-)?\s*(yrs?|years?|months?)|fresher|no experience)', all_text, re.I)
-    if exp_match:
-        experience = exp_match.group(0)
-    
-    for elem in job_card.find_all(['li', 'span', 'div', 'p'], recursive=True):
-        txt = elem.get_text(" ", strip=True)
-        if not txt or len(txt) > 150:
-            continue
-        
-        classified = classify_detail(txt)
-        if classified:
-            kind, val = classified
-            if kind == 'salary' and salary == 'N/A':
-                salary = val
-            elif kind == 'location' and location == 'N/A':
-                location = val
-            elif kind == 'experience' and experience == 'N/A':
-                experience = val
-    
-    return title, company, salary, location, experience
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from scrapers.utils.blocking import BlockRules, block_resources_async
+from scrapers.utils.browser import DEFAULT_CONTEXTS, map_pages, scroll_until_loaded_async
+from scrapers.utils.capture import JsonCapture
+from scrapers.utils.checkpoint import Checkpoint, default_checkpoint_path
+from scrapers.utils.parsing import parse_html
+from scrapers.utils.sinks import open_sink
+from scrapers.job_boards.api_jobs import is_listing_api, jobs_from_payloads
+from scrapers.job_boards.job_details import job_details_from_text, walk_card
+
+JOBHAI_BASE_URL = "https://www.jobhai.com"
+
+# Elements counted while scrolling; the CSS form of the card filter used on the parsed page
+CARD_SELECTOR = ", ".join(f'{tag}[class*="{word}" i]' for tag in ('div', 'article', 'li')
+                          for word in ('job', 'card', 'item', 'listing', 'post'))
 
 def generate_pagination_urls(base_pattern, start_page=1, max_pages=150):
     """Generate pagination URLs based on JobHai's pattern"""
@@ -72,138 +36,250 @@ def generate_pagination_urls(base_pattern, start_page=1, max_pages=150):
     
     return urls
 
-def scrape_jobhai_playwright(urls_list, scroll_pause=3, max_scrolls=15):   
-    all_jobs_data = []
-    seen_jobs = set()
-    
-    with sync_playwright() as p:
-        browser = p.chromium.launch(
-            headless=False,
-            args=[
-                "--disable-blink-features=AutomationControlled", "--start-maximized","--disable-dev-shm-usage","--no-sandbox"])  
-        context = browser.new_context(
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                       "AppleWebKit/537.36 (KHTML, like Gecko) "
-                       "Chrome/120.0.0.0 Safari/537.36",
-            viewport={"width": 1920, "height": 1080}  )
+def is_jobhai_api(url):
+    """Job listing/search calls to JobHai's own backends, not its recommendation or filter APIs"""
+    return is_listing_api(url, "jobhai.com")
+
+async def load_listing(page, url, scroll_pause=3, max_scrolls=15, capture=True):
+    """Open one listing URL in a pooled browser tab and scroll until no new cards load
+    (each scroll waits at most scroll_pause). Returns (api_jobs, html, small_page), or None if
+    the page did not load. With capture set, api_jobs are the jobs mapped from the JSON responses
+    the page loaded and html is only serialized when there are none."""
+    name = url.split('/')[-1]
+    api = JsonCapture(page, is_jobhai_api) if capture else None
+    try:
+        await page.goto(url, wait_until="domcontentloaded", timeout=60000)
+        await asyncio.sleep(random.uniform(2, 3))
+        
+        try:               # Check if page loaded successfully
+            await page.wait_for_selector("body", timeout=10000)
+        except Exception:
+            print(f"⚠️ Page load timeout - skipping {name}")
+            return None
         
-        page = context.new_page()
-        print(f"\n🌐 Starting JobHai scraper")
-        failed_pages = 0
-        empty_pages = 0
+        small_page = False
+        curr_height = await page.evaluate("document.body.scrollHeight")
+        if curr_height < 1000:          # Don't scroll if page is too small (likely empty or 404)
+            print(f"   ⚠️ Small page detected ({curr_height}px) on {name} - likely empty")
+            small_page = True
+        else:
+            new_per_scroll = await scroll_until_loaded_async(page, CARD_SELECTOR, max_scrolls=max_scrolls,
+                                                             timeout=scroll_pause)
+            print(f"   ➤ {name}: scrolled {len(new_per_scroll)}x, new cards per scroll: {new_per_scroll}")
         
-        for url_idx, url in enumerate(urls_list):
+        api_jobs = jobs_from_payloads(await api.payloads_async(), JOBHAI_BASE_URL) if api else []
+    finally:
+        if api:
+            api.detach()
+    html = None if api_jobs else await page.content()
+    await asyncio.sleep(random.uniform(0.5, 2))    # Pause before this context takes its next page
+    return api_jobs, html, small_page
+
+def find_job_cards(html):
+    """Find job cards in a listing page"""
+    soup = parse_html(html)
+    
+    container = soup.select_one("#common") or soup.select_one("body")    # Enhanced job card detection
+    
+    job_cards = container.find_all(['div', 'article', 'li'],     # Multiple detection strategies
+        class_=re.compile(r'job|card|item|listing|post', re.I))
+    
+    if len(job_cards) < 10:
+        job_cards = [
+            div for div in container.find_all('div', recursive=True)
+            if div.find(['h2', 'h3', 'a']) and '₹' in div.get_text()]
+    return job_cards
+
+def parse_job_card(card, page_number):
+    """Turn one job card into a row; None if the card does not look like a job"""
+    card_text = walk_card(card)     # One pass over the card's strings
+    
+    if len(card_text.all_text) < 20 or '₹' not in card_text.all_text:
+        return None
+    
+    title, company, salary, location, experience = job_details_from_text(*card_text[:4])
+    job_url = 'N/A'   # Find job URL
+    href = card_text.link
+    if href:
+        if href.startswith('/'):
+            job_url = f"{JOBHAI_BASE_URL}{href}"
+        elif href.startswith('http'):
+            job_url = href
+    
+    return {
+        'Job Title': title, 'Company Name': company, 'Experience': experience, 'Salary': salary,
+        'Location': location, 'URL': job_url, 'Page Number': page_number}
+
+
+class EndOfListing:
+    """Replays finished pages in page order to find where the listing ends.
+
+    Pages finish out of order, so an empty page only ends the crawl once every
+    page before it has finished too: the serial rule (more than ``max_empty``
+    empty pages and no new job on the current one) is applied to the pages in
+    order, never to whichever pages happen to finish first.
+    """
+
+    def __init__(self, page_numbers, max_empty=10):
+        self.order = sorted(page_numbers)
+        self.max_empty = max_empty
+        self.outcomes = {}       # page number -> (empty, new jobs), or None if the page failed
+        self.next_index = 0      # first page of order not replayed yet
+        self.empty_pages = 0     # empty pages among the replayed ones
+        self.failed_before = False
+        self.stop_page = None
+
+    def record(self, page_number, empty=False, new_jobs=0, failed=False):
+        """Store a finished page; returns the page the listing ends at once it is known, else None."""
+        self.outcomes[page_number] = None if failed else (empty, new_jobs)
+        while self.stop_page is None and self.next_index < len(self.order):
+            page = self.order[self.next_index]
+            if page not in self.outcomes:
+                break
+            self.next_index += 1
+            outcome = self.outcomes.pop(page)
+            if outcome is None:
+                self.failed_before = True
+                continue
+            self.empty_pages += outcome[0]
+            if self.empty_pages > self.max_empty and outcome[1] == 0:
+                self.stop_page = page
+        return self.stop_page
+
+def scrape_jobhai_playwright(urls_list, scroll_pause=3, max_scrolls=15, checkpoint=None,
+                             contexts=DEFAULT_CONTEXTS, headless=True, block=True, capture=True):   
+    """Crawl JobHai listing URLs with a pool of browser contexts, yielding each new job as a dict
+    as soon as its page is parsed. Pages come back in the order they finish.
+    With capture set, jobs are mapped from the site's JSON responses; pages without any are
+    parsed from the rendered cards.
+    With block set, images, fonts, media and trackers are not downloaded.
+    URLs already done in the checkpoint are skipped; the dedup set is kept in the checkpoint too."""
+    total_jobs = 0
+    seen_jobs = checkpoint.seen if checkpoint else set()
+    reached_end = False
+    page_numbers = {url: idx + 1 for idx, url in enumerate(urls_list)}
+    pending = checkpoint.pending(urls_list) if checkpoint else list(urls_list)
+    if checkpoint and checkpoint.resumed:
+        print(f"⏩ Resuming: {len(checkpoint.done)} pages already done, {len(pending)} to go")
+    
+    print(f"\n🌐 Starting JobHai scraper with {contexts} browser contexts")
+    failed_pages = 0
+    empty_pages = 0
+    api_pages = 0
+    end = EndOfListing(page_numbers[url] for url in pending)
+    visit = partial(load_listing, scroll_pause=scroll_pause, max_scrolls=max_scrolls, capture=capture)
+    rules = BlockRules() if block else None
+    setup_page = partial(block_resources_async, rules=rules) if block else None
+    
+    try:
+        for url, loaded in map_pages(visit, pending, contexts=contexts, headless=headless, setup_page=setup_page):
+            page_number = page_numbers[url]
             print(f"\n{'='*70}")
-            print(f"📄 Page {url_idx + 1}/{len(urls_list)}: {url.split('/')[-1]}")
+            print(f"📄 Page {page_number}/{len(urls_list)}: {url.split('/')[-1]}")
             print(f"{'='*70}")
             
-            try:
-                page.goto(url, wait_until="domcontentloaded", timeout=60000)
-                time.sleep(random.uniform(2, 3))
-                
-                try:               # Check if page loaded successfully
-                    page.wait_for_selector("body", timeout=10000)
-                except:
-                    print("⚠️ Page load timeout - skipping")
-                    failed_pages += 1
-                    continue
-                
-                for i in range(max_scrolls):     # Quick scroll to trigger lazy loading
-                    page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                    time.sleep(scroll_pause)
-                    
-                    curr_height = page.evaluate("document.body.scrollHeight")
-                    
-                    if curr_height < 1000:          # Stop if page is too small (likely empty or 404)
-                        print(f"   ⚠️ Small page detected ({curr_height}px) - likely empty")
-                        empty_pages += 1
-                        break
-                    
-                    if i % 5 == 0:
-                        print(f"   ➤ Scrolling... {i+1}/{max_scrolls}")
-                
-                html = page.content()          # Get HTML
-                soup = BeautifulSoup(html, "html.parser")
-                
-                container = soup.select_one("#common") or soup.select_one("body")    # Enhanced job card detection
-                
-                job_cards = container.find_all(['div', 'article', 'li'],     # Multiple detection strategies
-                    class_=re.compile(r'job|card|item|listing|post', re.I))
-                
-                if len(job_cards) < 10:
-                    job_cards = [
-                        div for div in container.find_all('div', recursive=True)
-                        if div.find(['h2', 'h3', 'a']) and '₹' in div.get_text()]
-                
+            if loaded is None:
+                failed_pages += 1
+                end.record(page_number, failed=True)
+                continue
+            api_jobs, html, small_page = loaded
+            if small_page:
+                empty_pages += 1
+            
+            if api_jobs:
+                api_pages += 1
+                print(f"   ➤ {len(api_jobs)} jobs from the API responses")
+                jobs = [{**job, 'Page Number': page_number} for job in api_jobs]
+            else:
+                job_cards = find_job_cards(html)
                 if len(job_cards) == 0:
                     empty_pages += 1
+                    if end.record(page_number, empty=True) is not None:
+                        break
                     continue
-                
-                page_jobs_count = 0       # Extract jobs from this page
-                
-                for idx, card in enumerate(job_cards):
+                jobs = []
+                for card in job_cards:
                     try:
-                        card_text = card.get_text(" ", strip=True)
-                        
-                        if len(card_text) < 20 or '₹' not in card_text:
-                            continue
-                        
-                        title, company, salary, location, experience = extract_job_details(card)
-                        job_key = f"{title}_{company}_{salary}_{location}"    # Create unique key
-                        if job_key in seen_jobs:
-                            continue
-                        seen_jobs.add(job_key)
-                        job_url = 'N/A'   # Find job URL
-                        link_elem = card.find('a', href=True)
-                        if link_elem:
-                            href = link_elem['href']
-                            if href.startswith('/'):
-                                job_url = f"https://www.jobhai.com{href}"
-                            elif href.startswith('http'):
-                                job_url = href
-                        
-                        all_jobs_data.append({
-                            'Job Title': title,'Company Name': company,'Experience': experience,'Salary': salary,'Location': location,'URL': job_url,'Page Number': url_idx + 1 })
-                        page_jobs_count += 1
-                        
+                        job = parse_job_card(card, page_number)
                     except Exception as e:
                         continue
+                    if job is not None:
+                        jobs.append(job)
+            
+            page_jobs_count = 0       # Keep the jobs not seen yet
+            
+            for job in jobs:
+                job_key = (f"{job['Job Title']}_{job['Company Name']}_"    # Create unique key
+                           f"{job['Salary']}_{job['Location']}")
+                if job_key in seen_jobs:
+                    continue
+                seen_jobs.add(job_key)
                 
-                print(f"✅ Extracted {page_jobs_count} new jobs")
-                print(f"📊 Total jobs: {len(all_jobs_data)} | Failed: {failed_pages} | Empty: {empty_pages}")
-                if url_idx < len(urls_list) - 1:
-                    delay = random.uniform(1, 2) if page_jobs_count > 0 else random.uniform(0.5, 1)
-                    time.sleep(delay)
-                if empty_pages > 10 and page_jobs_count == 0:    
-                    print(f"\n⚠️ Stopping: {empty_pages} consecutive empty pages detected")
-                    break
-                
-            except KeyboardInterrupt:
-                print("\n⚠️ Interrupted by user. Saving data collected so far...")
+                yield job
+                total_jobs += 1
+                page_jobs_count += 1
+            
+            print(f"✅ Extracted {page_jobs_count} new jobs")
+            print(f"📊 Total jobs: {total_jobs} | Failed: {failed_pages} | Empty: {empty_pages}")
+            if checkpoint:
+                checkpoint.commit(url, frontier=checkpoint.pending(urls_list))
+            if end.record(page_number, empty=small_page, new_jobs=page_jobs_count) is not None:
                 break
-            except Exception as e:
-                print(f"❌ Error: {e}")
-                failed_pages += 1
-                continue
-        
-        browser.close()
-        print(f"🚀 Scraping completed!")
-        print(f"📊 Total jobs: {len(all_jobs_data)} | Failed: {failed_pages} | Empty: {empty_pages}")
-    return all_jobs_data
-
-def save_to_csv(data, filename='jobhai_driver_jobs_100pages.csv'): # ---------- SAVE TO CSV ---------- #
-    if not data:
-        return
     
+    except KeyboardInterrupt:
+        print("\n⚠️ Interrupted by user. Saving data collected so far...")
+    
+    if end.stop_page is not None:
+        print(f"\n⚠️ Stopping at page {end.stop_page}: {end.empty_pages} empty pages before it")
+        # Only a listing whose pages up to the end all loaded is finished; failed pages stay pending
+        reached_end = not end.failed_before
+    print(f"🚀 Scraping completed!")
+    print(f"📊 Total jobs: {total_jobs} | Failed: {failed_pages} | Empty: {empty_pages}")
+    if capture:
+        print(f"📡 {api_pages} pages read from the API responses")
+    if rules:
+        print(f"🛡️ Blocked {rules.blocked} of {rules.blocked + rules.allowed} browser requests")
+
+    if checkpoint:
+        remaining = len(checkpoint.pending(urls_list))
+        if reached_end or not remaining:
+            checkpoint.clear()
+        else:
+            print(f"⚠️ {remaining} pages not done; run again with --resume to continue")
+
+# ---------- SAVE TO CSV ---------- #
+def save_to_csv(jobs, filename='jobhai_driver_jobs_100pages.csv', checkpoint=None):
+    """Stream jobs into the file as they are scraped (.csv, .jsonl or .parquet).
+    With a resumed checkpoint the rows are appended to the earlier output."""
     headers = ['Job Title', 'Company Name', 'Experience', 'Salary', 'Location', 'URL', 'Page Number']
     
-    with open(filename, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=headers)
-        writer.writeheader()
-        writer.writerows(data)
+    append = checkpoint.restore_output(filename) if checkpoint else False
+    with open_sink(filename, fieldnames=headers, append=append) as sink:
+        if checkpoint:
+            checkpoint.track(sink)
+        sink.write_many(jobs)
     
-if __name__ == "__main__":  
+def main():
+    """Crawl the JobHai driver job listing into a CSV."""
+    parser = argparse.ArgumentParser(description="Scrape JobHai driver jobs")
+    parser.add_argument("--resume", action="store_true",
+                        help="continue an interrupted crawl from its checkpoint")
+    parser.add_argument("--contexts", type=int, default=DEFAULT_CONTEXTS,
+                        help="pages rendered in parallel (default: %(default)s)")
+    parser.add_argument("--headed", action="store_true", help="show the browser window")
+    parser.add_argument("--no-block", action="store_true",
+                        help="load images, fonts, media and trackers too")
+    parser.add_argument("--dom", action="store_true",
+                        help="parse the rendered job cards instead of the API responses")
+    args = parser.parse_args()
+
     base_url = "https://www.jobhai.com/driver-jobs-cgy"
     urls_to_scrape = generate_pagination_urls(base_url, start_page=1, max_pages=150)
-    scraped_data = scrape_jobhai_playwright(urls_to_scrape, scroll_pause=1.5, max_scrolls=10)
-    save_to_csv(scraped_data)
\ No newline at end of file
+    checkpoint = Checkpoint(default_checkpoint_path("jobhai"), resume=args.resume)
+    scraped_data = scrape_jobhai_playwright(urls_to_scrape, scroll_pause=1.5, max_scrolls=10,
+                                            checkpoint=checkpoint, contexts=args.contexts, headless=not args.headed,
+                                            block=not args.no_block, capture=not args.dom)
+    save_to_csv(scraped_data, checkpoint=checkpoint)
+
+if __name__ == "__main__":  
+    main()
@@ -1,157 +1,238 @@
-from playwright.sync_api import sync_playwright
-from bs4 import BeautifulSoup
-import csv, re, time, random
-
-# ---------- HELPERS ---------- #
-def classify_detail(text):
-    t = text.strip()
-    if not t:
-        return None
-    if re.search(r'\b(fresher|freshers)\b', t, re.I) or re.search(r'\b\d+(\+|-)?\s*(yrs?|years?)\b', t, re.I) or re.search(r'^\d+[-–]\d+\s*(yrs?|years?)', t, re.I):
-        return ('experience', t)
-    if re.search(r'₹|\b(lpa|lakh|lakhs|per annum|pa\b|yearly|k\/annum|k p\.a\.)', t, re.I) or re.search(r'\d+\s*(?:-|\u2013)\s*\d+\s*(lakh|lpa|k)\b', t, re.I):
-        return ('salary', t)
-    if len(t) <= 60:
-        return ('location', t)
-    return None
-
-
-def extract_exp_sal_loc_from_job(job):
-    selectors = ['.exp', '.experience', '.sal', '.salary', '.loc', '.location', 'li.fleft', 'span.ellipsis', 'ul li']
-    exp = salary = location = None
-    for sel in selectors:
-        el = job.select_one(sel)
-        if el:
-            txt = el.get_text(strip=True)
-            for p in re.split(r'\s*\|\s*|\n|,', txt):
-                classified = classify_detail(p)
-                if classified:
-                    kind, val = classified
-                    if kind == 'experience' and not exp: exp = val
-                    elif kind == 'salary' and not salary: salary = val
-                    elif kind == 'location' and not location: location = val
-            if exp and salary and location:
-                return exp, salary, location
-    for tag in job.find_all(['li', 'span', 'p', 'div'], recursive=True):
-        txt = tag.get_text(" ", strip=True)
-        if not txt or len(txt) > 120: continue
-        classified = classify_detail(txt)
-        if classified:
-            kind, val = classified
-            if kind == 'experience' and not exp: exp = val
-            elif kind == 'salary' and not salary: salary = val
-            elif kind == 'location' and not location: location = val
-        if exp and salary and location: break
-    return exp or 'N/A', salary or 'N/A', location or 'N/A'
-
-
-# ---------- MAIN SCRAPER ---------- #
-def scrape_jobs_playwright(num_pages=42):
-    all_jobs_data = []
-    with sync_playwright() as p:
-        # 🚀 Use non-headless mode + realistic user-agent
-        browser = p.chromium.launch(headless=False, args=[
-            "--disable-blink-features=AutomationControlled",
-            "--start-maximized"
-        ])
-        context = browser.new_context(
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                       "AppleWebKit/537.36 (KHTML, like Gecko) "
-                       "Chrome/120.0.0.0 Safari/537.36",
-            viewport={"width": 1366, "height": 768}
-        )
-
-        page = context.new_page()
-
-        for page_num in range(1, num_pages + 1):
-            if page_num == 1:
-                url = "https://www.naukri.com/full-stack-developer-jobs?src=popular_roles_homepage_srch"
-            else:
-                url = f"https://www.naukri.com/full-stack-developer-jobs-{page_num}?src=popular_roles_homepage_srch"
-
-            print(f"\n🌐 Scraping Page {page_num}: {url}")
-
-            try:
-                page.goto(url, wait_until="domcontentloaded", timeout=60000)
-                time.sleep(random.uniform(3, 5))  # Wait for JS to render job cards
-
-                html = page.content()
-                soup = BeautifulSoup(html, "html.parser")
-
-                # Try multiple selectors
-                job_cards = soup.select(
-                    '.srp-jobtuple-wrapper, article.jobTuple, div.jobTuple, div[class*="job-tuple"]'
-                )
-
-                if not job_cards:
-                    print("⚠️ No job cards detected, retrying after scroll...")
-                    page.mouse.wheel(0, 4000)
-                    time.sleep(3)
-                    html = page.content()
-                    soup = BeautifulSoup(html, "html.parser")
-                    job_cards = soup.select(
-                        '.srp-jobtuple-wrapper, article.jobTuple, div.jobTuple, div[class*="job-tuple"]'
-                    )
-
-                if not job_cards:
-                    print(f"❌ Still no job cards found on page {page_num}, skipping.")
-                    continue
-
-                print(f"   ➤ Found {len(job_cards)} jobs.")
-
-                for job in job_cards:
-                    title_elem = job.select_one('a.title, .job-title, h2 a, .designation, .title')
-                    title = title_elem.get_text(strip=True) if title_elem else 'N/A'
-                    company_elem = job.select_one('.comp-name, .company-name, .companyInfo a, a[class*="comp"]')
-                    company = company_elem.get_text(strip=True) if company_elem else 'N/A'
-                    experience, salary, location = extract_exp_sal_loc_from_job(job)
-                    tags_ul = job.select_one('ul.tags-gt, .tags, .skills')
-                    if tags_ul:
-                        tags_list = [li.get_text(strip=True) for li in tags_ul.find_all('li')]
-                        skills = ', '.join(tags_list) if tags_list else tags_ul.get_text(" ", strip=True)
-                    else:
-                        skills = 'N/A'
-                    job_url = title_elem['href'] if title_elem and title_elem.has_attr('href') else 'N/A'
-
-                    all_jobs_data.append({
-                        'Job Title': title,
-                        'Company Name': company,
-                        'Experience': experience,
-                        'Salary': salary,
-                        'Location': location,
-                        'Skills': skills,
-                        'URL': job_url
-                    })
-
-                print(f"✅ Page {page_num} done with {len(job_cards)} jobs.")
-                time.sleep(random.uniform(2, 4))  # Add delay to avoid detection
-
-            except Exception as e:
-                print(f"❌ Error scraping page {page_num}: {e}")
-                continue
-
-        browser.close()
-        print("\n🚀 All pages processed.")
-    return all_jobs_data
-
-
-# ---------- SAVE TO CSV ---------- #
-def save_to_csv(data, filename='naukri_jobs.csv'):
-    if not data:
-        print("No data to save.")
-        return
-    headers = ['Job Title', 'Company Name', 'Experience', 'Salary', 'Location', 'Skills', 'URL']
-    with open(filename, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=headers)
-        writer.writeheader()
-        writer.writerows(data)
-    print(f"\n✅ Saved {len(data)} jobs to {filename}")
-# ---------- MAIN ---------- #
-if __name__ == "__main__":
-    scraped_data = scrape_jobs_playwright(num_pages=42)
-    save_to_csv(scraped_data)
-
-
-
-
-
+import argparse
+import asyncio
+import re, random
+import sys
+from functools import partial
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from scrapers.utils.blocking import BlockRules, block_resources_async
+from scrapers.utils.browser import DEFAULT_CONTEXT_OPTIONS, DEFAULT_CONTEXTS, map_pages
+from scrapers.utils.capture import JsonCapture
+from scrapers.utils.checkpoint import Checkpoint, default_checkpoint_path
+from scrapers.utils.extract import attr, extract_cards_async, text, texts
+from scrapers.utils.sinks import open_sink
+from scrapers.job_boards.job_details import NAUKRI_CLASSIFIER
+
+# ---------- HELPERS ---------- #
+DETAIL_SELECTORS = ['.exp', '.experience', '.sal', '.salary', '.loc', '.location', 'li.fleft', 'span.ellipsis', 'ul li']
+DETAIL_SPLIT = re.compile(r'\s*\|\s*|\n|,')
+
+
+def extract_exp_sal_loc(detail_texts, fallback_texts):
+    """Experience, salary and location of a card. detail_texts are the texts of the first
+    match of each DETAIL_SELECTORS entry (None if absent); fallback_texts are the short
+    texts of all li/span/p/div elements of the card, used when those are not enough."""
+    parts = [p for txt in detail_texts if txt for p in DETAIL_SPLIT.split(txt)]
+    found = NAUKRI_CLASSIFIER.first_of_each(parts)
+    if len(found) < 3:
+        for kind, val in NAUKRI_CLASSIFIER.first_of_each(fallback_texts).items():
+            found.setdefault(kind, val)
+    return found.get('experience', 'N/A'), found.get('salary', 'N/A'), found.get('location', 'N/A')
+
+
+def page_url(page_num):
+    """Listing URL for a page number; the URLs are known ahead of the crawl."""
+    if page_num == 1:
+        return "https://www.naukri.com/full-stack-developer-jobs?src=popular_roles_homepage_srch"
+    return f"https://www.naukri.com/full-stack-developer-jobs-{page_num}?src=popular_roles_homepage_srch"
+
+
+# ---------- SEARCH API ---------- #
+NAUKRI_BASE_URL = "https://www.naukri.com"
+API_TIMEOUT = 15  # seconds to wait for the listing's search API response
+
+
+def is_search_api(url):
+    """The XHR the listing page renders its job cards from"""
+    return "/jobapi/" in url and "/search" in url
+
+
+def job_from_api(job):
+    """Turn one entry of the search API's jobDetails list into a row"""
+    details = {p.get('type'): p.get('label') for p in job.get('placeholders') or [] if isinstance(p, dict)}
+    skills = [s.strip() for s in (job.get('tagsAndSkills') or '').split(',') if s.strip()]
+    job_url = job.get('jdURL') or 'N/A'
+    if job_url.startswith('/'):
+        job_url = NAUKRI_BASE_URL + job_url
+    return {
+        'Job Title': job.get('title') or 'N/A',
+        'Company Name': job.get('companyName') or 'N/A',
+        'Experience': details.get('experience') or 'N/A',
+        'Salary': details.get('salary') or 'N/A',
+        'Location': details.get('location') or 'N/A',
+        'Skills': ', '.join(skills) or 'N/A',
+        'URL': job_url
+    }
+
+
+def jobs_from_payloads(payloads):
+    """Rows from every jobDetails list in the captured API responses"""
+    return [job_from_api(job)
+            for payload in payloads if isinstance(payload, dict)
+            for job in payload.get('jobDetails') or [] if isinstance(job, dict)]
+
+
+# ---------- MAIN SCRAPER ---------- #
+JOB_CARD_SELECTOR = '.srp-jobtuple-wrapper, article.jobTuple, div.jobTuple, div[class*="job-tuple"]'
+TITLE_SELECTOR = 'a.title, .job-title, h2 a, .designation, .title'
+TAGS_SELECTOR = 'ul.tags-gt, .tags, .skills'
+
+# Fields read in the page for each card, so only these strings cross over from the browser
+JOB_CARD_FIELDS = {
+    'title': text(TITLE_SELECTOR),
+    'href': attr(TITLE_SELECTOR, 'href'),
+    'company': text('.comp-name, .company-name, .companyInfo a, a[class*="comp"]'),
+    'tags': text(TAGS_SELECTOR),
+    'tag_items': texts(f':is({TAGS_SELECTOR}) li'),
+    'details': texts('li, span, p, div', max_len=120),
+    **{f'detail_{i}': text(sel) for i, sel in enumerate(DETAIL_SELECTORS)},
+}
+
+
+async def render_job_cards(page, page_num):
+    """Read the job cards rendered on the open page with one in-page call (empty if none rendered)"""
+    await asyncio.sleep(random.uniform(3, 5))  # Wait for JS to render job cards
+
+    job_cards = await extract_cards_async(page, JOB_CARD_SELECTOR, JOB_CARD_FIELDS)
+
+    if not job_cards:
+        print(f"⚠️ No job cards detected on page {page_num}, retrying after scroll...")
+        await page.mouse.wheel(0, 4000)
+        await asyncio.sleep(3)
+        job_cards = await extract_cards_async(page, JOB_CARD_SELECTOR, JOB_CARD_FIELDS)
+    return job_cards
+
+
+async def load_jobs(page, page_num, capture=True):
+    """Open one listing page in a pooled browser tab and return (source, rows).
+    In capture mode the rows are mapped from the search API response the page
+    fetches for itself; the rendered cards are parsed only when no usable
+    response arrives (or with capture off)."""
+    url = page_url(page_num)
+    print(f"\n🌐 Scraping Page {page_num}: {url}")
+
+    jobs = []
+    if capture:
+        with JsonCapture(page, is_search_api) as api:
+            await page.goto(url, wait_until="domcontentloaded", timeout=60000)
+            await api.wait_async(timeout=API_TIMEOUT)
+            jobs = jobs_from_payloads(await api.payloads_async())
+        if not jobs:
+            print(f"⚠️ No search API data on page {page_num}, falling back to the rendered cards")
+    else:
+        await page.goto(url, wait_until="domcontentloaded", timeout=60000)
+
+    source = 'api'
+    if not jobs:
+        source = 'dom'
+        jobs = [parse_job_card(job) for job in await render_job_cards(page, page_num)]
+
+    await asyncio.sleep(random.uniform(2, 4))  # Add delay to avoid detection
+    return source, jobs
+
+
+def parse_job_card(job):
+    """Turn the fields of one job card (see JOB_CARD_FIELDS) into a row"""
+    detail_texts = [job[f'detail_{i}'] for i in range(len(DETAIL_SELECTORS))]
+    experience, salary, location = extract_exp_sal_loc(detail_texts, job['details'])
+    if job['tags'] is not None:
+        skills = ', '.join(job['tag_items']) if job['tag_items'] else job['tags']
+    else:
+        skills = 'N/A'
+
+    return {
+        'Job Title': job['title'] or 'N/A',
+        'Company Name': job['company'] or 'N/A',
+        'Experience': experience,
+        'Salary': salary,
+        'Location': location,
+        'Skills': skills,
+        'URL': job['href'] or 'N/A'
+    }
+
+
+def scrape_jobs_playwright(num_pages=42, checkpoint=None, contexts=DEFAULT_CONTEXTS, headless=True, block=True,
+                           capture=True):
+    """Crawl Naukri listing pages with a pool of browser contexts, yielding each job as a dict
+    as soon as its page is parsed. Pages come back in the order they finish.
+    With capture set, jobs are read from the site's search API responses instead of the DOM.
+    With block set, images, fonts, media and trackers are not downloaded.
+    Pages already done in the checkpoint are skipped and each finished page is committed to it."""
+    pages = list(range(1, num_pages + 1))
+    if checkpoint:
+        pages = checkpoint.pending(pages)
+        if checkpoint.resumed:
+            print(f"⏩ Resuming: {len(checkpoint.done)} pages already done, {len(pages)} to go")
+
+    print(f"🚀 Crawling {len(pages)} pages with {contexts} browser contexts")
+    context_options = {**DEFAULT_CONTEXT_OPTIONS, "viewport": {"width": 1366, "height": 768}}
+    rules = BlockRules() if block else None
+    setup_page = partial(block_resources_async, rules=rules) if block else None
+    sources = {'api': 0, 'dom': 0}
+    visit = partial(load_jobs, capture=capture)
+    for page_num, result in map_pages(visit, pages, contexts=contexts, headless=headless,
+                                      context_options=context_options, setup_page=setup_page):
+        source, jobs = result or (None, [])
+        if not jobs:
+            print(f"❌ Still no job cards found on page {page_num}, skipping.")
+            continue
+
+        sources[source] += 1
+        print(f"   ➤ Found {len(jobs)} jobs on page {page_num} (from {source}).")
+        yield from jobs
+
+        if checkpoint:
+            checkpoint.commit(page_num, frontier=checkpoint.pending(pages))
+        print(f"✅ Page {page_num} done with {len(jobs)} jobs.")
+
+    print("\n🚀 All pages processed.")
+    print(f"📡 {sources['api']} pages read from the search API, {sources['dom']} parsed from the DOM")
+    if rules:
+        print(f"🛡️ Blocked {rules.blocked} of {rules.blocked + rules.allowed} browser requests")
+
+    if checkpoint:
+        missing = num_pages - len(checkpoint.done)
+        if missing:
+            print(f"⚠️ {missing} pages failed; run again with --resume to retry them")
+        else:
+            checkpoint.clear()
+
+
+# ---------- SAVE TO CSV ---------- #
+def save_to_csv(jobs, filename='naukri_jobs.csv', checkpoint=None):
+    """Stream jobs into the file as they are scraped (.csv, .jsonl or .parquet).
+    With a resumed checkpoint the rows are appended to the earlier output."""
+    headers = ['Job Title', 'Company Name', 'Experience', 'Salary', 'Location', 'Skills', 'URL']
+    append = checkpoint.restore_output(filename) if checkpoint else False
+    with open_sink(filename, fieldnames=headers, append=append) as sink:
+        if checkpoint:
+            checkpoint.track(sink)
+        sink.write_many(jobs)
+    if not sink.count:
+        print("No data to save.")
+        return
+    print(f"\n✅ Saved {sink.count} jobs to {filename}")
+# ---------- MAIN ---------- #
+def main():
+    """Crawl the Naukri full stack developer listing into a CSV."""
+    parser = argparse.ArgumentParser(description="Scrape Naukri job listings")
+    parser.add_argument("--resume", action="store_true",
+                        help="continue an interrupted crawl from its checkpoint")
+    parser.add_argument("--contexts", type=int, default=DEFAULT_CONTEXTS,
+                        help="pages rendered in parallel (default: %(default)s)")
+    parser.add_argument("--headed", action="store_true", help="show the browser window")
+    parser.add_argument("--no-block", action="store_true",
+                        help="load images, fonts, media and trackers too")
+    parser.add_argument("--dom", action="store_true",
+                        help="parse the rendered job cards instead of the search API responses")
+    args = parser.parse_args()
+
+    checkpoint = Checkpoint(default_checkpoint_path("naukri_jobs"), resume=args.resume)
+    scraped_data = scrape_jobs_playwright(num_pages=42, checkpoint=checkpoint,
+                                          contexts=args.contexts, headless=not args.headed,
+                                          block=not args.no_block, capture=not args.dom)
+    save_to_csv(scraped_data, checkpoint=checkpoint)
+
+if __name__ == "__main__":
+    main()
@@ -1,2 +1,12 @@
 """Miscellaneous scrapers."""
 
+from scrapers.registry import register
+
+register("coinmarketcap", "misc", "scrapers.misc.coinmarketcap:scrape_and_save_crypto_data",
+         "coinmarketcap.com", "CoinMarketCap cryptocurrency prices")
+register("craigslist_housing", "misc", "scrapers.misc.craigslist_housing:main", "craigslist.org",
+         "Craigslist housing listings")
+register("syntaxminds", "misc", "scrapers.misc.syntaxminds:main", "syntaxminds.com",
+         "SyntaxMinds Spring Boot MCQs")
+register("weather", "misc", "scrapers.misc.weather:main", "google.com",
+         "Weather for a city from Google", unattended=False)
@@ -1,12 +1,18 @@
+import sys
+from pathlib import Path
 import requests
 from bs4 import BeautifulSoup
-import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from scrapers.utils.http import fetch
 
 def scrape_and_save_crypto_data():
     """
     Scrapes the top cryptocurrencies' data from CoinMarketCap
     and saves it to a CSV file.
     """
+    import pandas as pd
+
     url = 'https://coinmarketcap.com/'
     
     headers = {
@@ -14,7 +20,7 @@ def scrape_and_save_crypto_data():
     }
 
     try:
-        response = requests.get(url, headers=headers)
+        response = fetch(url, headers=headers)
         response.raise_for_status()
 
         soup = BeautifulSoup(response.content, 'html.parser')
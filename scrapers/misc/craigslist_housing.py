@@ -1,8 +1,11 @@
-import requests
 import csv
 import os
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from scrapers.utils.http import fetch
+
 API_URL = "https://sapi.craigslist.org/web/v8/postings/search/batch"
 PARAMS = {
     "batch": "86-0-1080-1-1-1760780280-1760959623",
@@ -21,48 +24,54 @@ HEADERS = {
                   "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/117.0.0.0 Safari/537.36"
 }
 
-print("📡 Fetching Craigslist housing data from API…")
-resp = requests.get(API_URL, params=PARAMS, headers=HEADERS)
-resp.raise_for_status()
-json_data = resp.json()
-
-items = json_data.get("data", {}).get("batch", [])
-print(f"🏠 Found {len(items)} housing listings")
-
-with open(CSV_FILE, "w", newline="", encoding="utf-8") as f:
-    writer = csv.writer(f)
-    writer.writerow(["ID", "Title", "Price", "Slug", "Link", "ImageURLs"])
-
-    for item in items:
-        # Basic fields
-        post_id = item[0] if len(item) > 0 else "N/A"
-        title = item[1] if len(item) > 1 else "N/A"
-
-        # Slug & link
-        slug = None
-        for entry in item:
-            if isinstance(entry, list) and len(entry) >= 2 and entry[0] == 6:
-                slug = entry[1]
-                break
-        link = f"https://delhi.craigslist.org/{slug}" if slug else "N/A"
-
-        # Price
-        price = None
-        for entry in item:
-            if isinstance(entry, list) and len(entry) >= 2 and entry[0] == 10:
-                price = entry[1]
-                break
-
-        # Images — safer
-        image_urls = []
-        if len(item) > 2 and isinstance(item[2], list):
-            for img_code in item[2]:
-                if isinstance(img_code, str):
-                    parts = img_code.split("_")
-                    img_id = parts[-1]
-                    image_urls.append(f"https://images.craigslist.org/{img_id}_300x300.jpg")
-        image_urls_str = ", ".join(image_urls)
-
-        writer.writerow([post_id, title, price or "N/A", slug or "N/A", link, image_urls_str])
-
-print(f"✅ Done — saved {CSV_FILE}")
+
+def main():
+    print("📡 Fetching Craigslist housing data from API…")
+    resp = fetch(API_URL, params=PARAMS, headers=HEADERS)
+    resp.raise_for_status()
+    json_data = resp.json()
+
+    items = json_data.get("data", {}).get("batch", [])
+    print(f"🏠 Found {len(items)} housing listings")
+
+    with open(CSV_FILE, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["ID", "Title", "Price", "Slug", "Link", "ImageURLs"])
+
+        for item in items:
+            # Basic fields
+            post_id = item[0] if len(item) > 0 else "N/A"
+            title = item[1] if len(item) > 1 else "N/A"
+
+            # Slug & link
+            slug = None
+            for entry in item:
+                if isinstance(entry, list) and len(entry) >= 2 and entry[0] == 6:
+                    slug = entry[1]
+                    break
+            link = f"https://delhi.craigslist.org/{slug}" if slug else "N/A"
+
+            # Price
+            price = None
+            for entry in item:
+                if isinstance(entry, list) and len(entry) >= 2 and entry[0] == 10:
+                    price = entry[1]
+                    break
+
+            # Images — safer
+            image_urls = []
+            if len(item) > 2 and isinstance(item[2], list):
+                for img_code in item[2]:
+                    if isinstance(img_code, str):
+                        parts = img_code.split("_")
+                        img_id = parts[-1]
+                        image_urls.append(f"https://images.craigslist.org/{img_id}_300x300.jpg")
+            image_urls_str = ", ".join(image_urls)
+
+            writer.writerow([post_id, title, price or "N/A", slug or "N/A", link, image_urls_str])
+
+    print(f"✅ Done — saved {CSV_FILE}")
+
+
+if __name__ == "__main__":
+    main()
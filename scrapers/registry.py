@@ -0,0 +1,123 @@
+"""Lazy registry of all scrapers.
+
+Each category package declares its scrapers in its ``__init__.py`` with
+``register()``: a name, the site it crawls and a ``module:function`` entry
+point. Listing or scheduling scrapers only imports those small package
+files; a scraper module (and whatever browser or pandas stack it needs) is
+imported only when that scraper is actually run.
+"""
+
+import importlib
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+CATEGORIES = {
+    "ecommerce": "E-commerce Websites",
+    "job_boards": "Job Boards",
+    "educational": "Educational Platforms",
+    "social_media": "Social Media & Developer Platforms",
+    "content": "Content & Media",
+    "misc": "Miscellaneous"
+}
+
+_registry: Dict[str, "ScraperSpec"] = {}
+
+
+@dataclass(frozen=True)
+class ScraperSpec:
+    """Metadata and lazy entry point for one scraper."""
+
+    name: str
+    category: str
+    entry: str
+    site: str
+    description: str = ""
+    unattended: bool = True
+
+    @property
+    def key(self) -> str:
+        """Unique '<category>/<name>' key."""
+        return f"{self.category}/{self.name}"
+
+    @property
+    def module(self) -> str:
+        """Dotted module path of the scraper."""
+        return self.entry.split(":", 1)[0]
+
+    def load(self) -> Callable[[], object]:
+        """
+        Import the scraper module and return its entry function.
+
+        Returns:
+            The callable named by ``entry``
+        """
+        module_name, _, func_name = self.entry.partition(":")
+        module = importlib.import_module(module_name)
+        return getattr(module, func_name or "main")
+
+    def run(self):
+        """Import and run the scraper."""
+        return self.load()()
+
+
+def register(name: str, category: str, entry: str, site: str, description: str = "",
+             unattended: bool = True) -> ScraperSpec:
+    """
+    Declare a scraper. Called from the category package's __init__.py.
+
+    Args:
+        name: Scraper name, usually the module name
+        category: Category directory name
+        entry: 'package.module:function' to call to run the scraper
+        site: Site the scraper crawls; scrapers sharing a site never run together
+        description: One-line description for listings
+        unattended: False if the scraper needs console input or an external host
+
+    Returns:
+        The registered spec
+    """
+    spec = ScraperSpec(name, category, entry, site, description, unattended)
+    _registry[spec.key] = spec
+    return spec
+
+
+def _load_categories() -> None:
+    for category in CATEGORIES:
+        importlib.import_module(f"scrapers.{category}")
+
+
+def all_scrapers(category: Optional[str] = None) -> List[ScraperSpec]:
+    """
+    Get registered scrapers without importing any scraper module.
+
+    Args:
+        category: Only return scrapers of this category
+
+    Returns:
+        Specs ordered by category, then name
+    """
+    _load_categories()
+    order = list(CATEGORIES)
+    specs = sorted(_registry.values(), key=lambda s: (order.index(s.category), s.name))
+    if category:
+        specs = [spec for spec in specs if spec.category == category]
+    return specs
+
+
+def get(name: str) -> ScraperSpec:
+    """
+    Look up a scraper by name or '<category>/<name>' key.
+
+    Args:
+        name: Scraper name or key
+
+    Returns:
+        The matching spec
+
+    Raises:
+        KeyError: If no scraper or more than one scraper matches
+    """
+    matches = [spec for spec in all_scrapers() if name in (spec.key, spec.name)]
+    if len(matches) != 1:
+        raise KeyError(name)
+    return matches[0]
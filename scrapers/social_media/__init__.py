@@ -1,2 +1,16 @@
 """Social media and developer platform scrapers."""
 
+from scrapers.registry import register
+
+register("github", "social_media", "scrapers.social_media.github:main", "github.com",
+         "Trending repositories from GitHub Explore")
+register("hackernews", "social_media", "scrapers.social_media.hackernews:main", "ycombinator.com",
+         "GitHub links on Hacker News front pages")
+register("reddit", "social_media", "scrapers.social_media.reddit:main", "reddit.com",
+         "Subreddit posts from the JSON listing API")
+register("stack_overflow", "social_media", "scrapers.social_media.stack_overflow:main", "stackoverflow.com",
+         "Stack Overflow questions by tag")
+register("youtube", "social_media", "scrapers.social_media.youtube:main", "youtube.com",
+         "YouTube search results (Selenium)")
+register("youtube_links", "social_media", "scrapers.social_media.youtube_links:main", "youtube.com",
+         "Video links from a YouTube search page")
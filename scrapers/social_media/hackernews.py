@@ -1,81 +1,114 @@
 # Import required packages (must be preinstalled on self-hosted n8n)
-import simplejson as json
+import json
 from bs4 import BeautifulSoup
 
-# Get the HTML content from the input
-html_content = items[0].get('json', {}).get('data', '')
+FIELDNAMES = ['Post', 'title', 'url', 'site', 'score', 'author', 'age', 'comments', 'hn_url']
 
-# Parse the HTML content
-soup = BeautifulSoup(html_content, 'html.parser')
 
-# Store metadata of GitHub posts
-github_posts = []
+def extract_github_posts(html_content):
+    """Extract GitHub submissions from a Hacker News listing page."""
+    # Parse the HTML content
+    soup = BeautifulSoup(html_content, 'html.parser')
 
-# Find all 'tr' elements with class 'athing submission'
-posts = soup.find_all('tr', class_='athing submission')
+    # Store metadata of GitHub posts
+    github_posts = []
 
-for post in posts:
-    post_id = post.get('id')
-    title_line = post.find('span', class_='titleline')
-    if not title_line:
-        continue
+    # Find all 'tr' elements with class 'athing submission'
+    posts = soup.find_all('tr', class_='athing submission')
 
-    # Extract the title and URL
-    title_tag = title_line.find('a')
-    if not title_tag:
-        continue
+    for post in posts:
+        post_id = post.get('id')
+        title_line = post.find('span', class_='titleline')
+        if not title_line:
+            continue
 
-    title = title_tag.get_text(strip=True)
-    url = title_tag.get('href', '')
+        # Extract the title and URL
+        title_tag = title_line.find('a')
+        if not title_tag:
+            continue
 
-    # Only include GitHub links
-    if 'github.com' not in url.lower():
-        continue
+        title = title_tag.get_text(strip=True)
+        url = title_tag.get('href', '')
 
-    # Extract the domain (optional)
-    site_bit = title_line.find('span', class_='sitebit comhead')
-    site = site_bit.find('span', class_='sitestr').get_text(strip=True) if site_bit else ''
+        # Only include GitHub links
+        if 'github.com' not in url.lower():
+            continue
 
-    # Get the 'subtext' row (next sibling row)
-    subtext_tr = post.find_next_sibling('tr')
-    if not subtext_tr:
-        continue
+        # Extract the domain (optional)
+        site_bit = title_line.find('span', class_='sitebit comhead')
+        site = site_bit.find('span', class_='sitestr').get_text(strip=True) if site_bit else ''
 
-    subtext_td = subtext_tr.find('td', class_='subtext')
-    if not subtext_td:
-        continue
+        # Get the 'subtext' row (next sibling row)
+        subtext_tr = post.find_next_sibling('tr')
+        if not subtext_tr:
+            continue
 
-    # Extract score, author, age, and comments
-    score_span = subtext_td.find('span', class_='score')
-    score = score_span.get_text(strip=True) if score_span else '0 points'
+        subtext_td = subtext_tr.find('td', class_='subtext')
+        if not subtext_td:
+            continue
 
-    author_a = subtext_td.find('a', class_='hnuser')
-    author = author_a.get_text(strip=True) if author_a else 'unknown'
+        # Extract score, author, age, and comments
+        score_span = subtext_td.find('span', class_='score')
+        score = score_span.get_text(strip=True) if score_span else '0 points'
 
-    age_span = subtext_td.find('span', class_='age')
-    age_a = age_span.find('a') if age_span else None
-    age = age_a.get_text(strip=True) if age_a else 'unknown'
+        author_a = subtext_td.find('a', class_='hnuser')
+        author = author_a.get_text(strip=True) if author_a else 'unknown'
 
-    comments_a_list = subtext_td.find_all('a')
-    comments_a = comments_a_list[-1] if comments_a_list else None
-    comments_text = comments_a.get_text(strip=True) if comments_a else '0 comments'
+        age_span = subtext_td.find('span', class_='age')
+        age_a = age_span.find('a') if age_span else None
+        age = age_a.get_text(strip=True) if age_a else 'unknown'
 
-    # Construct the Hacker News URL
-    hn_url = f"https://news.ycombinator.com/item?id={post_id}"
+        comments_a_list = subtext_td.find_all('a')
+        comments_a = comments_a_list[-1] if comments_a_list else None
+        comments_text = comments_a.get_text(strip=True) if comments_a else '0 comments'
 
-    # Store post metadata
-    post_metadata = {
-        'Post': post_id,
-        'title': title,
-        'url': url,
-        'site': site,
-        'score': score,
-        'author': author,
-        'age': age,
-        'comments': comments_text,
-        'hn_url': hn_url
-    }
+        # Construct the Hacker News URL
+        hn_url = f"https://news.ycombinator.com/item?id={post_id}"
 
-    print(post_metadata)
+        # Store post metadata
+        post_metadata = {
+            'Post': post_id,
+            'title': title,
+            'url': url,
+            'site': site,
+            'score': score,
+            'author': author,
+            'age': age,
+            'comments': comments_text,
+            'hn_url': hn_url
+        }
 
+        github_posts.append(post_metadata)
 
+    return github_posts
+
+
+def main(pages=1):
+    """Fetch Hacker News front pages and save their GitHub submissions to CSV."""
+    # Imported here so the module still runs standalone inside an n8n code node
+    from scrapers.utils import get_output_path
+    from scrapers.utils.http import fetch
+    from scrapers.utils.sinks import open_sink
+
+    path = get_output_path("hackernews_github.csv")
+    with open_sink(path, fieldnames=FIELDNAMES) as sink:
+        for page in range(1, pages + 1):
+            response = fetch("https://news.ycombinator.com/news", params={"p": page}, timeout=10)
+            response.raise_for_status()
+            sink.write_many(extract_github_posts(response.text))
+    print(f"Saved {sink.count} GitHub posts to {path}")
+
+
+# Inside n8n the input items are provided as a global
+if "items" in globals():
+    # Get the HTML content from the input
+    html_content = items[0].get('json', {}).get('data', '')
+
+    for post_metadata in extract_github_posts(html_content):
+        print(post_metadata)
+elif __name__ == "__main__":
+    import sys
+    from pathlib import Path
+
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+    main()
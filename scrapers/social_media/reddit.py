@@ -1,12 +1,31 @@
 
+import argparse
+import sys
+from pathlib import Path
+
 import requests
-import time
-import csv
-from datetime import datetime
 
-HEADERS = {
-    "User-Agent": "script:reddit-scraper:v1.0 (by /u/your_reddit_username)"
-}
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from scrapers.utils import get_output_path
+from scrapers.utils.http import enable_cache
+from scrapers.utils.sinks import open_sink
+from scrapers.social_media.reddit_api import (DEFAULT_WORKERS, RedditClient, crawl_listings,
+                                              extract_posts_from_listing, fetch_listing_page, scrape_listing)
+from scrapers.social_media.reddit_comments import COMMENT_FIELDS, iter_comments
+from scrapers.social_media.reddit_sync import FIRST_SYNC_POSTS, sync_subreddits
+
+FIELDNAMES = ["id", "title", "author", "score", "num_comments", "subreddit", "url", "permalink", "created_utc",
+              "selftext"]
+
+_client = None
+
+
+def get_client():
+    """Client shared by the module-level helpers, created on first use."""
+    global _client
+    if _client is None:
+        _client = RedditClient()
+    return _client
 
 
 def fetch_subreddit_json(subreddit, limit=100, after=None, sort='hot'):
@@ -14,73 +33,24 @@ def fetch_subreddit_json(subreddit, limit=100, after=None, sort='hot'):
     Fetch one page of subreddit listing in JSON.
     Returns (json_data, next_after)
     """
-    base = f"https://www.reddit.com/r/{subreddit}/{sort}.json"
-    params = {"limit": limit}
-    if after:
-        params["after"] = after
-    resp = requests.get(base, headers=HEADERS, params=params, timeout=10)
-    if resp.status_code == 429:
-        raise RuntimeError("Rate-limited (429). Back off before continuing.")
-    resp.raise_for_status()
-    j = resp.json()
-    next_after = j.get("data", {}).get("after")
-    return j, next_after
-
-def extract_posts_from_listing(json_data):
-    """Extract a list of post dicts from subreddit listing JSON.
-
-    Args:
-        json_data (dict): JSON response from Reddit listing endpoint.
+    return fetch_listing_page(get_client(), subreddit, sort=sort, limit=limit, after=after)
 
-    Returns:
-        list[dict]: List of simplified post dictionaries.
-    """
-    
-    posts = []
-    for child in json_data.get("data", {}).get("children", []):
-        d = child.get("data", {})
-        posts.append({
-            "id": d.get("id"),
-            "title": d.get("title"),
-            "author": d.get("author"),
-            "score": d.get("score"),
-            "num_comments": d.get("num_comments"),
-            "subreddit": d.get("subreddit"),
-            "url": d.get("url"),
-            "permalink": "https://www.reddit.com" + d.get("permalink") if d.get("permalink") else None,
-            "created_utc": datetime.utcfromtimestamp(d.get("created_utc")).isoformat() if d.get("created_utc") else None,
-            "selftext": d.get("selftext") or ""
-        })
-    return posts
-
-def scrape_subreddit(subreddit, max_posts=200, sleep_between_requests=1.5, sort='hot'):
+def scrape_subreddit(subreddit, max_posts=200, sleep_between_requests=None, sort='hot'):
     """Scrape up to max_posts from a subreddit.
 
     Uses pagination until max_posts are collected or no more pages exist.
+    Requests are paced by the quota Reddit reports, not by a fixed sleep.
 
     Args:
         subreddit (str): Subreddit name.
         max_posts (int): Maximum number of posts to return.
-        sleep_between_requests (float): Seconds to sleep between requests.
+        sleep_between_requests (float): Deprecated and ignored; kept for existing callers.
         sort (str): Listing type.
 
     Returns:
         list[dict]: Collected post dictionaries (length <= max_posts).
     """
-    all_posts = []
-    after = None
-    while len(all_posts) < max_posts:
-        remaining = max_posts - len(all_posts)
-        limit = min(100, remaining)
-        json_data, after = fetch_subreddit_json(subreddit, limit=limit, after=after, sort=sort)
-        posts = extract_posts_from_listing(json_data)
-        if not posts:
-            break
-        all_posts.extend(posts)
-        if not after:
-            break
-        time.sleep(sleep_between_requests)
-    return all_posts[:max_posts]
+    return scrape_listing(get_client(), subreddit, sort=sort, max_posts=max_posts)
 
 def save_to_csv(posts, filename="reddit_posts.csv"):
     """Write posts to CSV in ./output/ directory.
@@ -89,17 +59,103 @@ def save_to_csv(posts, filename="reddit_posts.csv"):
         posts (list[dict]): List of post dictionaries.
         filename (str): Output CSV filename (created under ./output/).
     """
-    
-    keys = ["id","title","author","score","num_comments","subreddit","url","permalink","created_utc","selftext"]
-    with open("./output/"+filename, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=keys)
-        writer.writeheader()
-        for p in posts:
-            writer.writerow(p)
 
-if __name__ == "__main__":
-    subreddit = "learnpython"   # This can be changed to any subreddit
-    posts = scrape_subreddit(subreddit, max_posts=250, sleep_between_requests=1.5, sort='hot')
-    print(f"Scraped {len(posts)} posts from r/{subreddit}")
-    save_to_csv(posts, f"reddit_{subreddit}_posts.csv")
+    with open_sink(get_output_path(filename), fieldnames=FIELDNAMES) as sink:
+        sink.write_many(posts)
+
+def scrape_subreddits(subreddits, sorts=('hot',), max_posts=250, workers=DEFAULT_WORKERS):
+    """Crawl several subreddits and sorts concurrently, one CSV per subreddit.
+
+    Posts found under several sorts of the same subreddit are written once.
+
+    Args:
+        subreddits (list[str]): Subreddit names.
+        sorts (list[str]): Listing types crawled for every subreddit.
+        max_posts (int): Maximum posts per subreddit and sort.
+        workers (int): Listings crawled at once.
+
+    Returns:
+        dict: Per subreddit, the ids of the posts written mapped to their comment counts.
+    """
+    client = get_client()
+    sinks, seen = {}, {}
+    try:
+        for (subreddit, sort), posts in crawl_listings(client, subreddits, sorts, max_posts, workers):
+            if subreddit not in sinks:
+                sinks[subreddit] = open_sink(output_file(subreddit), fieldnames=FIELDNAMES)
+                seen[subreddit] = {}
+            posts = posts or []
+            new = [p for p in posts if p["id"] not in seen[subreddit]]
+            seen[subreddit].update((p["id"], p["num_comments"]) for p in new)
+            sinks[subreddit].write_many(new)
+            print(f"✅ r/{subreddit}/{sort}: {len(posts)} posts ({len(new)} new)")
+    finally:
+        for sink in sinks.values():
+            sink.close()
+    print(f"📡 {client.requests} requests to Reddit")
+    return seen
+
+def scrape_comments(subreddit, posts, workers=DEFAULT_WORKERS):
+    """Stream the full comment trees of posts into the subreddit's comments CSV.
+
+    A post whose comments cannot be fetched (deleted, or still rate-limited
+    after the retries) is reported and skipped.
+
+    Args:
+        subreddit (str): Subreddit name.
+        posts (dict): Post id -> comment count; posts without comments are skipped.
+        workers (int): Collapsed branches expanded at once per post.
+
+    Returns:
+        int: Comments written.
+    """
+    client = get_client()
+    path = get_output_path(f"reddit_{subreddit}_comments.csv")
+    with open_sink(path, fieldnames=COMMENT_FIELDS) as sink:
+        for post_id, num_comments in posts.items():
+            if num_comments == 0:
+                continue
+            start = sink.count
+            try:
+                count = sink.write_many(iter_comments(client, post_id, workers=workers))
+            except (requests.RequestException, RuntimeError) as e:
+                print(f"❌ r/{subreddit} {post_id}: comments not fetched after {sink.count - start}: {e}")
+                continue
+            print(f"💬 r/{subreddit} {post_id}: {count} comments")
+    return sink.count
+
+def output_file(subreddit):
+    """CSV path of a subreddit's posts."""
+    return get_output_path(f"reddit_{subreddit}_posts.csv")
+
+def main():
+    """Crawl, or --sync, the given subreddits into one CSV each."""
+    parser = argparse.ArgumentParser(description="Scrape subreddit posts from the JSON listing API")
+    parser.add_argument("--subreddits", nargs="+", default=["learnpython"], help="subreddits to crawl")
+    parser.add_argument("--sorts", nargs="+", default=["hot"], help="listings per subreddit: hot, new, top, rising")
+    parser.add_argument("--max-posts", type=int, default=None,
+                        help=f"posts per subreddit and sort (default 250, or {FIRST_SYNC_POSTS} on a first --sync)")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="listings crawled at once")
+    parser.add_argument("--comments", action="store_true",
+                        help="also fetch the full comment tree of every post into reddit_<subreddit>_comments.csv")
+    parser.add_argument("--sync", action="store_true",
+                        help="fetch only posts newer than the last sync and upsert score/num_comments into the CSVs")
+    args = parser.parse_args()
+
+    if args.sync:
+        client = get_client()
+        sync_subreddits(client, args.subreddits, args.sorts, output_file, FIELDNAMES,
+                        max_posts=args.max_posts or FIRST_SYNC_POSTS, workers=args.workers)
+        print(f"📡 {client.requests} requests to Reddit")
+        return
+
+    enable_cache()
+    scraped = scrape_subreddits(args.subreddits, args.sorts, args.max_posts or 250, args.workers)
+    for subreddit, posts in scraped.items():
+        print(f"Scraped {len(posts)} posts from r/{subreddit}")
+        if args.comments:
+            print(f"Saved {scrape_comments(subreddit, posts, args.workers)} comments from r/{subreddit}")
     print("Saved to CSV.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+"""Reddit JSON API client that spends the advertised rate-limit quota and no more.
+
+Every Reddit response says how many requests are left in the current window
+(X-Ratelimit-Remaining) and how many seconds remain until it resets
+(X-Ratelimit-Reset). RedditClient feeds both into the shared per-host rate
+limiter after each response, so requests are spread evenly over the rest of
+the window, whether they come from one thread or from many crawling several
+subreddits at once. A 429 is retried once the advertised reset has passed.
+
+    client = RedditClient()
+    for (subreddit, sort), posts in crawl_listings(client, ["python", "learnpython"], ["hot", "new"]):
+        ...
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple
+
+from scrapers.utils.http import fetch
+from scrapers.utils.ratelimit import get_limiter, set_rate
+
+HOST = "www.reddit.com"
+BASE_URL = f"https://{HOST}"
+HEADERS = {
+    "User-Agent": "script:reddit-scraper:v1.0 (by /u/your_reddit_username)"
+}
+INITIAL_RATE = 1 / 1.5      # requests per second until the first response reports the quota
+MAX_RETRIES = 3             # 429 responses retried per request
+DEFAULT_WORKERS = 4         # listings crawled at once
+LISTING_CACHE_TTL = 5 * 60  # listings change quickly, revalidate after 5 minutes
+PAGE_LIMIT = 100            # most posts Reddit returns per listing page
+
+
+def utc_iso(timestamp) -> Optional[str]:
+    """Reddit's created_utc seconds as a naive UTC ISO timestamp, as the CSVs have always stored it."""
+    if not timestamp:
+        return None
+    return datetime.fromtimestamp(timestamp, timezone.utc).replace(tzinfo=None).isoformat()
+
+
+def _header_float(headers, name: str) -> Optional[float]:
+    try:
+        return float(headers[name])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+class RedditClient:
+    """GETs Reddit JSON endpoints paced by the X-Ratelimit headers."""
+
+    def __init__(self, headers: Optional[dict] = None, max_retries: int = MAX_RETRIES,
+                 initial_rate: float = INITIAL_RATE):
+        """
+        Create a client.
+
+        Args:
+            headers: Request headers; Reddit requires a descriptive User-Agent
+            max_retries: How often a 429 response is retried before giving up
+            initial_rate: Requests per second before the quota is known; ignored
+                if www.reddit.com already has a budget
+        """
+        self.headers = headers or HEADERS
+        self.max_retries = max_retries
+        self.requests = 0
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        # Seed the shared bucket only once; later clients keep the pace learned from the headers
+        set_rate(HOST, rate=initial_rate, keep_existing=True)
+
+    def _observe(self, resp) -> Optional[float]:
+        """Retune the shared limiter from a response's quota headers; returns seconds until reset."""
+        remaining = _header_float(resp.headers, "x-ratelimit-remaining")
+        reset_in = _header_float(resp.headers, "x-ratelimit-reset")
+        if remaining is None or reset_in is None:
+            return None
+        with self._lock:
+            in_flight = self._in_flight
+        get_limiter().spread(HOST, remaining, reset_in, in_flight=in_flight)
+        return reset_in
+
+    def get(self, path: str, params: Optional[dict] = None, cache_ttl: Optional[float] = None) -> dict:
+        """
+        GET a JSON endpoint, waiting out 429s.
+
+        Args:
+            path: Path under https://www.reddit.com, e.g. '/r/python/hot.json'
+            params: Query string parameters
+            cache_ttl: Override the response cache TTL (seconds) if the cache is enabled
+
+        Returns:
+            Decoded JSON
+
+        Raises:
+            RuntimeError: If Reddit still answers 429 after max_retries retries
+            requests.HTTPError: For other error responses
+        """
+        url = path if path.startswith("http") else BASE_URL + path
+        for attempt in range(self.max_retries + 1):
+            with self._lock:
+                self._in_flight += 1
+            try:
+                resp = fetch(url, headers=self.headers, params=params, timeout=10, cache_ttl=cache_ttl)
+            finally:
+                with self._lock:
+                    self._in_flight -= 1
+            if getattr(resp, "from_cache", False) and not getattr(resp, "revalidated", False):
+                return resp.json()
+            with self._lock:
+                self.requests += 1
+            reset_in = self._observe(resp)
+            if resp.status_code != 429:
+                resp.raise_for_status()
+                return resp.json()
+            if attempt == self.max_retries:
+                break
+            wait = reset_in or _header_float(resp.headers, "retry-after") or 2 ** attempt * 5
+            if reset_in is None:
+                bucket = get_limiter().bucket(HOST)
+                bucket.update(bucket.rate, wait=wait)
+            print(f"⏳ Rate-limited on {path}, retrying in {wait:.0f}s ({attempt + 1}/{self.max_retries})")
+        raise RuntimeError(f"Rate-limited (429) on {path} after {self.max_retries} retries")
+
+
+def extract_posts_from_listing(json_data):
+    """Extract a list of post dicts from subreddit listing JSON.
+
+    Args:
+        json_data (dict): JSON response from Reddit listing endpoint.
+
+    Returns:
+        list[dict]: List of simplified post dictionaries.
+    """
+
+    posts = []
+    for child in json_data.get("data", {}).get("children", []):
+        d = child.get("data", {})
+        posts.append({
+            "id": d.get("id"),
+            "title": d.get("title"),
+            "author": d.get("author"),
+            "score": d.get("score"),
+            "num_comments": d.get("num_comments"),
+            "subreddit": d.get("subreddit"),
+            "url": d.get("url"),
+            "permalink": "https://www.reddit.com" + d.get("permalink") if d.get("permalink") else None,
+            "created_utc": utc_iso(d.get("created_utc")),
+            "selftext": d.get("selftext") or ""
+        })
+    return posts
+
+
+def fetch_listing_page(client: RedditClient, subreddit: str, sort: str = "hot", limit: int = PAGE_LIMIT,
+                       after: Optional[str] = None) -> Tuple[dict, Optional[str]]:
+    """
+    Fetch one page of a subreddit listing.
+
+    Args:
+        client: RedditClient
+        subreddit: Subreddit name
+        sort: Listing type ('hot', 'new', 'top', ...)
+        limit: Posts per page (at most 100)
+        after: Fullname of the last post of the previous page
+
+    Returns:
+        (listing JSON, fullname to pass as ``after`` for the next page or None)
+    """
+    params = {"limit": limit}
+    if after:
+        params["after"] = after
+    data = client.get(f"/r/{subreddit}/{sort}.json", params=params, cache_ttl=LISTING_CACHE_TTL)
+    return data, data.get("data", {}).get("after")
+
+
+def scrape_listing(client: RedditClient, subreddit: str, sort: str = "hot", max_posts: int = 200) -> List[dict]:
+    """
+    Page through one listing until max_posts are collected or it runs out.
+
+    Args:
+        client: RedditClient
+        subreddit: Subreddit name
+        sort: Listing type
+        max_posts: Maximum number of posts to return
+
+    Returns:
+        Post dicts in listing order
+    """
+    posts, after = [], None
+    while len(posts) < max_posts:
+        data, after = fetch_listing_page(client, subreddit, sort, min(PAGE_LIMIT, max_posts - len(posts)), after)
+        page = extract_posts_from_listing(data)
+        if not page:
+            break
+        posts.extend(page)
+        if not after:
+            break
+    return posts[:max_posts]
+
+
+def crawl_listings(client: RedditClient, subreddits: Iterable[str], sorts: Iterable[str] = ("hot",),
+                   max_posts: int = 200, workers: int = DEFAULT_WORKERS,
+                   scrape: Callable = scrape_listing) -> Iterator[Tuple[Tuple[str, str], Any]]:
+    """
+    Crawl every (subreddit, sort) listing concurrently within the shared quota.
+
+    Pages of one listing are fetched in order (each needs the previous page's
+    cursor); different listings run in parallel threads and all of them draw
+    on the same rate limiter.
+
+    Args:
+        client: RedditClient
+        subreddits: Subreddit names
+        sorts: Listing types crawled for each subreddit
+        max_posts: Posts per listing
+        workers: Listings crawled at once
+        scrape: Called as scrape(client, subreddit, sort, max_posts) for each
+            listing; defaults to scrape_listing
+
+    Yields:
+        ((subreddit, sort), result of scrape) as listings finish; the result is
+        None for a listing that failed
+    """
+    listings = [(subreddit, sort) for subreddit in subreddits for sort in sorts]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(scrape, client, subreddit, sort, max_posts): (subreddit, sort)
+                   for subreddit, sort in listings}
+        for future in as_completed(futures):
+            listing = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                print(f"❌ Error on r/{listing[0]}/{listing[1]}: {e}")
+                result = None
+            yield listing, result
@@ -0,0 +1,157 @@
+"""Fetch whole Reddit comment trees and flatten them into rows as they arrive.
+
+A post's comment JSON only holds the first few hundred comments; the rest are
+collapsed into "more" stubs listing the ids of the hidden comments, and very
+deep branches end in "continue this thread" stubs. iter_comments() walks the
+tree iteratively, yields each comment as a flat row as soon as it is read, and
+expands the stubs through /api/morechildren (up to 100 ids per call) and the
+comment permalink endpoint. Those calls run concurrently in a small thread pool
+and all of them draw on the RedditClient's shared rate budget.
+
+Only the ids of comments already yielded and the queue of unexpanded stubs are
+kept, never the thread itself, so a post with thousands of comments costs
+little memory:
+
+    with open_sink(get_output_path("reddit_comments.csv"), fieldnames=COMMENT_FIELDS) as sink:
+        for post_id in post_ids:
+            sink.write_many(iter_comments(client, post_id))
+"""
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Iterable, Iterator, List
+
+import requests
+
+from scrapers.social_media.reddit_api import BASE_URL, DEFAULT_WORKERS, RedditClient, utc_iso
+
+COMMENT_FIELDS = ["id", "post_id", "parent_id", "depth", "author", "score", "created_utc", "permalink", "body"]
+MORE_BATCH = 100            # most comment ids /api/morechildren accepts per call
+COMMENT_LIMIT = 500         # comments requested with the post
+
+
+def comment_row(data: dict, post_id: str) -> dict:
+    """
+    Flatten one comment ('t1' thing) into a row.
+
+    Args:
+        data: The comment's 'data' object
+        post_id: Id of the post (without the 't3_' prefix)
+
+    Returns:
+        Row with the COMMENT_FIELDS columns
+    """
+    return {
+        "id": data.get("id"),
+        "post_id": post_id,
+        "parent_id": data.get("parent_id"),
+        "depth": data.get("depth"),
+        "author": data.get("author"),
+        "score": data.get("score"),
+        "created_utc": utc_iso(data.get("created_utc")),
+        "permalink": BASE_URL + data["permalink"] if data.get("permalink") else None,
+        "body": data.get("body") or "",
+    }
+
+
+class _Walker:
+    """Flattens comment things and queues the stubs that still need fetching."""
+
+    def __init__(self, post_id: str):
+        self.post_id = post_id
+        self.seen = set()             # ids of comments already yielded
+        self.more_ids: List[str] = []   # hidden comment ids from "more" stubs
+        self.threads: List[str] = []    # parent comment ids of "continue this thread" stubs
+        self.fetched_threads = set()  # thread ids already queued, so a repeated stub is not refetched
+        self.requested = set()        # "more" ids already queued; deleted comments come back unexpanded
+
+    def walk(self, things: Iterable[dict]) -> Iterator[dict]:
+        """Yield rows of the comments not seen yet, depth first, queueing the stubs met on the way."""
+        stack = list(things)
+        stack.reverse()
+        while stack:
+            thing = stack.pop()
+            kind, data = thing.get("kind"), thing.get("data") or {}
+            if kind == "more":
+                listed = data.get("children") or ()
+                children = [c for c in listed if c not in self.seen and c not in self.requested]
+                if children:
+                    self.requested.update(children)
+                    self.more_ids.extend(children)
+                elif not listed and str(data.get("parent_id", "")).startswith("t1_"):
+                    thread_id = data["parent_id"][3:]
+                    if thread_id not in self.fetched_threads:
+                        self.fetched_threads.add(thread_id)
+                        self.threads.append(thread_id)
+                continue
+            if kind != "t1":
+                continue
+            if data.get("id") not in self.seen:
+                self.seen.add(data.get("id"))
+                yield comment_row(data, self.post_id)
+            replies = data.get("replies")
+            if isinstance(replies, dict):
+                children = replies.get("data", {}).get("children", [])
+                stack.extend(reversed(children))
+
+
+def _listing_things(response) -> list:
+    """Comment things of a /comments/<id>.json response ([post listing, comment listing])."""
+    if isinstance(response, list) and len(response) > 1:
+        return response[1].get("data", {}).get("children", [])
+    return []
+
+
+def iter_comments(client: RedditClient, post_id: str, sort: str = "top",
+                  workers: int = DEFAULT_WORKERS) -> Iterator[dict]:
+    """
+    Yield every comment of a post as a flat row, expanding collapsed branches.
+
+    Args:
+        client: RedditClient
+        post_id: Post id, with or without the 't3_' prefix
+        sort: Comment sort ('top', 'new', 'best', ...)
+        workers: Stub expansions in flight at once
+
+    Yields:
+        Comment rows (COMMENT_FIELDS); parents come before their replies
+        within each fetched batch
+    """
+    post_id = post_id[3:] if post_id.startswith("t3_") else post_id
+    walker = _Walker(post_id)
+
+    def fetch_more(ids):
+        data = client.get("/api/morechildren.json", params={
+            "api_type": "json", "link_id": f"t3_{post_id}", "children": ",".join(ids),
+            "sort": sort, "raw_json": 1})
+        return data.get("json", {}).get("data", {}).get("things", [])
+
+    def fetch_thread(comment_id):
+        return _listing_things(client.get(f"/comments/{post_id}.json", params={
+            "comment": comment_id, "sort": sort, "limit": COMMENT_LIMIT, "raw_json": 1}))
+
+    first = client.get(f"/comments/{post_id}.json", params={"sort": sort, "limit": COMMENT_LIMIT, "raw_json": 1})
+    yield from walker.walk(_listing_things(first))
+    del first
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        in_flight = set()
+        while walker.more_ids or walker.threads or in_flight:
+            # Keep at most ``workers`` calls queued; the stubs wait as plain ids
+            while len(in_flight) < workers and (walker.more_ids or walker.threads):
+                if walker.more_ids:
+                    batch = [c for c in walker.more_ids[:MORE_BATCH] if c not in walker.seen]
+                    del walker.more_ids[:MORE_BATCH]
+                    if batch:
+                        in_flight.add(pool.submit(fetch_more, batch))
+                else:
+                    in_flight.add(pool.submit(fetch_thread, walker.threads.pop()))
+            if not in_flight:
+                continue
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    things = future.result()
+                except (requests.RequestException, RuntimeError, ValueError) as e:
+                    print(f"❌ Error expanding comments of {post_id}: {e}")
+                    continue
+                yield from walker.walk(things)
@@ -0,0 +1,224 @@
+"""Incremental Reddit sync: fetch only what changed since the last run.
+
+For every (subreddit, sort) listing the newest post seen so far (its fullname
+and created_utc) is saved as a cursor. A sync pages through the listing only
+until it reaches that cursor, which for an hourly run is usually the first
+page, instead of re-downloading the whole listing. The posts it did fetch are
+upserted into the subreddit's CSV: new posts are added, and for posts already
+on file only the fields that move (score, num_comments) are updated.
+
+    python scrapers/social_media/reddit.py --sync --subreddits learnpython python --sorts new hot
+"""
+
+import csv
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from scrapers.utils.checkpoint import default_checkpoint_path
+from scrapers.social_media.reddit_api import (DEFAULT_WORKERS, PAGE_LIMIT, RedditClient, crawl_listings,
+                                              extract_posts_from_listing, fetch_listing_page)
+
+UPDATED_FIELDS = ("score", "num_comments")   # fields refreshed on posts already on file
+FIRST_SYNC_POSTS = 1000                        # posts fetched per listing when there is no cursor yet
+
+
+class ListingCursors:
+    """Newest post seen per (subreddit, sort), kept in a JSON file between runs."""
+
+    def __init__(self, path=None):
+        """
+        Load the cursors.
+
+        Args:
+            path: JSON file, defaults to <project root>/.cache/checkpoints/reddit_cursors.json
+        """
+        self.path = Path(path) if path else default_checkpoint_path("reddit_cursors")
+        self.cursors: Dict[str, dict] = {}
+        if self.path.exists():
+            self.cursors = json.loads(self.path.read_text(encoding="utf-8"))
+
+    @staticmethod
+    def _key(subreddit: str, sort: str) -> str:
+        return f"{subreddit.lower()}/{sort}"
+
+    def get(self, subreddit: str, sort: str) -> Optional[dict]:
+        """
+        Cursor of one listing.
+
+        Args:
+            subreddit: Subreddit name
+            sort: Listing type
+
+        Returns:
+            {'fullname': 't3_...', 'created_utc': float, 'synced_at': ISO time}, or None before the first sync
+        """
+        return self.cursors.get(self._key(subreddit, sort))
+
+    def advance(self, subreddit: str, sort: str, newest: Optional[Tuple[str, float]]) -> None:
+        """
+        Move a listing's cursor forward to the newest post of a sync.
+
+        Args:
+            subreddit: Subreddit name
+            sort: Listing type
+            newest: (fullname, created_utc) of the newest post fetched, or None
+        """
+        key = self._key(subreddit, sort)
+        cursor = self.cursors.get(key)
+        if newest and (cursor is None or newest[1] > cursor["created_utc"]):
+            cursor = {"fullname": newest[0], "created_utc": newest[1]}
+        if cursor is not None:
+            cursor["synced_at"] = datetime.now(timezone.utc).isoformat(timespec="seconds")
+            self.cursors[key] = cursor
+
+    def save(self) -> None:
+        """Write the cursors atomically."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(self.cursors, indent=2), encoding="utf-8")
+        os.replace(tmp_path, self.path)
+
+
+def _reached(children: List[dict], cursor: dict) -> bool:
+    """True once a page shows the cursor post or nothing newer than it."""
+    posts = [child.get("data", {}) for child in children]
+    if any(post.get("name") == cursor["fullname"] for post in posts):
+        return True
+    fresh = [post for post in posts if not post.get("stickied")]
+    return all((post.get("created_utc") or 0) <= cursor["created_utc"] for post in fresh)
+
+
+def sync_listing(client: RedditClient, subreddit: str, sort: str, cursor: Optional[dict],
+                 max_posts: int = FIRST_SYNC_POSTS) -> Tuple[List[dict], Optional[Tuple[str, float]], int]:
+    """
+    Fetch a listing from the top until its cursor is reached.
+
+    Args:
+        client: RedditClient
+        subreddit: Subreddit name
+        sort: Listing type
+        cursor: The listing's cursor from ListingCursors.get(), or None to
+            fetch up to max_posts
+        max_posts: Upper bound on posts fetched
+
+    Returns:
+        (posts, (fullname, created_utc) of the newest post fetched or None, pages fetched)
+    """
+    posts, newest, pages, after = [], None, 0, None
+    while len(posts) < max_posts:
+        data, after = fetch_listing_page(client, subreddit, sort, PAGE_LIMIT, after)
+        pages += 1
+        children = data.get("data", {}).get("children", [])
+        for child in children:
+            post = child.get("data", {})
+            created = post.get("created_utc")
+            if post.get("name") and created and not post.get("stickied") and (newest is None or created > newest[1]):
+                newest = (post["name"], float(created))
+        posts.extend(extract_posts_from_listing(data))
+        if not children or not after or (cursor is not None and _reached(children, cursor)):
+            break
+    return posts[:max_posts], newest, pages
+
+
+def upsert_csv(path, posts: Iterable[dict], fieldnames: List[str], key: str = "id",
+               updated_fields: Iterable[str] = UPDATED_FIELDS) -> Tuple[int, int]:
+    """
+    Merge posts into a CSV: add unknown ones, refresh only updated_fields of known ones.
+
+    New posts are written first (newest first), followed by the existing rows
+    in their original order. The file is replaced atomically.
+
+    Args:
+        path: CSV file; created if missing
+        posts: Posts from the latest sync; a post listed under several sorts may
+            appear more than once, the last copy's updated_fields win
+        fieldnames: Column order for a new file
+        key: Column identifying a post
+        updated_fields: Columns refreshed on posts already on file
+
+    Returns:
+        (posts added, posts whose fields changed)
+    """
+    path = Path(path)
+    rows, index = [], {}
+    if path.exists():
+        with open(path, newline="", encoding="utf-8") as f:
+            reader = csv.DictReader(f)
+            fieldnames = reader.fieldnames or fieldnames
+            for row in reader:
+                index[row[key]] = len(rows)
+                rows.append(row)
+
+    added: Dict[str, dict] = {}   # key -> post; a post listed under several sorts is added once
+    changed = 0
+    for post in posts:
+        post_key = str(post[key])
+        if post_key in index:
+            row = rows[index[post_key]]
+            updates = {field: str(post[field]) for field in updated_fields
+                       if post.get(field) is not None and row.get(field) != str(post[field])}
+            if updates:
+                row.update(updates)
+                changed += 1
+        elif post_key in added:
+            added[post_key].update({field: post[field] for field in updated_fields if post.get(field) is not None})
+        else:
+            added[post_key] = dict(post)
+
+    if added or changed or not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
+            writer.writeheader()
+            writer.writerows(added.values())
+            writer.writerows(rows)
+        os.replace(tmp_path, path)
+    return len(added), changed
+
+
+def sync_subreddits(client: RedditClient, subreddits: Iterable[str], sorts: Iterable[str], output_path,
+                    fieldnames: List[str], cursors: Optional[ListingCursors] = None,
+                    max_posts: int = FIRST_SYNC_POSTS, workers: int = DEFAULT_WORKERS) -> Dict[str, Tuple[int, int]]:
+    """
+    Sync several listings concurrently and upsert each subreddit's CSV.
+
+    Args:
+        client: RedditClient
+        subreddits: Subreddit names
+        sorts: Listing types synced for each subreddit
+        output_path: Function mapping a subreddit name to its CSV path
+        fieldnames: Column order for new CSV files
+        cursors: Cursor store, defaults to ListingCursors()
+        max_posts: Upper bound on posts fetched per listing
+        workers: Listings synced at once
+
+    Returns:
+        Subreddit -> (posts added, posts updated)
+    """
+    cursors = cursors or ListingCursors()
+
+    def scrape(client, subreddit, sort, max_posts):
+        return sync_listing(client, subreddit, sort, cursors.get(subreddit, sort), max_posts)
+
+    fetched: Dict[str, List[dict]] = {}
+    advanced = []
+    for (subreddit, sort), result in crawl_listings(client, subreddits, sorts, max_posts, workers, scrape=scrape):
+        if result is None:
+            continue
+        posts, newest, pages = result
+        fetched.setdefault(subreddit, []).extend(posts)
+        advanced.append((subreddit, sort, newest))
+        print(f"🔄 r/{subreddit}/{sort}: {len(posts)} posts in {pages} request(s)")
+
+    results = {}
+    for subreddit, posts in fetched.items():
+        results[subreddit] = upsert_csv(output_path(subreddit), posts, fieldnames)
+        print(f"✅ r/{subreddit}: {results[subreddit][0]} new, {results[subreddit][1]} updated")
+    for subreddit, sort, newest in advanced:
+        cursors.advance(subreddit, sort, newest)
+    cursors.save()
+    return results
@@ -1,25 +1,49 @@
-import pandas as pd
-import requests
-from bs4 import BeautifulSoup
-import time
+import argparse
+import sys
+from pathlib import Path
 
-# Fetches and parses HTML content from a URL
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from scrapers.utils import get_output_path
+from scrapers.utils.http import fetch
+from scrapers.utils.pagination import iter_pages
+from scrapers.utils.parsing import parse_html
+from scrapers.utils.pipeline import fetch_and_parse
+from scrapers.utils.ratelimit import set_rate
+from scrapers.utils.sinks import open_sink
+
+HOST = "stackoverflow.com"
+HEADERS = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
+DEFAULT_TAGS = ["python", "javascript", "cpp"]
+REQUESTS_PER_SECOND = 0.8  # per-host cap shared by every thread, one request every 1.25 s
+FETCH_WORKERS = 4          # pages downloading at once, hiding latency within the rate cap
+PARSE_PROCESSES = 4        # question pages parsed at once, each in its own process
+FIELDNAMES = ['Question', 'Answer']
+
+set_rate(HOST, rate=REQUESTS_PER_SECOND)
+
+# Fetches and parses a listing page, keeping only the question links
 def get_soup(url):
-    time.sleep(1.5)
-    headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
-    response = requests.get(url, headers=headers, timeout=10)
-    return BeautifulSoup(response.text, "html.parser")
+    response = fetch(url, headers=HEADERS, timeout=10)
+    return parse_html(response.text, only="a.s-link")
 
-# Gets question links from BeautifulSoup object
+# Fetches the raw bytes of a question page (runs in the pipeline's fetch threads)
+def fetch_page(url):
+    response = fetch(url, headers=HEADERS, timeout=10)
+    response.raise_for_status()
+    return response.content
+
+# Gets question links from BeautifulSoup object, in page order without duplicates
 def extract_question_links(soup):
     links = []
+    seen = set()
     for link in soup.find_all("a", class_="s-link", href=True):
         href = link.get('href', '')
         if href.startswith('/questions/'):
             full_url = f"https://stackoverflow.com{href}"
             if '?' not in full_url:
                 full_url += "?answertab=votes#tab-top"
-            if full_url not in links:
+            if full_url not in seen:
+                seen.add(full_url)
                 links.append(full_url)
     return links
 
@@ -44,31 +68,64 @@ def extract_answers(soup):
                 answers.append(answer_text)
     return answers
 
-# Main scraping function
-def scrape_stackoverflow(tag, st_page, end_page):
-    all_questions = []
-    all_answers = []
-    question_urls = []
-    for page in range(st_page, end_page + 1):
-        url = f"https://stackoverflow.com/questions/tagged/{tag}?tab=votes&page={page}&pagesize=15"
-        soup = get_soup(url)
-        links = extract_question_links(soup)
-        question_urls.extend(links)
-        
-    for q_url in question_urls:
-        soup = get_soup(q_url)
-        question = extract_question(soup)
-        answers = extract_answers(soup)    
+# Question text and top answer of a parsed question page (runs in a worker process)
+def parse_question_page(soup):
+    answers = extract_answers(soup)
+    return extract_question(soup), answers[0] if answers else None
+
+# Listing page URL of one tag
+def listing_url(tag, page):
+    return f"https://stackoverflow.com/questions/tagged/{tag}?tab=votes&page={page}&pagesize=15"
+
+# Question links of one (tag, page) listing
+def listing_links(tag_page):
+    return extract_question_links(get_soup(listing_url(*tag_page)))
+
+# Maps every question URL listed under the tags to the tags listing it
+def collect_question_urls(tags, st_page, end_page):
+    question_tags = {}   # url -> tags; a question listed under several tags is crawled once
+    listings = [(tag, page) for tag in tags for page in range(st_page, end_page + 1)]
+    for (tag, page), links in iter_pages(listing_links, listings, concurrency=FETCH_WORKERS,
+                                         is_empty=lambda links: False):
+        for url in links:
+            question_tags.setdefault(url, []).append(tag)
+        print(f"📄 {tag} page {page}: {len(links)} questions ({len(question_tags)} unique so far)")
+    return question_tags
+
+# Crawls question pages concurrently, yielding (tags, row) as pages finish
+def crawl_questions(question_tags):
+    # Question pages download in threads while earlier ones are parsed in worker processes
+    for url, parsed in fetch_and_parse(question_tags, parse_question_page, fetch_body=fetch_page,
+                                       fetch_workers=FETCH_WORKERS, processes=PARSE_PROCESSES):
+        question, answer = parsed or (None, None)
         if question:
-            all_questions.append(question)
-            all_answers.append(answers[0] if answers else None)
-    
-    return all_questions, all_answers
-
-def save_to_csv(questions, answers, filename):
-    df = pd.DataFrame({'Question': questions, 'Answer': answers})
-    df.to_csv(filename, index=False, encoding='utf-8')
-    return df
-
-questions, answers = scrape_stackoverflow(tag="cpp", st_page=1, end_page=3)
-df = save_to_csv(questions, answers, "stackoverflow_cpp.csv")
\ No newline at end of file
+            yield question_tags[url], {'Question': question, 'Answer': answer}
+
+# Crawls several tags in one run, streaming each row into the CSV of every tag listing it
+def scrape_tags(tags, st_page, end_page):
+    question_tags = collect_question_urls(tags, st_page, end_page)
+    sinks = {tag: open_sink(get_output_path(f"stackoverflow_{tag}.csv"), fieldnames=FIELDNAMES) for tag in tags}
+    try:
+        for row_tags, row in crawl_questions(question_tags):
+            for tag in row_tags:
+                sinks[tag].write(row)
+    finally:
+        for sink in sinks.values():
+            sink.close()
+    for sink in sinks.values():
+        print(f"✅ {sink.count} questions saved to {sink.path}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Scrape top-voted Stack Overflow questions by tag")
+    parser.add_argument("--tags", nargs="+", default=DEFAULT_TAGS, help="tags crawled together in one run")
+    parser.add_argument("--start-page", type=int, default=1, help="first listing page of each tag")
+    parser.add_argument("--end-page", type=int, default=3, help="last listing page of each tag")
+    parser.add_argument("--rate", type=float, default=REQUESTS_PER_SECOND,
+                        help="requests per second to stackoverflow.com")
+    args = parser.parse_args()
+
+    set_rate(HOST, rate=args.rate)
+    scrape_tags(args.tags, args.start_page, args.end_page)
+
+if __name__ == "__main__":
+    main()
@@ -1,23 +1,33 @@
 from bs4 import BeautifulSoup  #Importing the Beautiful Soup Library
-import requests				   #Importing the requests library
+import sys					   #Importing the sys module
 import time					   #Importing the time library
 import csv					   #Importing the csv module
 import re
+from pathlib import Path
 
-response = requests.get('https://www.youtube.com/results?search_query=vicky+kaushal')
-soup = BeautifulSoup(response.text, 'lxml')
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from scrapers.utils.http import fetch
 
-links = soup.find_all('a')
-link, final_list = list() , list()
 
-for i in links:
-	if re.findall('watch',i.get('href')):
-		link.append('https://www.youtube.com' + i.get('href'))
+def main():
+	response = fetch('https://www.youtube.com/results?search_query=vicky+kaushal')
+	soup = BeautifulSoup(response.text, 'lxml')
 
+	links = soup.find_all('a')
+	link, final_list = list() , list()
 
-for i in link:
-	if i not in final_list:
-		final_list.append(i)
+	for i in links:
+		if re.findall('watch',i.get('href')):
+			link.append('https://www.youtube.com' + i.get('href'))
 
-for i in final_list:
-	print(i)
\ No newline at end of file
+
+	for i in link:
+		if i not in final_list:
+			final_list.append(i)
+
+	for i in final_list:
+		print(i)
+
+
+if __name__ == "__main__":
+	main()
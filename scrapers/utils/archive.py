@@ -0,0 +1,225 @@
+"""WARC-style raw response archive and parallel re-extraction.
+
+Every response fetched while the archive is enabled is appended to a gzip
+compressed WARC 1.0 file (one gzip member per record, so the file is only ever
+appended to). When a selector breaks, the fixed parse function can be rerun
+over the archive on all cores instead of re-crawling the site:
+
+    python scrapers/content/books_toscrape.py --reextract
+"""
+
+import gzip
+import json
+import os
+import threading
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+
+from scrapers.utils import get_project_root
+
+# Response headers that describe the wire encoding, not the stored (decoded) body
+_DROP_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection"}
+
+
+def default_archive_path(name: str) -> Path:
+    """
+    Get the archive file used for a scraper (<project root>/archive/<name>.warc.gz).
+
+    Args:
+        name: Scraper name, e.g. 'books_toscrape'
+
+    Returns:
+        Path to the archive file
+    """
+    archive_dir = get_project_root() / "archive"
+    archive_dir.mkdir(exist_ok=True)
+    return archive_dir / f"{name}.warc.gz"
+
+
+class ArchivedResponse:
+    """A response read back from an archive."""
+
+    def __init__(self, url: str, date: str, status: int, headers: dict, body: bytes):
+        self.url = url
+        self.date = date
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+    @property
+    def text(self) -> str:
+        """Body decoded with the charset from Content-Type (UTF-8 if missing)."""
+        content_type = self.headers.get("content-type", "")
+        charset = "utf-8"
+        if "charset=" in content_type:
+            charset = content_type.split("charset=", 1)[1].split(";")[0].strip() or charset
+        return self.body.decode(charset, errors="replace")
+
+    def json(self):
+        """Body parsed as JSON."""
+        return json.loads(self.body)
+
+
+_path_locks = {}
+_path_locks_guard = threading.Lock()
+
+
+def _path_lock(path: Path) -> threading.Lock:
+    """One lock per archive file, so writers replacing each other never interleave records."""
+    key = str(path.resolve())
+    with _path_locks_guard:
+        return _path_locks.setdefault(key, threading.Lock())
+
+
+class WarcWriter:
+    """Thread-safe append-only writer for gzip-compressed WARC records."""
+
+    def __init__(self, path):
+        """
+        Open an archive for appending.
+
+        Args:
+            path: Archive file, created if missing
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = _path_lock(self.path)
+        self._file = None
+
+    def write_response(self, response) -> None:
+        """
+        Append one response record.
+
+        Args:
+            response: requests.Response whose body has been read
+        """
+        body = response.content or b""
+        status_line = f"HTTP/1.1 {response.status_code} {response.reason or ''}".rstrip()
+        header_lines = [f"{k}: {v}" for k, v in response.headers.items() if k.lower() not in _DROP_HEADERS]
+        header_lines.append(f"Content-Length: {len(body)}")
+        http_block = ("\r\n".join([status_line] + header_lines) + "\r\n\r\n").encode("utf-8") + body
+
+        warc_headers = [
+            "WARC/1.0",
+            "WARC-Type: response",
+            f"WARC-Record-ID: <urn:uuid:{uuid.uuid4()}>",
+            f"WARC-Date: {datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')}",
+            f"WARC-Target-URI: {response.url}",
+            "Content-Type: application/http;msgtype=response",
+            f"Content-Length: {len(http_block)}",
+        ]
+        record = ("\r\n".join(warc_headers) + "\r\n\r\n").encode("utf-8") + http_block + b"\r\n\r\n"
+        member = gzip.compress(record)
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, "ab")
+            self._file.write(member)
+            self._file.flush()
+
+    def close(self) -> None:
+        """Wait for a record being written to finish, then close the file."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+def _parse_http_block(block: bytes):
+    head, _, body = block.partition(b"\r\n\r\n")
+    lines = head.decode("utf-8", errors="replace").split("\r\n")
+    parts = lines[0].split(" ", 2)
+    status = int(parts[1]) if len(parts) > 1 and parts[1].isdigit() else 0
+    headers = {}
+    for line in lines[1:]:
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+    return status, headers, body
+
+
+def iter_records(path, url_filter: Optional[Callable[[str], bool]] = None) -> Iterator[ArchivedResponse]:
+    """
+    Read response records from an archive in the order they were written.
+
+    Args:
+        path: Archive file
+        url_filter: Optional predicate on the target URL
+
+    Yields:
+        ArchivedResponse objects
+    """
+    with gzip.open(path, "rb") as f:
+        while True:
+            line = f.readline()
+            if not line:
+                return
+            if not line.startswith(b"WARC/"):
+                continue
+            warc_headers = {}
+            for header in iter(f.readline, b"\r\n"):
+                if not header:
+                    return
+                name, _, value = header.decode("utf-8", errors="replace").partition(":")
+                warc_headers[name.strip().lower()] = value.strip()
+            block = f.read(int(warc_headers.get("content-length", 0)))
+            f.read(4)  # record separator
+            if warc_headers.get("warc-type") != "response":
+                continue
+            url = warc_headers.get("warc-target-uri", "")
+            if url_filter and not url_filter(url):
+                continue
+            status, headers, body = _parse_http_block(block)
+            yield ArchivedResponse(url, warc_headers.get("warc-date", ""), status, headers, body)
+
+
+def _decode(record: ArchivedResponse, decode: str):
+    if decode == "html":
+        from scrapers.utils.parsing import parse_html
+        return parse_html(record.body)
+    if decode == "json":
+        return record.json()
+    if decode == "text":
+        return record.text
+    return record
+
+
+def _run_parse(task):
+    parse, decode, record = task
+    return record.url, parse(_decode(record, decode))
+
+
+def reextract(path, parse: Callable, decode: str = "html", url_filter: Optional[Callable[[str], bool]] = None,
+              processes: Optional[int] = None, chunksize: int = 4, latest_only: bool = True) -> Iterator:
+    """
+    Rerun a parse function over every archived response using all cores.
+
+    Args:
+        path: Archive file
+        parse: Module-level function taking the decoded page (it is pickled
+            to the worker processes)
+        decode: 'html' (BeautifulSoup), 'json', 'text' or 'raw' (ArchivedResponse)
+        url_filter: Optional predicate selecting which URLs to parse
+        processes: Worker processes, defaults to the number of cores
+        chunksize: Records sent to a worker at a time
+        latest_only: Parse only the newest copy of a URL fetched by several runs;
+            the archive is read twice so only record positions stay in memory
+
+    Yields:
+        (url, parse result) tuples in archive order
+    """
+    if latest_only:
+        # First pass keeps only the position of each URL's newest record, not the records
+        latest = {}
+        for index, record in enumerate(iter_records(path, url_filter)):
+            if 200 <= record.status < 300:
+                latest[record.url] = index
+        keep = set(latest.values())
+        del latest
+        records = (record for index, record in enumerate(iter_records(path, url_filter)) if index in keep)
+    else:
+        records = (record for record in iter_records(path, url_filter) if 200 <= record.status < 300)
+    tasks = ((parse, decode, record) for record in records)
+    with ProcessPoolExecutor(max_workers=processes or os.cpu_count()) as pool:
+        yield from pool.map(_run_parse, tasks, chunksize=chunksize)
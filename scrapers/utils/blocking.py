@@ -0,0 +1,186 @@
+"""Request blocking for browser-driven scrapers.
+
+The browser scrapers only read text, yet a normal page load also downloads
+images, fonts, video and a dozen analytics scripts. BlockRules describes what
+to drop (by resource type, by domain and by URL regex) and the helpers below
+install those rules on a Playwright page or a Selenium Chrome driver:
+
+    await block_resources_async(page)          # Playwright, async API
+    block_resources(page)                      # Playwright, sync API
+    block_resources_selenium(driver)           # Selenium + Chrome (via CDP)
+
+Stylesheets are allowed by default because several scrapers rely on layout
+(scroll height, visibility) to detect when lazy-loaded cards have arrived.
+"""
+
+import re
+from typing import Iterable, List, Optional
+
+DEFAULT_BLOCKED_TYPES = ("image", "media", "font")
+
+DEFAULT_BLOCKED_DOMAINS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "googlesyndication.com",
+    "googleadservices.com",
+    "doubleclick.net",
+    "facebook.net",
+    "hotjar.com",
+    "clarity.ms",
+    "criteo.com",
+    "taboola.com",
+    "scorecardresearch.com",
+    "nr-data.net",
+    "newrelic.com",
+    "segment.io",
+    "mixpanel.com",
+    "amplitude.com",
+)
+
+DEFAULT_BLOCKED_PATTERNS = (
+    r"\.(?:png|jpe?g|gif|webp|avif|svg|ico|bmp)(?:\?|$)",
+    r"\.(?:woff2?|ttf|otf|eot)(?:\?|$)",
+    r"\.(?:mp4|webm|m3u8|mp3|ogg)(?:\?|$)",
+)
+
+# File extensions standing in for resource types where only URLs can be matched (Selenium)
+_TYPE_EXTENSIONS = {
+    "image": ("png", "jpg", "jpeg", "gif", "webp", "avif", "svg", "ico", "bmp"),
+    "font": ("woff", "woff2", "ttf", "otf", "eot"),
+    "media": ("mp4", "webm", "m3u8", "mp3", "ogg"),
+    "stylesheet": ("css",),
+}
+
+
+class BlockRules:
+    """What to block, plus counters of what was blocked."""
+
+    def __init__(self, resource_types: Iterable[str] = DEFAULT_BLOCKED_TYPES,
+                 domains: Iterable[str] = DEFAULT_BLOCKED_DOMAINS,
+                 patterns: Iterable[str] = DEFAULT_BLOCKED_PATTERNS):
+        """
+        Build a rule set.
+
+        Args:
+            resource_types: Playwright resource types to drop ('image', 'media', 'font', 'stylesheet'...)
+            domains: Hosts to drop, subdomains included
+            patterns: Regular expressions matched against the full URL
+        """
+        self.resource_types = frozenset(resource_types)
+        self.domains = tuple(domain.lower().lstrip(".") for domain in domains)
+        self.patterns = [re.compile(pattern, re.I) for pattern in patterns]
+        self._pattern = re.compile("|".join(f"(?:{p.pattern})" for p in self.patterns), re.I) \
+            if self.patterns else None
+        self.blocked = 0
+        self.allowed = 0
+
+    def _blocked_host(self, url: str) -> bool:
+        host = url.split("://", 1)[-1].split("/", 1)[0].split(":", 1)[0].lower()
+        return any(host == domain or host.endswith("." + domain) for domain in self.domains)
+
+    def blocks(self, url: str, resource_type: Optional[str] = None) -> bool:
+        """
+        Decide whether a request should be dropped, and count it.
+
+        Args:
+            url: Request URL
+            resource_type: Playwright resource type, if known
+
+        Returns:
+            True if the request should be aborted
+        """
+        blocked = (
+            (resource_type is not None and resource_type in self.resource_types)
+            or self._blocked_host(url)
+            or (self._pattern is not None and self._pattern.search(url) is not None)
+        )
+        if blocked:
+            self.blocked += 1
+        else:
+            self.allowed += 1
+        return blocked
+
+    def url_wildcards(self) -> List[str]:
+        """
+        Approximate the rules with the '*' wildcards Chrome's Network.setBlockedURLs accepts.
+
+        Resource types become file extensions and domains become host wildcards;
+        regular expressions cannot be expressed this way and are skipped.
+
+        Returns:
+            List of URL wildcard patterns
+        """
+        wildcards = []
+        for resource_type in sorted(self.resource_types):
+            for ext in _TYPE_EXTENSIONS.get(resource_type, ()):
+                wildcards.extend([f"*.{ext}", f"*.{ext}?*"])
+        for domain in self.domains:
+            wildcards.extend([f"*://{domain}/*", f"*.{domain}/*"])
+        return wildcards
+
+
+async def block_resources_async(page, rules: Optional[BlockRules] = None) -> BlockRules:
+    """
+    Install blocking on a Playwright page (async API). Fits browser.map_pages(setup_page=...).
+
+    Args:
+        page: Playwright async Page or BrowserContext
+        rules: Rules to apply, defaults to BlockRules()
+
+    Returns:
+        The rules, whose counters show how much was blocked
+    """
+    rules = rules or BlockRules()
+
+    async def handle(route):
+        request = route.request
+        if rules.blocks(request.url, request.resource_type):
+            await route.abort()
+        else:
+            await route.continue_()
+
+    await page.route("**/*", handle)
+    return rules
+
+
+def block_resources(page, rules: Optional[BlockRules] = None) -> BlockRules:
+    """
+    Install blocking on a Playwright page (sync API).
+
+    Args:
+        page: Playwright sync Page or BrowserContext
+        rules: Rules to apply, defaults to BlockRules()
+
+    Returns:
+        The rules, whose counters show how much was blocked
+    """
+    rules = rules or BlockRules()
+
+    def handle(route):
+        request = route.request
+        if rules.blocks(request.url, request.resource_type):
+            route.abort()
+        else:
+            route.continue_()
+
+    page.route("**/*", handle)
+    return rules
+
+
+def block_resources_selenium(driver, rules: Optional[BlockRules] = None) -> bool:
+    """
+    Install blocking on a Selenium Chrome/Chromium driver through the DevTools protocol.
+
+    Args:
+        driver: Selenium WebDriver
+        rules: Rules to apply, defaults to BlockRules()
+
+    Returns:
+        True if blocking was installed, False if the driver has no DevTools access
+    """
+    if not hasattr(driver, "execute_cdp_cmd"):
+        return False
+    rules = rules or BlockRules()
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": rules.url_wildcards()})
+    return True
@@ -0,0 +1,271 @@
+"""Pool of Playwright browser contexts for the JavaScript-heavy job boards.
+
+One Chromium process is launched and ``contexts`` isolated contexts (separate
+cookies and storage, one tab each) take pages from a shared work list, so the
+time spent waiting on JavaScript rendering overlaps across pages:
+
+    for url, html in map_pages(load_listing, urls, contexts=6):
+        ...
+
+``visit`` is a coroutine ``visit(page, item)`` using the async Playwright API.
+Results are handed back as pages finish, not in input order; a page whose
+visit raised comes back as ``(item, None)``.
+
+scroll_until_loaded() / scroll_until_loaded_async() replace fixed
+scroll-and-sleep loops on infinite-scroll listings: after each scroll they
+wait only until new cards appear or no request is in flight, and stop once
+two scrolls in a row bring in nothing.
+"""
+
+import asyncio
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, Iterator, List, Optional, Tuple
+
+DEFAULT_CONTEXTS = 4
+
+DEFAULT_LAUNCH_ARGS = [
+    "--disable-blink-features=AutomationControlled",
+    "--disable-dev-shm-usage",
+    "--no-sandbox",
+]
+
+DEFAULT_SCROLL_TIMEOUT = 5.0   # longest wait for new items after one scroll, seconds
+DEFAULT_NETWORK_QUIET = 0.5    # no new requests for this long means the scroll loaded nothing more
+DEFAULT_IDLE_SCROLLS = 2       # stop after this many scrolls in a row add no items
+
+_COUNT_JS = "selector => document.querySelectorAll(selector).length"
+_SCROLL_JS = "window.scrollTo(0, document.body.scrollHeight)"
+_POLL_INTERVAL = 100  # ms between checks while waiting after a scroll
+
+DEFAULT_CONTEXT_OPTIONS = {
+    "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+                  "AppleWebKit/537.36 (KHTML, like Gecko) "
+                  "Chrome/120.0.0.0 Safari/537.36",
+    "viewport": {"width": 1920, "height": 1080},
+}
+
+
+async def map_pages_async(visit: Callable[[Any, Any], Awaitable], items: Iterable,
+                          contexts: int = DEFAULT_CONTEXTS, headless: bool = True,
+                          launch_args: Optional[List[str]] = None, context_options: Optional[dict] = None,
+                          setup_page: Optional[Callable[[Any], Awaitable]] = None) -> AsyncIterator[Tuple[Any, Any]]:
+    """
+    Visit items with a pool of browser contexts inside one browser.
+
+    Args:
+        visit: Coroutine function called as visit(page, item)
+        items: Work items (URLs, page numbers...)
+        contexts: Number of contexts working in parallel
+        headless: Run Chromium without a window
+        launch_args: Chromium command line flags, defaults to DEFAULT_LAUNCH_ARGS
+        context_options: Options for browser.new_context, defaults to DEFAULT_CONTEXT_OPTIONS
+        setup_page: Optional coroutine function called once on every new page
+
+    Yields:
+        (item, result) tuples as pages finish
+    """
+    from playwright.async_api import async_playwright
+
+    items = list(items)
+    if not items:
+        return
+    todo = asyncio.Queue()
+    for item in items:
+        todo.put_nowait(item)
+    results = asyncio.Queue()
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=headless, args=launch_args or DEFAULT_LAUNCH_ARGS)
+
+        async def worker():
+            context = await browser.new_context(**(context_options or DEFAULT_CONTEXT_OPTIONS))
+            try:
+                page = await context.new_page()
+                if setup_page:
+                    await setup_page(page)
+                while not todo.empty():
+                    item = todo.get_nowait()
+                    try:
+                        result = await visit(page, item)
+                    except Exception as e:
+                        print(f"❌ Error on {item}: {e}")
+                        result = None
+                    await results.put((item, result))
+            finally:
+                await context.close()
+
+        workers = {asyncio.ensure_future(worker()) for _ in range(min(contexts, len(items)))}
+        try:
+            remaining = len(items)
+            while remaining:
+                getter = asyncio.ensure_future(results.get())
+                await asyncio.wait([getter, *workers], return_when=asyncio.FIRST_COMPLETED)
+                if getter.done():
+                    remaining -= 1
+                    yield getter.result()
+                    continue
+                getter.cancel()
+                for task in [task for task in workers if task.done()]:
+                    workers.discard(task)
+                    task.result()  # re-raise a context that failed to start
+                if not workers and results.empty():
+                    return
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            await browser.close()
+
+
+def map_pages(visit: Callable[[Any, Any], Awaitable], items: Iterable, contexts: int = DEFAULT_CONTEXTS,
+              headless: bool = True, launch_args: Optional[List[str]] = None,
+              context_options: Optional[dict] = None,
+              setup_page: Optional[Callable[[Any], Awaitable]] = None) -> Iterator[Tuple[Any, Any]]:
+    """
+    Synchronous wrapper around map_pages_async for plain scripts.
+
+    Args:
+        visit: Coroutine function called as visit(page, item)
+        items: Work items
+        contexts: Number of contexts working in parallel
+        headless: Run Chromium without a window
+        launch_args: Chromium command line flags
+        context_options: Options for browser.new_context
+        setup_page: Optional coroutine function called once on every new page
+
+    Yields:
+        (item, result) tuples as pages finish
+    """
+    loop = asyncio.new_event_loop()
+    agen = map_pages_async(visit, items, contexts=contexts, headless=headless, launch_args=launch_args,
+                           context_options=context_options, setup_page=setup_page)
+    try:
+        while True:
+            try:
+                yield loop.run_until_complete(agen.__anext__())
+            except StopAsyncIteration:
+                break
+    finally:
+        loop.run_until_complete(agen.aclose())
+        loop.close()
+
+
+class _NetworkTracker:
+    """Counts in-flight requests of a page and when the network was last busy."""
+
+    def __init__(self, page):
+        self.page = page
+        self.inflight = 0
+        self.last_activity = time.monotonic()
+        page.on("request", self._started)
+        page.on("requestfinished", self._ended)
+        page.on("requestfailed", self._ended)
+
+    def _started(self, request):
+        self.inflight += 1
+        self.last_activity = time.monotonic()
+
+    def _ended(self, request):
+        self.inflight = max(0, self.inflight - 1)
+        self.last_activity = time.monotonic()
+
+    def mark(self):
+        """Restart the quiet period, e.g. right after a scroll that may trigger a load."""
+        self.last_activity = time.monotonic()
+
+    def is_quiet(self, quiet: float) -> bool:
+        return self.inflight == 0 and time.monotonic() - self.last_activity >= quiet
+
+    def detach(self):
+        self.page.remove_listener("request", self._started)
+        self.page.remove_listener("requestfinished", self._ended)
+        self.page.remove_listener("requestfailed", self._ended)
+
+
+async def scroll_until_loaded_async(page, item_selector: str, max_scrolls: int = 15,
+                                    timeout: float = DEFAULT_SCROLL_TIMEOUT, quiet: float = DEFAULT_NETWORK_QUIET,
+                                    idle_scrolls: int = DEFAULT_IDLE_SCROLLS) -> List[int]:
+    """
+    Scroll an infinite-scroll listing until it stops growing (async Playwright API).
+
+    After each scroll it waits until more items match, the page has had no
+    request in flight for ``quiet`` seconds since the scroll, or ``timeout``
+    runs out.
+
+    Args:
+        page: Playwright async Page
+        item_selector: CSS selector matching one listing card
+        max_scrolls: Upper bound on scrolls
+        timeout: Longest wait for new items after one scroll, seconds
+        quiet: Network quiet period that ends the wait early, seconds
+        idle_scrolls: Stop after this many scrolls in a row add nothing
+
+    Returns:
+        Number of new items each scroll brought in
+    """
+    network = _NetworkTracker(page)
+    try:
+        count = await page.evaluate(_COUNT_JS, item_selector)
+        per_scroll, idle = [], 0
+        for _ in range(max_scrolls):
+            await page.evaluate(_SCROLL_JS)
+            network.mark()
+            deadline = time.monotonic() + timeout
+            new_count = count
+            while True:
+                await page.wait_for_timeout(_POLL_INTERVAL)
+                new_count = await page.evaluate(_COUNT_JS, item_selector)
+                if new_count > count or network.is_quiet(quiet) or time.monotonic() >= deadline:
+                    break
+            per_scroll.append(new_count - count)
+            idle = 0 if new_count > count else idle + 1
+            count = new_count
+            if idle >= idle_scrolls:
+                break
+        return per_scroll
+    finally:
+        network.detach()
+
+
+def scroll_until_loaded(page, item_selector: str, max_scrolls: int = 15, timeout: float = DEFAULT_SCROLL_TIMEOUT,
+                        quiet: float = DEFAULT_NETWORK_QUIET, idle_scrolls: int = DEFAULT_IDLE_SCROLLS) -> List[int]:
+    """
+    Scroll an infinite-scroll listing until it stops growing (sync Playwright API).
+
+    After each scroll it waits until more items match, the page has had no
+    request in flight for ``quiet`` seconds since the scroll, or ``timeout``
+    runs out.
+
+    Args:
+        page: Playwright sync Page
+        item_selector: CSS selector matching one listing card
+        max_scrolls: Upper bound on scrolls
+        timeout: Longest wait for new items after one scroll, seconds
+        quiet: Network quiet period that ends the wait early, seconds
+        idle_scrolls: Stop after this many scrolls in a row add nothing
+
+    Returns:
+        Number of new items each scroll brought in
+    """
+    network = _NetworkTracker(page)
+    try:
+        count = page.evaluate(_COUNT_JS, item_selector)
+        per_scroll, idle = [], 0
+        for _ in range(max_scrolls):
+            page.evaluate(_SCROLL_JS)
+            network.mark()  # quiet is measured from the scroll, not from earlier traffic
+            deadline = time.monotonic() + timeout
+            new_count = count
+            while True:
+                page.wait_for_timeout(_POLL_INTERVAL)  # also lets Playwright deliver request events
+                new_count = page.evaluate(_COUNT_JS, item_selector)
+                if new_count > count or network.is_quiet(quiet) or time.monotonic() >= deadline:
+                    break
+            per_scroll.append(new_count - count)
+            idle = 0 if new_count > count else idle + 1
+            count = new_count
+            if idle >= idle_scrolls:
+                break
+        return per_scroll
+    finally:
+        network.detach()
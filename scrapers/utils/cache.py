@@ -0,0 +1,243 @@
+"""Persistent on-disk HTTP response cache with conditional revalidation.
+
+Responses are stored in a small SQLite database keyed by method, final URL
+and the request headers that change what a server sends back. A fresh entry
+(younger than the TTL) is served without touching the network. A stale entry
+is revalidated with ``If-None-Match``/``If-Modified-Since`` so unchanged
+pages come back as a cheap 304. The store is bounded in size and evicts the
+least recently used entries first.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from scrapers.utils import get_project_root
+
+DEFAULT_TTL = 6 * 60 * 60              # seconds an entry is served without revalidation
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024  # total body size kept on disk
+
+# Request headers that select a different representation of the same URL
+KEY_HEADERS = ("Accept", "Accept-Language", "Authorization")
+
+# Response headers that no longer apply once the body has been decoded
+_DROP_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection"}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    status INTEGER NOT NULL,
+    headers TEXT NOT NULL,
+    body BLOB NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    stored_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at);
+"""
+
+
+def default_cache_dir() -> Path:
+    """
+    Get the default cache directory (<project root>/.cache/http).
+
+    Returns:
+        Path to the cache directory
+    """
+    return get_project_root() / ".cache" / "http"
+
+
+def cache_key(method: str, url: str, headers) -> str:
+    """
+    Build the cache key for a request.
+
+    Args:
+        method: HTTP method
+        url: Final URL including the query string
+        headers: Effective request headers
+
+    Returns:
+        Hex digest identifying the request
+    """
+    parts = [method.upper(), url]
+    for name in KEY_HEADERS:
+        parts.append(f"{name.lower()}={headers.get(name, '')}")
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+class CachedEntry:
+    """A stored response plus its validators."""
+
+    def __init__(self, row):
+        self.key, self.url, self.status, headers, self.body, self.etag, self.last_modified, \
+            self.stored_at = row
+        self.headers = json.loads(headers)
+
+    def is_fresh(self, ttl: float) -> bool:
+        """
+        Check whether the entry can be served without revalidation.
+
+        Args:
+            ttl: Freshness lifetime in seconds
+
+        Returns:
+            True if younger than ttl
+        """
+        return time.time() - self.stored_at < ttl
+
+    def validators(self) -> dict:
+        """
+        Conditional request headers for revalidating this entry.
+
+        Returns:
+            Dict with If-None-Match and/or If-Modified-Since
+        """
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_response(self, not_modified: Optional[requests.Response] = None) -> requests.Response:
+        """
+        Rebuild a requests.Response so scrapers can use it unchanged.
+
+        Args:
+            not_modified: The 304 response that revalidated this entry, if any;
+                its headers (e.g. rate-limit quotas) replace the stored ones
+
+        Returns:
+            Response carrying the cached body, with ``from_cache`` set, and
+            ``revalidated`` set when not_modified was given
+        """
+        resp = requests.Response()
+        resp.status_code = self.status
+        resp.reason = "OK"
+        resp.url = self.url
+        resp.headers = CaseInsensitiveDict(self.headers)
+        if not_modified is not None:
+            resp.headers.update({k: v for k, v in not_modified.headers.items() if k.lower() not in _DROP_HEADERS})
+        resp.encoding = get_encoding_from_headers(resp.headers)
+        resp._content = self.body  # pylint: disable=protected-access
+        resp.from_cache = True
+        resp.revalidated = not_modified is not None
+        return resp
+
+
+class ResponseCache:
+    """SQLite-backed response store with TTL and size-bounded LRU eviction."""
+
+    def __init__(self, path: Optional[Path] = None, ttl: float = DEFAULT_TTL,
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Open (or create) a cache.
+
+        Args:
+            path: Directory holding the database, defaults to default_cache_dir()
+            ttl: Seconds an entry is served without revalidation
+            max_bytes: Upper bound on the total stored body size
+        """
+        directory = Path(path) if path else default_cache_dir()
+        directory.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(directory / "responses.sqlite"), check_same_thread=False)
+        self._db.executescript(_SCHEMA)
+        self._total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def get(self, key: str) -> Optional[CachedEntry]:
+        """
+        Look up an entry and mark it as recently used.
+
+        Args:
+            key: Cache key from cache_key()
+
+        Returns:
+            The entry, or None on a miss
+        """
+        with self._lock:
+            row = self._db.execute(
+                "SELECT key, url, status, headers, body, etag, last_modified, stored_at "
+                "FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            self._db.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (time.time(), key))
+            self._db.commit()
+        return CachedEntry(row)
+
+    def store(self, key: str, response: requests.Response) -> None:
+        """
+        Store a successful response, evicting old entries if over budget.
+
+        Args:
+            key: Cache key from cache_key()
+            response: Response with status 200
+        """
+        if "no-store" in response.headers.get("Cache-Control", ""):
+            return
+        body = response.content
+        if len(body) > self.max_bytes:
+            return
+        headers = {k: v for k, v in response.headers.items() if k.lower() not in _DROP_HEADERS}
+        now = time.time()
+        with self._lock:
+            old = self._db.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, url, status, headers, body, etag, last_modified, stored_at, accessed_at, size) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, response.url, response.status_code, json.dumps(headers), body,
+                 response.headers.get("ETag"), response.headers.get("Last-Modified"), now, now, len(body)))
+            self._total += len(body) - (old[0] if old else 0)
+            self._evict()
+            self._db.commit()
+
+    def touch(self, key: str) -> None:
+        """
+        Mark an entry as revalidated (after a 304) so its TTL starts over.
+
+        Args:
+            key: Cache key from cache_key()
+        """
+        now = time.time()
+        with self._lock:
+            self._db.execute("UPDATE responses SET stored_at = ?, accessed_at = ? WHERE key = ?", (now, now, key))
+            self._db.commit()
+
+    def _evict(self) -> None:
+        while self._total > self.max_bytes:
+            rows = self._db.execute(
+                "SELECT key, size FROM responses ORDER BY accessed_at LIMIT 64").fetchall()
+            if not rows:
+                self._total = 0
+                return
+            for key, size in rows:
+                self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._total -= size
+                if self._total <= self.max_bytes:
+                    return
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._db.execute("DELETE FROM responses")
+            self._db.commit()
+            self._total = 0
+
+    def close(self) -> None:
+        """Close the underlying database."""
+        with self._lock:
+            self._db.close()
@@ -0,0 +1,176 @@
+"""Capture the JSON API responses behind browser-rendered pages.
+
+Sites like Naukri render their listings from XHR/fetch calls. Instead of
+waiting for the DOM, serializing it with ``page.content()`` and re-parsing it,
+a JsonCapture records those responses through Playwright's response events
+and hands back the decoded payloads:
+
+    with JsonCapture(page, lambda url: "/jobapi/" in url) as capture:
+        page.goto(url)
+        capture.wait(timeout=10)
+        for payload in capture.payloads():
+            ...
+
+Both Playwright APIs are supported; use wait_async()/payloads_async() with
+the async one. find_records() and pick() help map payloads of undocumented
+APIs whose exact shape is not known up front.
+"""
+
+import time
+from typing import Any, Callable, Iterator, List, Sequence
+
+DEFAULT_CAPTURE_TIMEOUT = 10.0  # seconds to wait for the first matching response
+_POLL_INTERVAL = 100            # ms between checks while waiting
+
+_API_RESOURCE_TYPES = ("xhr", "fetch")
+
+
+class JsonCapture:
+    """Records JSON XHR/fetch responses of one page whose URL passes a filter."""
+
+    def __init__(self, page, url_filter: Callable[[str], bool]):
+        """
+        Start listening for responses.
+
+        Args:
+            page: Playwright Page (sync or async API)
+            url_filter: Predicate selecting the API URLs to keep
+        """
+        self.page = page
+        self.url_filter = url_filter
+        self.responses = []
+        page.on("response", self._on_response)
+
+    def _on_response(self, response) -> None:
+        if response.request.resource_type not in _API_RESOURCE_TYPES:
+            return
+        if "json" not in response.headers.get("content-type", ""):
+            return
+        if self.url_filter(response.url):
+            self.responses.append(response)
+
+    def wait(self, timeout: float = DEFAULT_CAPTURE_TIMEOUT) -> bool:
+        """
+        Wait until at least one response has been captured (sync API).
+
+        Args:
+            timeout: Seconds to wait
+
+        Returns:
+            True if something was captured
+        """
+        deadline = time.monotonic() + timeout
+        while not self.responses and time.monotonic() < deadline:
+            self.page.wait_for_timeout(_POLL_INTERVAL)
+        return bool(self.responses)
+
+    async def wait_async(self, timeout: float = DEFAULT_CAPTURE_TIMEOUT) -> bool:
+        """
+        Wait until at least one response has been captured (async API).
+
+        Args:
+            timeout: Seconds to wait
+
+        Returns:
+            True if something was captured
+        """
+        deadline = time.monotonic() + timeout
+        while not self.responses and time.monotonic() < deadline:
+            await self.page.wait_for_timeout(_POLL_INTERVAL)
+        return bool(self.responses)
+
+    def _take(self) -> list:
+        responses, self.responses = self.responses, []
+        return responses
+
+    def payloads(self) -> List[Any]:
+        """
+        Decode and clear the captured responses (sync API).
+
+        Returns:
+            Decoded JSON bodies; responses whose body is gone or invalid are skipped
+        """
+        payloads = []
+        for response in self._take():
+            try:
+                payloads.append(response.json())
+            except Exception:
+                continue
+        return payloads
+
+    async def payloads_async(self) -> List[Any]:
+        """
+        Decode and clear the captured responses (async API).
+
+        Returns:
+            Decoded JSON bodies; responses whose body is gone or invalid are skipped
+        """
+        payloads = []
+        for response in self._take():
+            try:
+                payloads.append(await response.json())
+            except Exception:
+                continue
+        return payloads
+
+    def detach(self) -> None:
+        """Stop listening."""
+        self.page.remove_listener("response", self._on_response)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.detach()
+
+
+def pick(record: dict, *paths: str, default: Any = None) -> Any:
+    """
+    Return the first non-empty value among dotted key paths.
+
+    Args:
+        record: Decoded JSON object
+        *paths: Candidate paths such as 'company.name'
+        default: Value when none of the paths is present
+
+    Returns:
+        The value found, or default
+    """
+    for path in paths:
+        value = record
+        for key in path.split("."):
+            if not isinstance(value, dict):
+                value = None
+                break
+            value = value.get(key)
+        if value not in (None, "", [], {}):
+            return value
+    return default
+
+
+def find_records(payload: Any, keys: Sequence[str], min_matches: int = 2) -> Iterator[dict]:
+    """
+    Find the objects in a payload that look like records of interest.
+
+    Walks the JSON iteratively and yields every dict having at least
+    ``min_matches`` of ``keys``. Matching dicts are not searched further.
+
+    Args:
+        payload: Decoded JSON
+        keys: Key names typical of the records (e.g. 'title', 'companyName')
+        min_matches: How many of those keys a dict needs
+
+    Yields:
+        Matching dicts in document order
+    """
+    wanted = set(keys)
+    stack = [payload]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            if len(wanted.intersection(node)) >= min_matches:
+                yield node
+                continue
+            stack.extend(reversed(list(node.values())))
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
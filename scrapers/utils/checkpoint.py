@@ -0,0 +1,147 @@
+"""Durable checkpoints for long paginated crawls.
+
+A checkpoint is a small JSON file recording which pages are done, where the
+crawl should continue (the frontier), the dedup keys seen so far and how many
+bytes of output were written when the last page finished. It is rewritten
+atomically after every completed page, so a crash or Ctrl+C leaves the last
+good state on disk and ``--resume`` picks up from there:
+
+    checkpoint = Checkpoint(default_checkpoint_path("naukri_jobs"), resume=args.resume)
+    append = checkpoint.restore_output(filename)
+    with open_sink(filename, fieldnames=headers, append=append) as sink:
+        checkpoint.track(sink)
+        sink.write_many(scrape(checkpoint=checkpoint))
+
+Output written after the last checkpoint is cut off on resume, so the rows of
+a half-finished page are not duplicated when that page is crawled again.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Iterable, List, Optional
+
+from scrapers.utils import get_project_root
+
+
+def default_checkpoint_path(name: str) -> Path:
+    """
+    Get the checkpoint file used for a scraper (<project root>/.cache/checkpoints/<name>.json).
+
+    Args:
+        name: Scraper name, e.g. 'naukri_jobs'
+
+    Returns:
+        Path to the checkpoint file
+    """
+    return get_project_root() / ".cache" / "checkpoints" / f"{name}.json"
+
+
+class Checkpoint:
+    """Crawl progress that survives restarts."""
+
+    def __init__(self, path, resume: bool = False):
+        """
+        Open a checkpoint.
+
+        Args:
+            path: Checkpoint file
+            resume: Load the saved state; otherwise any old checkpoint is discarded
+        """
+        self.path = Path(path)
+        self.done = set()        # pages (numbers or URLs) that completed
+        self.seen = set()        # dedup keys of rows already written
+        self.frontier: List[Any] = []
+        self.last_page = None
+        self.output_bytes = None
+        self.resumed = False
+        self._sink = None
+        if resume and self.path.exists():
+            state = json.loads(self.path.read_text(encoding="utf-8"))
+            self.done = set(state.get("done", []))
+            self.seen = set(state.get("seen", []))
+            self.frontier = state.get("frontier", [])
+            self.last_page = state.get("last_page")
+            self.output_bytes = state.get("output_bytes")
+            self.resumed = True
+        elif not resume:
+            self.clear()
+
+    def track(self, sink) -> None:
+        """
+        Flush this sink before every save and remember its size.
+
+        Args:
+            sink: RowSink the crawl writes to
+        """
+        self._sink = sink
+
+    def restore_output(self, path) -> bool:
+        """
+        Prepare the output file for a resumed crawl.
+
+        Args:
+            path: Output file of the crawl
+
+        Returns:
+            True if the crawl should append to the file (cut back to the size
+            at the last commit, possibly 0), False to start it afresh
+        """
+        path = Path(path)
+        if not self.resumed or self.output_bytes is None:
+            # Nothing was committed yet, so whatever is on disk belongs to another run
+            return False
+        if not path.exists():
+            if self.output_bytes:
+                print(f"⚠️ {path} is missing; rows from the {len(self.done)} finished pages are lost")
+            return False
+        if path.stat().st_size > self.output_bytes:
+            with open(path, "r+b") as f:
+                f.truncate(self.output_bytes)
+        return True
+
+    def pending(self, pages: Iterable) -> list:
+        """
+        Filter out pages that are already done.
+
+        Args:
+            pages: All pages of the crawl in order
+
+        Returns:
+            Pages still to crawl
+        """
+        return [page for page in pages if page not in self.done]
+
+    def commit(self, page=None, frontier: Optional[list] = None) -> None:
+        """
+        Record a finished page and write the checkpoint to disk.
+
+        Args:
+            page: Page number or URL that just completed
+            frontier: Where the crawl continues, e.g. remaining URLs or the next page URL
+        """
+        if page is not None:
+            self.done.add(page)
+            self.last_page = page
+        if frontier is not None:
+            self.frontier = [item for item in frontier if item not in self.done]
+        if self._sink is not None:
+            self._sink.flush()
+            if self._sink.path.exists():
+                self.output_bytes = self._sink.path.stat().st_size
+        state = {
+            "last_page": self.last_page,
+            "done": sorted(self.done, key=str),
+            "frontier": self.frontier,
+            "seen": sorted(self.seen),
+            "output_bytes": self.output_bytes,
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(state), encoding="utf-8")
+        os.replace(tmp_path, self.path)
+
+    def clear(self) -> None:
+        """Delete the checkpoint file, e.g. once the crawl has completed."""
+        if self.path.exists():
+            self.path.unlink()
@@ -0,0 +1,155 @@
+"""Pull listing cards out of a live page with one in-page script call.
+
+Instead of serializing the whole DOM (``page.content()`` / ``page_source``)
+and rebuilding it with BeautifulSoup, or asking Selenium for every field of
+every card in a separate round trip, one JavaScript function runs in the page
+and returns only the requested fields of each card as a small JSON array:
+
+    fields = {
+        "title": text("h2.jobTitle span"),
+        "company": text("[data-testid='company-name']"),
+        "link": attr("h2.jobTitle a", "href"),
+        "tags": texts("ul.tags li"),
+    }
+    cards = extract_cards(page, "div.job_seen_beacon", fields)
+
+Text is the element's text nodes (outside <script>/<style>), each stripped and
+joined with single spaces, the same string BeautifulSoup's
+``get_text(" ", strip=True)`` gives with whitespace collapsed; attributes are
+returned as written in the HTML (relative links stay relative). A missing element gives
+None, or an empty list for texts().
+"""
+
+from typing import Dict, List, Optional
+
+_EXTRACT_JS = """
+(spec) => {
+    const clean = (el) => {
+        // Join the text nodes with spaces like get_text(" ", strip=True); textContent
+        // would glue <span>Pune</span><span>3 yrs</span> into "Pune3 yrs"
+        const walker = document.createTreeWalker(el, NodeFilter.SHOW_TEXT);
+        const parts = [];
+        for (let node = walker.nextNode(); node; node = walker.nextNode()) {
+            const tag = node.parentNode && node.parentNode.nodeName;
+            if (tag === "SCRIPT" || tag === "STYLE") continue;
+            const part = node.nodeValue.trim();
+            if (part) parts.push(part);
+        }
+        return parts.join(" ").replace(/\\s+/g, " ");
+    };
+    const read = (card, field) => {
+        if (field.kind === "texts") {
+            const els = field.selector ? card.querySelectorAll(field.selector) : [card];
+            return Array.from(els, clean).filter(t => t && (!field.max_len || t.length <= field.max_len));
+        }
+        const el = field.selector ? card.querySelector(field.selector) : card;
+        if (!el) return null;
+        return field.kind === "attr" ? el.getAttribute(field.name) : clean(el);
+    };
+    let cards = Array.from(document.querySelectorAll(spec.cards));
+    if (spec.limit) cards = cards.slice(0, spec.limit);
+    const names = Object.keys(spec.fields);
+    return cards.map(card => {
+        const row = {};
+        for (const name of names) row[name] = read(card, spec.fields[name]);
+        return row;
+    });
+}
+"""
+
+_SELENIUM_JS = f"return ({_EXTRACT_JS})(arguments[0]);"
+
+
+def text(selector: Optional[str] = None) -> dict:
+    """
+    Field: text of the first element matching selector inside the card.
+
+    Args:
+        selector: CSS selector relative to the card; None for the card itself
+
+    Returns:
+        Field spec for extract_cards()
+    """
+    return {"kind": "text", "selector": selector}
+
+
+def attr(selector: Optional[str], name: str) -> dict:
+    """
+    Field: an attribute of the first element matching selector inside the card.
+
+    Args:
+        selector: CSS selector relative to the card; None for the card itself
+        name: Attribute name, e.g. 'href'
+
+    Returns:
+        Field spec for extract_cards()
+    """
+    return {"kind": "attr", "selector": selector, "name": name}
+
+
+def texts(selector: str, max_len: Optional[int] = None) -> dict:
+    """
+    Field: texts of all elements matching selector inside the card, in document order.
+
+    Args:
+        selector: CSS selector relative to the card
+        max_len: Skip texts longer than this (e.g. whole sub-sections)
+
+    Returns:
+        Field spec for extract_cards()
+    """
+    return {"kind": "texts", "selector": selector, "max_len": max_len}
+
+
+def _spec(card_selector: str, fields: Dict[str, dict], limit: Optional[int]) -> dict:
+    return {"cards": card_selector, "fields": fields, "limit": limit}
+
+
+def extract_cards(page, card_selector: str, fields: Dict[str, dict], limit: Optional[int] = None) -> List[dict]:
+    """
+    Extract fields from every card on a page (sync Playwright API).
+
+    Args:
+        page: Playwright sync Page
+        card_selector: CSS selector matching one card
+        fields: Mapping of output key to text()/attr()/texts() spec
+        limit: Only the first this many cards
+
+    Returns:
+        One dict per card, in document order
+    """
+    return page.evaluate(_EXTRACT_JS, _spec(card_selector, fields, limit))
+
+
+async def extract_cards_async(page, card_selector: str, fields: Dict[str, dict],
+                              limit: Optional[int] = None) -> List[dict]:
+    """
+    Extract fields from every card on a page (async Playwright API).
+
+    Args:
+        page: Playwright async Page
+        card_selector: CSS selector matching one card
+        fields: Mapping of output key to text()/attr()/texts() spec
+        limit: Only the first this many cards
+
+    Returns:
+        One dict per card, in document order
+    """
+    return await page.evaluate(_EXTRACT_JS, _spec(card_selector, fields, limit))
+
+
+def extract_cards_selenium(driver, card_selector: str, fields: Dict[str, dict],
+                           limit: Optional[int] = None) -> List[dict]:
+    """
+    Extract fields from every card on a page (Selenium WebDriver).
+
+    Args:
+        driver: Selenium WebDriver
+        card_selector: CSS selector matching one card
+        fields: Mapping of output key to text()/attr()/texts() spec
+        limit: Only the first this many cards
+
+    Returns:
+        One dict per card, in document order
+    """
+    return driver.execute_script(_SELENIUM_JS, _spec(card_selector, fields, limit)) or []
@@ -0,0 +1,209 @@
+"""Find place names in free text with an Aho-Corasick automaton.
+
+A Gazetteer holds place names and their aliases (Bangalore -> Bengaluru,
+Gurgaon -> Gurugram) and finds every one of them in a single pass over the
+text, however many names it holds, instead of trying one regex per place:
+
+    places = default_gazetteer()
+    places.find("Delivery boy - Koramangala, Bangalore")   # 'Koramangala'
+    [m.canonical for m in places.find_all("Gurgaon / Noida")]  # ['Gurugram', 'Noida']
+
+Matching ignores case and only accepts whole words. Where names overlap the
+longest one wins ("Navi Mumbai" over "Mumbai"). The automaton comes from
+pyahocorasick when it is installed (pip install pyahocorasick) and from a
+small pure-Python implementation otherwise.
+
+The default place list is data/india_places.txt: one place per line, the
+canonical name first and its aliases after it, separated by '|'.
+"""
+
+from collections import deque
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+try:
+    import ahocorasick
+except ImportError:  # optional speed-up
+    ahocorasick = None
+
+DEFAULT_PLACES_FILE = Path(__file__).resolve().parent / "data" / "india_places.txt"
+
+
+class PlaceMatch(NamedTuple):
+    """One place name found in a text."""
+    start: int
+    end: int
+    text: str        # as written in the text
+    canonical: str   # canonical name of the place
+
+
+class _Automaton:
+    """Pure-Python Aho-Corasick automaton over lowercase keys."""
+
+    def __init__(self):
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.out: List[list] = [[]]   # values of the keys ending in each state
+
+    def add_word(self, key: str, value: str) -> None:
+        state = 0
+        for char in key:
+            nxt = self.goto[state].get(char)
+            if nxt is None:
+                nxt = len(self.goto)
+                self.goto[state][char] = nxt
+                self.goto.append({})
+                self.fail.append(0)
+                self.out.append([])
+            state = nxt
+        self.out[state] = [value]
+
+    def make_automaton(self) -> None:
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, nxt in self.goto[state].items():
+                queue.append(nxt)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                target = self.goto[fallback].get(char, 0)
+                self.fail[nxt] = target if target != nxt else 0
+                self.out[nxt] = self.out[nxt] + self.out[self.fail[nxt]]
+
+    def iter(self, text: str):
+        """Yield (end index, value) for every key occurrence, like pyahocorasick."""
+        goto, fail, out = self.goto, self.fail, self.out
+        state = 0
+        for i, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for value in out[state]:
+                yield i, value
+
+
+def _lower(text: str) -> str:
+    """Lowercase without changing the length, so match offsets map back to the text."""
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    return "".join(c if len(c.lower()) != 1 else c.lower() for c in text)
+
+
+class Gazetteer:
+    """Place names and aliases compiled into one automaton."""
+
+    def __init__(self, places: Iterable[Tuple[str, Iterable[str]]] = ()):
+        """
+        Build a gazetteer.
+
+        Args:
+            places: (canonical name, aliases) pairs; the canonical name is matched too
+        """
+        self._names: Dict[str, str] = {}
+        for canonical, aliases in places:
+            self.add(canonical, aliases)
+        self._automaton = None
+
+    def add(self, canonical: str, aliases: Iterable[str] = ()) -> None:
+        """
+        Add a place (rebuilds the automaton on the next search).
+
+        Args:
+            canonical: Name reported for the place
+            aliases: Other spellings that should match it
+        """
+        for name in (canonical, *aliases):
+            key = " ".join(_lower(name).split())
+            if key:
+                self._names[key] = canonical
+        self._automaton = None
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    @classmethod
+    def from_file(cls, path) -> "Gazetteer":
+        """
+        Load a place list: one place per line, 'Canonical|Alias|Alias', '#' starts a comment.
+
+        Args:
+            path: Text file in UTF-8
+
+        Returns:
+            Gazetteer with those places
+        """
+        places = []
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                line = line.split("#", 1)[0].strip()
+                if line:
+                    names = [name.strip() for name in line.split("|") if name.strip()]
+                    places.append((names[0], names[1:]))
+        return cls(places)
+
+    def _build(self):
+        automaton = ahocorasick.Automaton() if ahocorasick else _Automaton()
+        for key, canonical in self._names.items():
+            automaton.add_word(key, (len(key), canonical))
+        automaton.make_automaton()
+        return automaton
+
+    def find_all(self, text: str) -> List[PlaceMatch]:
+        """
+        Find all place names in a text.
+
+        Args:
+            text: Text to search
+
+        Returns:
+            Non-overlapping whole-word matches in text order, longest first where they overlap
+        """
+        if not text or not self._names:
+            return []
+        if self._automaton is None:
+            self._automaton = self._build()
+        lowered = _lower(text)
+        candidates = []
+        for end, hit in self._automaton.iter(lowered):
+            length, canonical = hit
+            start = end - length + 1
+            if start > 0 and lowered[start - 1].isalnum():
+                continue
+            if end + 1 < len(lowered) and lowered[end + 1].isalnum():
+                continue
+            candidates.append((start, -length, canonical))
+        matches, covered = [], 0
+        for start, neg_length, canonical in sorted(candidates):
+            if start < covered:
+                continue
+            end = start - neg_length
+            matches.append(PlaceMatch(start, end, text[start:end], canonical))
+            covered = end
+        return matches
+
+    def find(self, text: str) -> Optional[str]:
+        """
+        Canonical name of the first place mentioned in a text.
+
+        Args:
+            text: Text to search
+
+        Returns:
+            Canonical name, or None if no place is mentioned
+        """
+        matches = self.find_all(text)
+        return matches[0].canonical if matches else None
+
+
+@lru_cache(maxsize=None)
+def default_gazetteer() -> Gazetteer:
+    """
+    The Indian cities, towns and localities of data/india_places.txt, loaded once.
+
+    Returns:
+        Shared Gazetteer
+    """
+    return Gazetteer.from_file(DEFAULT_PLACES_FILE)
@@ -0,0 +1,323 @@
+"""Shared HTTP fetch engine for the requests-based scrapers.
+
+Every scraper goes through one pooled ``requests.Session`` so connections to a
+host are kept alive and reused across pages instead of paying a new TCP/TLS
+handshake per request. Timeouts, pool sizes and default headers are tuned here
+in one place, and requests (retries included) to every host with a budget
+are paced by the shared per-host rate limiter.
+When the on-disk response cache is enabled, GET requests are answered from it
+or revalidated against it before anything is downloaded again. When the raw
+archive is enabled, every downloaded response is also appended to it.
+"""
+
+import threading
+import time
+from typing import Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from scrapers.utils.archive import WarcWriter
+from scrapers.utils.cache import ResponseCache, cache_key
+from scrapers.utils.ratelimit import get_limiter
+
+# (connect, read) timeout in seconds used when a scraper does not pass one
+DEFAULT_TIMEOUT = (5, 20)
+
+# Number of per-host connection pools kept alive, and connections per host
+POOL_CONNECTIONS = 32
+POOL_MAXSIZE = 16
+
+# Retries of GET/HEAD requests after a dropped connection or a gateway error;
+# every attempt waits for its own token from the host's rate limiter
+MAX_RETRIES = 2
+RETRY_BACKOFF = 0.5   # seconds before the first retry, doubled for each further one
+RETRY_STATUSES = frozenset({502, 503, 504})
+RETRY_METHODS = frozenset({"GET", "HEAD"})
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                  "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,application/json;q=0.8,*/*;q=0.7",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Accept-Encoding": "gzip, deflate",
+    "Connection": "keep-alive",
+}
+
+_config = {
+    "timeout": DEFAULT_TIMEOUT,
+    "pool_connections": POOL_CONNECTIONS,
+    "pool_maxsize": POOL_MAXSIZE,
+    "max_retries": MAX_RETRIES,
+    "headers": dict(DEFAULT_HEADERS),
+}
+_session: Optional[requests.Session] = None
+_cache: Optional[ResponseCache] = None
+_archive: Optional[WarcWriter] = None
+_lock = threading.Lock()
+
+
+def _build_session() -> requests.Session:
+    """
+    Create a session with pooled, keep-alive adapters for http and https.
+
+    The adapters do not retry; fetch() does, so that retries are rate limited.
+
+    Returns:
+        A configured requests session
+    """
+    adapter = HTTPAdapter(
+        pool_connections=_config["pool_connections"],
+        pool_maxsize=_config["pool_maxsize"],
+        max_retries=0,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.clear()
+    session.headers.update(_config["headers"])
+    return session
+
+
+def configure(timeout=None, pool_connections: Optional[int] = None, pool_maxsize: Optional[int] = None,
+              max_retries: Optional[int] = None, headers: Optional[dict] = None) -> None:
+    """
+    Change engine settings. The shared session is rebuilt on next use.
+
+    Args:
+        timeout: Default timeout, a number or a (connect, read) tuple
+        pool_connections: Number of per-host pools to keep alive
+        pool_maxsize: Maximum connections kept per host
+        max_retries: Retries of GET/HEAD requests after a dropped connection
+            or a 502/503/504 response
+        headers: Extra default headers merged over DEFAULT_HEADERS
+    """
+    global _session
+    with _lock:
+        if timeout is not None:
+            _config["timeout"] = timeout
+        if pool_connections is not None:
+            _config["pool_connections"] = pool_connections
+        if pool_maxsize is not None:
+            _config["pool_maxsize"] = pool_maxsize
+        if max_retries is not None:
+            _config["max_retries"] = max_retries
+        if headers:
+            _config["headers"].update(headers)
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
+def get_session() -> requests.Session:
+    """
+    Get the process-wide pooled session, creating it on first use.
+
+    Returns:
+        The shared requests session
+    """
+    global _session
+    if _session is None:
+        with _lock:
+            if _session is None:
+                _session = _build_session()
+    return _session
+
+
+def enable_cache(path=None, ttl: Optional[float] = None, max_bytes: Optional[int] = None) -> ResponseCache:
+    """
+    Turn on the shared on-disk response cache for GET requests.
+
+    Calling it again keeps the existing cache, so every scraper in a run
+    shares one store.
+
+    Args:
+        path: Cache directory, defaults to <project root>/.cache/http
+        ttl: Seconds a response is served without revalidation
+        max_bytes: Upper bound on the stored body size
+
+    Returns:
+        The shared ResponseCache
+    """
+    global _cache
+    with _lock:
+        if _cache is None:
+            kwargs = {}
+            if ttl is not None:
+                kwargs["ttl"] = ttl
+            if max_bytes is not None:
+                kwargs["max_bytes"] = max_bytes
+            _cache = ResponseCache(path, **kwargs)
+        return _cache
+
+
+def disable_cache() -> None:
+    """Turn the response cache off and close it."""
+    global _cache
+    with _lock:
+        if _cache is not None:
+            _cache.close()
+            _cache = None
+
+
+def is_recording() -> bool:
+    """
+    Check whether responses are kept by the response cache or the archive.
+
+    Streamed requests (``stream=True``) bypass both, so callers that could
+    stream should only do so when this is False.
+
+    Returns:
+        True if the cache or the archive is enabled
+    """
+    return _cache is not None or _archive is not None
+
+
+def enable_archive(path) -> WarcWriter:
+    """
+    Append every downloaded response to a WARC archive.
+
+    Args:
+        path: Archive file, e.g. archive.default_archive_path('olx')
+
+    Returns:
+        The archive writer
+    """
+    global _archive
+    with _lock:
+        if _archive is not None:
+            _archive.close()
+        _archive = WarcWriter(path)
+        return _archive
+
+
+def disable_archive() -> None:
+    """Stop archiving responses and close the archive file."""
+    global _archive
+    with _lock:
+        if _archive is not None:
+            _archive.close()
+            _archive = None
+
+
+def host_of(url: str) -> str:
+    """
+    Get the host part of a URL.
+
+    Args:
+        url: Absolute URL
+
+    Returns:
+        Lower-cased host name (without port)
+    """
+    return (urlsplit(url).hostname or "").lower()
+
+
+def _retry_delay(attempt: int, resp: Optional[requests.Response] = None) -> float:
+    """Backoff before retry number attempt (1-based), stretched to a numeric Retry-After."""
+    delay = RETRY_BACKOFF * 2 ** (attempt - 1)
+    try:
+        return max(delay, float(resp.headers["Retry-After"])) if resp is not None else delay
+    except (KeyError, TypeError, ValueError):
+        return delay
+
+
+def _send(session: requests.Session, method: str, url: str, rate_limit: bool, **kwargs) -> requests.Response:
+    """
+    Send a request, retrying dropped connections and gateway errors.
+
+    Args:
+        session: Session to send with
+        method: HTTP method; only GET and HEAD are retried
+        url: URL to fetch
+        rate_limit: Take a token from the host's bucket before every attempt
+        **kwargs: Passed through to ``requests.Session.request``
+
+    Returns:
+        The response of the last attempt
+    """
+    retries = _config["max_retries"] if method.upper() in RETRY_METHODS else 0
+    resp = None
+    for attempt in range(retries + 1):
+        if attempt:
+            time.sleep(_retry_delay(attempt, resp))
+        if rate_limit:
+            get_limiter().acquire(host_of(url))
+        try:
+            resp = session.request(method, url, **kwargs)
+        except (requests.ConnectionError, requests.Timeout):
+            if attempt == retries:
+                raise
+            resp = None
+            continue
+        if resp.status_code not in RETRY_STATUSES or attempt == retries:
+            return resp
+        resp.close()
+    return resp
+
+
+def fetch(url: str, method: str = "GET", params=None, headers: Optional[dict] = None,
+          timeout=None, rate_limit: bool = True, cache: bool = True, cache_ttl: Optional[float] = None,
+          **kwargs) -> requests.Response:
+    """
+    Fetch a URL through the shared pooled session.
+
+    Args:
+        url: URL to fetch
+        method: HTTP method
+        params: Query string parameters
+        headers: Per-request headers, merged over the default headers
+        timeout: Timeout for this request, defaults to the engine timeout
+        rate_limit: Wait for the host's token bucket before sending, and
+            again before each retry. Only hosts given a budget with
+            ``ratelimit.set_rate`` (or, for all other hosts,
+            ``ratelimit.set_default_rate``) are limited
+        cache: Use the response cache for this request if it is enabled
+        cache_ttl: Override the cache TTL (seconds) for this request
+        **kwargs: Passed through to ``requests.Session.request``
+
+    Returns:
+        The response object. Responses served from the cache have
+        ``from_cache`` set to True; if the server was asked and answered 304,
+        ``revalidated`` is also True and the 304's headers are merged in.
+    """
+    if timeout is None:
+        timeout = _config["timeout"]
+    session = get_session()
+    store = _cache if cache and method.upper() == "GET" and not kwargs.get("stream") else None
+    entry = key = None
+    if store is not None:
+        request_headers = CaseInsensitiveDict(session.headers)
+        request_headers.update(headers or {})
+        full_url = requests.Request(method, url, params=params).prepare().url
+        key = cache_key(method, full_url, request_headers)
+        entry = store.get(key)
+        if entry is not None:
+            if entry.is_fresh(store.ttl if cache_ttl is None else cache_ttl):
+                return entry.to_response()
+            headers = {**(headers or {}), **entry.validators()}
+
+    resp = _send(session, method, url, rate_limit, params=params, headers=headers, timeout=timeout, **kwargs)
+    archive = _archive
+    if archive is not None and resp.status_code != 304 and not kwargs.get("stream"):
+        archive.write_response(resp)
+
+    if store is not None:
+        if resp.status_code == 304 and entry is not None:
+            store.touch(key)
+            return entry.to_response(not_modified=resp)
+        if resp.status_code == 200:
+            store.store(key, resp)
+    resp.from_cache = False
+    return resp
+
+
+def close() -> None:
+    """Close the shared session and release its pooled connections."""
+    global _session
+    with _lock:
+        if _session is not None:
+            _session.close()
+            _session = None
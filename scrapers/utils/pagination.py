@@ -0,0 +1,113 @@
+"""Concurrent pagination for scrapers whose page URLs are known up front.
+
+Instead of fetching page 1, then page 2, and so on, the driver keeps up to
+``concurrency`` pages in flight and hands results back in page order. As soon
+as any page comes back empty, no pages after it are started, which matches the
+``if not containers: break`` logic the serial loops use.
+"""
+
+import asyncio
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Iterable, Iterator, Optional, Tuple
+
+DEFAULT_CONCURRENCY = 4
+
+
+def _default_is_empty(result: Any) -> bool:
+    return not result
+
+
+async def iter_pages_async(fetch_page: Callable, pages: Iterable, concurrency: int = DEFAULT_CONCURRENCY,
+                           is_empty: Optional[Callable[[Any], bool]] = None) -> AsyncIterator[Tuple[Any, Any]]:
+    """
+    Fetch pages concurrently and yield them in order until one is empty.
+
+    Args:
+        fetch_page: Function called with one page key. A plain function runs
+            in a worker thread, a coroutine function is awaited directly
+        pages: Page keys in crawl order (page numbers, URLs, offsets...)
+        concurrency: Maximum number of pages in flight
+        is_empty: Predicate marking the end of the listing, defaults to ``not result``
+
+    Yields:
+        (page, result) tuples in the order of ``pages``, stopping before the
+        first empty page
+    """
+    is_empty = is_empty or _default_is_empty
+    loop = asyncio.get_running_loop()
+    is_async = inspect.iscoroutinefunction(fetch_page)
+    executor = None if is_async else ThreadPoolExecutor(max_workers=concurrency)
+    page_iter = iter(enumerate(pages))
+    in_flight = {}   # task -> (index, page)
+    done = {}        # index -> (page, result)
+    next_index = 0   # next index to yield
+    stop_at = None   # index of the first empty page seen
+    exhausted = False
+
+    def start_more():
+        nonlocal exhausted
+        while not exhausted and len(in_flight) < concurrency:
+            try:
+                index, page = next(page_iter)
+            except StopIteration:
+                exhausted = True
+                return
+            if stop_at is not None and index > stop_at:
+                exhausted = True
+                return
+            if is_async:
+                task = asyncio.ensure_future(fetch_page(page))
+            else:
+                task = loop.run_in_executor(executor, fetch_page, page)
+            in_flight[task] = (index, page)
+
+    try:
+        start_more()
+        while in_flight or next_index in done:
+            if next_index not in done:
+                finished, _ = await asyncio.wait(list(in_flight), return_when=asyncio.FIRST_COMPLETED)
+                for task in finished:
+                    index, page = in_flight.pop(task)
+                    result = task.result()
+                    if is_empty(result) and (stop_at is None or index < stop_at):
+                        stop_at = index
+                    done[index] = (page, result)
+                start_more()
+            while next_index in done:
+                if stop_at is not None and next_index >= stop_at:
+                    return
+                yield done.pop(next_index)
+                next_index += 1
+    finally:
+        for task in in_flight:
+            task.cancel()
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+def iter_pages(fetch_page: Callable, pages: Iterable, concurrency: int = DEFAULT_CONCURRENCY,
+               is_empty: Optional[Callable[[Any], bool]] = None) -> Iterator[Tuple[Any, Any]]:
+    """
+    Synchronous wrapper around iter_pages_async for plain scripts.
+
+    Args:
+        fetch_page: Function called with one page key
+        pages: Page keys in crawl order
+        concurrency: Maximum number of pages in flight
+        is_empty: Predicate marking the end of the listing
+
+    Yields:
+        (page, result) tuples in page order, stopping before the first empty page
+    """
+    loop = asyncio.new_event_loop()
+    agen = iter_pages_async(fetch_page, pages, concurrency=concurrency, is_empty=is_empty)
+    try:
+        while True:
+            try:
+                yield loop.run_until_complete(agen.__anext__())
+            except StopAsyncIteration:
+                break
+    finally:
+        loop.run_until_complete(agen.aclose())
+        loop.close()
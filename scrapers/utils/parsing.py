@@ -0,0 +1,114 @@
+"""Parse HTML with the fastest available backend, optionally only the parts a scraper reads.
+
+Most scrapers build a BeautifulSoup tree of the whole page with Python's
+``html.parser`` and then look at a handful of elements. parse_html() picks
+lxml's C parser when it is installed and, given ``only=``, keeps just the
+subtrees matching a few simple selectors; everything else is dropped while
+parsing instead of being turned into Tag objects:
+
+    soup = parse_html(response.text, only=["article.product_pod", "li.next"])
+    soup.find_all("article", class_="product_pod")   # same BeautifulSoup API
+    soup.select_one("li.next a")
+
+Only the matching elements (and their descendants) are kept, so every element
+a scraper looks up later, pagination links included, must be covered by one of
+the selectors.
+"""
+
+import re
+from typing import Optional, Sequence, Union
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    import lxml  # noqa: F401  (only checked for; BeautifulSoup loads it)
+    DEFAULT_PARSER = "lxml"
+except ImportError:  # optional speed-up
+    DEFAULT_PARSER = "html.parser"
+
+_SIMPLE_SELECTOR = re.compile(r"([\w-]+)?((?:[.#][\w-]+)*)")
+_SELECTOR_PART = re.compile(r"([.#])([\w-]+)")
+
+
+class _Selector:
+    """A tag / .class / #id selector matched against a tag before it is created."""
+
+    __slots__ = ("name", "classes", "id")
+
+    def __init__(self, selector: str):
+        match = _SIMPLE_SELECTOR.fullmatch(selector.strip())
+        if not match or not selector.strip():
+            raise ValueError(f"Unsupported selector for parse_only: {selector!r} (use tag, .class, #id or tag.class)")
+        self.name = match.group(1).lower() if match.group(1) else None
+        parts = _SELECTOR_PART.findall(match.group(2))
+        self.classes = frozenset(value for kind, value in parts if kind == ".")
+        ids = [value for kind, value in parts if kind == "#"]
+        self.id = ids[0] if ids else None
+
+    def matches(self, name: str, attrs) -> bool:
+        if self.name is not None and name != self.name:
+            return False
+        if self.id is not None and attrs.get("id") != self.id:
+            return False
+        if self.classes:
+            classes = attrs.get("class") or ()
+            if isinstance(classes, str):
+                classes = classes.split()
+            if not self.classes.issubset(classes):
+                return False
+        return True
+
+
+class Strainer(SoupStrainer):
+    """Keeps the subtrees whose root matches any of several simple selectors."""
+
+    def __init__(self, *selectors: str):
+        """
+        Build a strainer.
+
+        Args:
+            *selectors: 'tag', '.class', '#id' or combinations like 'div.card.job'
+        """
+        super().__init__()
+        self.selectors = [_Selector(selector) for selector in selectors]
+
+    def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+        attrs = attrs or {}
+        return any(selector.matches(name, attrs) for selector in self.selectors)
+
+    def allow_string_creation(self, string) -> bool:
+        return False  # text outside the kept subtrees
+
+
+def strainer(only: Union[str, Sequence[str], SoupStrainer]) -> SoupStrainer:
+    """
+    Turn an ``only=`` argument into a SoupStrainer.
+
+    Args:
+        only: Selector, list of selectors, or a ready SoupStrainer
+
+    Returns:
+        SoupStrainer for BeautifulSoup's parse_only
+    """
+    if isinstance(only, SoupStrainer):
+        return only
+    if isinstance(only, str):
+        only = [only]
+    return Strainer(*only)
+
+
+def parse_html(markup, only: Union[str, Sequence[str], SoupStrainer, None] = None,
+               parser: Optional[str] = None) -> BeautifulSoup:
+    """
+    Parse an HTML document into BeautifulSoup.
+
+    Args:
+        markup: HTML as str or bytes (bytes let the parser detect the encoding)
+        only: Keep only subtrees matching these selectors; None keeps the whole page
+        parser: BeautifulSoup tree builder; defaults to lxml when installed, else html.parser
+
+    Returns:
+        BeautifulSoup tree with the usual find/find_all/select API
+    """
+    parse_only = strainer(only) if only is not None else None
+    return BeautifulSoup(markup, parser or DEFAULT_PARSER, parse_only=parse_only)
@@ -0,0 +1,175 @@
+"""Two-stage crawl pipeline: fetch in threads, parse in worker processes.
+
+Fetching and parsing one URL after the other leaves the network idle while
+BeautifulSoup runs, and parsing in threads is capped at one core by the GIL.
+fetch_and_parse() splits the two: ``fetch_workers`` threads download raw
+bytes through the shared HTTP engine (pooled, rate limited, cached), and a
+ProcessPoolExecutor parses them on every core:
+
+    for url, result in fetch_and_parse(urls, parse_question, processes=4):
+        ...
+
+Both stages are bounded: at most ``queue_size`` downloaded bodies wait for a
+parser and at most two tasks per worker process are queued in the pool, so a
+fast network never buffers a whole crawl in memory and a slow one never
+starves the parsers of work they could already do.
+
+``parse`` must be a module-level function (it is pickled to the workers, which
+are started with forkserver or spawn and import it afresh) that takes the
+decoded page, like the parse functions of archive.reextract().
+Results come back as pages finish, not in input order; a URL whose fetch or
+parse raised comes back as ``(url, None)``.
+"""
+
+import json
+import multiprocessing
+import os
+import queue
+import threading
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Any, Callable, Iterable, Iterator, Optional, Tuple
+
+DEFAULT_FETCH_WORKERS = 8
+DEFAULT_QUEUE_SIZE = 32     # downloaded bodies waiting for a parser
+_TASKS_PER_PROCESS = 2      # parse tasks queued per worker process
+_POLL_INTERVAL = 0.05       # seconds between checks of both stages
+
+_DONE = object()            # sent by a fetch thread when it runs out of URLs
+
+# Parse workers must not be forked from this process: by the time they start, the
+# fetch threads (and the caller's own threads) may hold locks that a forked child
+# would inherit locked. A forkserver or spawned worker starts from a clean process.
+_START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+
+def fetch_bytes(url: str) -> bytes:
+    """
+    Default fetch stage: GET a URL through the shared HTTP engine.
+
+    Args:
+        url: URL to fetch
+
+    Returns:
+        Raw response body
+
+    Raises:
+        requests.HTTPError: For 4xx/5xx responses
+    """
+    from scrapers.utils.http import fetch
+
+    response = fetch(url)
+    response.raise_for_status()
+    return response.content
+
+
+def _decode(body: bytes, decode: str):
+    if decode == "html":
+        from scrapers.utils.parsing import parse_html
+        return parse_html(body)
+    if decode == "json":
+        return json.loads(body)
+    if decode == "text":
+        return body.decode("utf-8", errors="replace")
+    return body
+
+
+def _run_parse(task):
+    parse, decode, body = task
+    return parse(_decode(body, decode))
+
+
+def _fetch_worker(urls, lock, fetch_body, fetched, stop):
+    """Fetch stage thread: pull URLs until they run out and queue (url, body, error)."""
+    def put(item):
+        while not stop.is_set():
+            try:
+                fetched.put(item, timeout=_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    while not stop.is_set():
+        with lock:
+            url = next(urls, _DONE)
+        if url is _DONE:
+            break
+        try:
+            item = (url, fetch_body(url), None)
+        except Exception as e:
+            item = (url, None, e)
+        if not put(item):
+            return
+    put(_DONE)
+
+
+def fetch_and_parse(urls: Iterable[str], parse: Callable, decode: str = "html",
+                    fetch_body: Optional[Callable[[str], bytes]] = None,
+                    fetch_workers: int = DEFAULT_FETCH_WORKERS, processes: Optional[int] = None,
+                    queue_size: int = DEFAULT_QUEUE_SIZE) -> Iterator[Tuple[str, Any]]:
+    """
+    Fetch URLs concurrently and parse the bodies in worker processes.
+
+    Args:
+        urls: URLs to crawl; may be a lazy iterator that is consumed as the
+            fetch threads need more work
+        parse: Module-level function taking the decoded page
+        decode: 'html' (BeautifulSoup), 'json', 'text' or 'raw' (bytes)
+        fetch_body: Function returning the raw body of a URL, run in the fetch
+            threads; defaults to fetch_bytes()
+        fetch_workers: Threads downloading at once
+        processes: Worker processes, defaults to the number of cores
+        queue_size: Downloaded bodies that may wait for a parser
+
+    Yields:
+        (url, parse result) tuples as pages finish; result is None when the
+        fetch or the parse raised
+    """
+    fetch_body = fetch_body or fetch_bytes
+    processes = processes or os.cpu_count() or 1
+    max_pending = processes * _TASKS_PER_PROCESS
+    url_iter, lock = iter(urls), threading.Lock()
+    fetched = queue.Queue(maxsize=queue_size)
+    stop = threading.Event()
+    pool = ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context(_START_METHOD))
+    threads = [threading.Thread(target=_fetch_worker, args=(url_iter, lock, fetch_body, fetched, stop),
+                                daemon=True)
+               for _ in range(fetch_workers)]
+    for thread in threads:
+        thread.start()
+
+    pending = {}   # future -> url
+    running = len(threads)
+    try:
+        while running or pending:
+            # Hand downloaded bodies to the parsers while they have room
+            while running and len(pending) < max_pending:
+                try:
+                    item = fetched.get(timeout=None if not pending else _POLL_INTERVAL)
+                except queue.Empty:
+                    break
+                if item is _DONE:
+                    running -= 1
+                    continue
+                url, body, error = item
+                if error is not None:
+                    print(f"❌ Error fetching {url}: {error}")
+                    yield url, None
+                    continue
+                pending[pool.submit(_run_parse, (parse, decode, body))] = url
+
+            if not pending:
+                continue
+            finished, _ = wait(pending, timeout=_POLL_INTERVAL if running else None,
+                               return_when=FIRST_COMPLETED)
+            for future in finished:
+                url = pending.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    print(f"❌ Error parsing {url}: {e}")
+                    result = None
+                yield url, result
+    finally:
+        stop.set()
+        pool.shutdown(wait=False, cancel_futures=True)
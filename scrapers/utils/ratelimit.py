@@ -0,0 +1,252 @@
+"""Per-host token-bucket rate limiting shared by all scrapers.
+
+Each host gets its own bucket of ``burst`` tokens refilled at ``rate`` tokens
+per second. A request only waits when its host's bucket is empty, so time
+spent parsing or talking to other hosts counts toward the politeness delay
+instead of being added on top of it.
+
+Only hosts given a budget are limited. Scrapers call set_rate() at import
+time for the hosts they crawl; requests to any other host are sent at once
+unless a default budget was opted into with set_default_rate():
+
+    set_rate("www.olx.in", rate=0.6, burst=2)
+
+APIs that advertise their quota in response headers (Reddit's
+X-Ratelimit-Remaining / X-Ratelimit-Reset) can retune a host's bucket with
+HostRateLimiter.spread() so the remaining requests are spread evenly over the
+rest of the window instead of being paced by a fixed guess.
+"""
+
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+# Budget suggested for set_default_rate(); unconfigured hosts are not limited until it is called
+DEFAULT_RATE = 1.0   # requests per second
+DEFAULT_BURST = 2    # requests allowed back to back
+
+
+class TokenBucket:
+    """Thread-safe token bucket."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Create a bucket that starts full.
+
+        Args:
+            rate: Tokens added per second
+            burst: Maximum number of tokens the bucket holds
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.burst = max(1, int(burst))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, tokens: int = 1) -> float:
+        """
+        Take tokens from the bucket, going into debt if it is empty.
+
+        Args:
+            tokens: Number of tokens to take
+
+        Returns:
+            Seconds the caller has to wait before its tokens are available
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def update(self, rate: float, wait: float = 0.0) -> None:
+        """
+        Change the refill rate, keeping the tokens already taken.
+
+        Args:
+            rate: New tokens added per second
+            wait: If positive, empty the bucket so the next token is only
+                available after this many seconds
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = float(rate)
+            if wait > 0:
+                self._tokens = min(self._tokens, 1 - wait * self.rate)
+
+    def acquire(self, tokens: int = 1) -> float:
+        """
+        Block until tokens are available.
+
+        Args:
+            tokens: Number of tokens to take
+
+        Returns:
+            Seconds spent waiting
+        """
+        delay = self.reserve(tokens)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+
+class HostRateLimiter:
+    """Keeps one token bucket per host."""
+
+    def __init__(self, default_rate: Optional[float] = None, default_burst: int = DEFAULT_BURST):
+        """
+        Create a limiter.
+
+        Args:
+            default_rate: Requests per second for unconfigured hosts; None
+                leaves them unlimited
+            default_burst: Burst size for unconfigured hosts
+        """
+        self.default_rate = default_rate
+        self.default_burst = default_burst
+        self._limits: Dict[str, Tuple[float, int]] = {}
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def set_rate(self, host: str, rate: float, burst: int = 1, keep_existing: bool = False) -> None:
+        """
+        Set the budget for one host.
+
+        Args:
+            host: Host name, e.g. 'books.toscrape.com'
+            rate: Requests per second
+            burst: Requests allowed back to back once the bucket is full
+            keep_existing: Only seed the budget; leave a host that was already
+                set (and possibly retuned by spread()) untouched
+        """
+        host = host.lower()
+        with self._lock:
+            if keep_existing and host in self._limits:
+                return
+            self._limits[host] = (rate, burst)
+            self._buckets[host] = TokenBucket(rate, burst)
+
+    def set_default_rate(self, rate: Optional[float], burst: int = DEFAULT_BURST) -> None:
+        """
+        Set the budget of hosts that were never given one with set_rate().
+
+        Args:
+            rate: Requests per second, or None to leave those hosts unlimited
+            burst: Requests allowed back to back
+        """
+        with self._lock:
+            self.default_rate = rate
+            self.default_burst = burst
+            self._buckets = {host: bucket for host, bucket in self._buckets.items() if host in self._limits}
+
+    def bucket(self, host: str) -> Optional[TokenBucket]:
+        """
+        Get the bucket for a host, creating it on first use.
+
+        Args:
+            host: Host name
+
+        Returns:
+            The host's token bucket, or None if the host is not limited
+        """
+        host = host.lower()
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                rate, burst = self._limits.get(host, (self.default_rate, self.default_burst))
+                if rate is None:
+                    return None
+                bucket = self._buckets[host] = TokenBucket(rate, burst)
+            return bucket
+
+    def acquire(self, host: str, tokens: int = 1) -> float:
+        """
+        Block until the host's budget allows another request.
+
+        Args:
+            host: Host name
+            tokens: Number of requests to account for
+
+        Returns:
+            Seconds spent waiting (0.0 for hosts that are not limited)
+        """
+        bucket = self.bucket(host)
+        return bucket.acquire(tokens) if bucket is not None else 0.0
+
+    def spread(self, host: str, remaining: float, reset_in: float, in_flight: int = 0) -> float:
+        """
+        Pace a host to use its advertised quota by the end of the window and no more.
+
+        Args:
+            host: Host name
+            remaining: Requests left in the current window
+            reset_in: Seconds until the window resets
+            in_flight: Requests already sent but not yet counted by the server
+
+        Returns:
+            The new rate in requests per second (0.0 while the quota is used up)
+        """
+        reset_in = max(reset_in, 1.0)
+        left = remaining - in_flight
+        # A host that advertises its quota is paced by it even if nobody set a budget
+        self.set_rate(host, rate=max(left, 1) / reset_in, keep_existing=True)
+        bucket = self.bucket(host)
+        if left < 1:
+            bucket.update(bucket.rate, wait=reset_in)
+            return 0.0
+        rate = left / reset_in
+        bucket.update(rate)
+        return rate
+
+
+_limiter: Optional[HostRateLimiter] = None
+_limiter_lock = threading.Lock()
+
+
+def get_limiter() -> HostRateLimiter:
+    """
+    Get the process-wide limiter shared by all scrapers.
+
+    Returns:
+        The shared HostRateLimiter
+    """
+    global _limiter
+    if _limiter is None:
+        with _limiter_lock:
+            if _limiter is None:
+                _limiter = HostRateLimiter()
+    return _limiter
+
+
+def set_rate(host: str, rate: float, burst: int = 1, keep_existing: bool = False) -> None:
+    """
+    Set the shared budget for a host.
+
+    Args:
+        host: Host name
+        rate: Requests per second
+        burst: Requests allowed back to back
+        keep_existing: Leave the budget alone if the host was already set
+    """
+    get_limiter().set_rate(host, rate, burst, keep_existing=keep_existing)
+
+
+def set_default_rate(rate: Optional[float] = DEFAULT_RATE, burst: int = DEFAULT_BURST) -> None:
+    """
+    Opt into a shared budget for every host that has no set_rate() budget.
+
+    Args:
+        rate: Requests per second, or None to leave those hosts unlimited again
+        burst: Requests allowed back to back
+    """
+    get_limiter().set_default_rate(rate, burst)
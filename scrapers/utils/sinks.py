@@ -0,0 +1,218 @@
+"""Streaming row sinks for scraper output.
+
+Scrapers yield rows one at a time and a sink writes them out in small
+batches, so memory stays flat however long the crawl is and everything up to
+the last flush is already on disk if the run dies half way. Used as a context
+manager, a sink also flushes whatever is buffered when an exception escapes.
+
+    with open_sink(get_output_path("jobs.csv")) as sink:
+        sink.write_many(scrape_jobs())
+
+The format follows the file extension: .csv, .jsonl or .parquet (needs pyarrow).
+"""
+
+import csv
+import json
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+DEFAULT_BATCH_SIZE = 100   # rows buffered before a flush
+DEFAULT_MAX_DELAY = 10.0   # seconds a row may sit in the buffer on slow crawls
+
+
+class RowSink(ABC):
+    """Base class: buffers dict rows and hands them to _write_batch()."""
+
+    def __init__(self, path, fieldnames: Optional[List[str]] = None, batch_size: int = DEFAULT_BATCH_SIZE,
+                 max_delay: float = DEFAULT_MAX_DELAY, append: bool = False):
+        """
+        Create a sink. The file is only created when the first batch is flushed.
+
+        Args:
+            path: Output file, overwritten unless append is set
+            fieldnames: Column order, defaults to the keys of the first row
+            batch_size: Rows buffered before they are written
+            max_delay: Also flush when the oldest buffered row is this many seconds old
+            append: Add to an existing file (used when resuming a crawl)
+        """
+        self.path = Path(path)
+        self.fieldnames = list(fieldnames) if fieldnames else None
+        self.batch_size = batch_size
+        self.max_delay = max_delay
+        self.append = append
+        self.count = 0
+        self._buffer = []
+        self._buffered_at = None
+        self._closed = False
+
+    def write(self, row: dict) -> None:
+        """
+        Add one row, flushing if the batch is full.
+
+        Args:
+            row: Mapping of column name to value
+        """
+        if self.fieldnames is None:
+            self.fieldnames = list(row.keys())
+        if not self._buffer:
+            self._buffered_at = time.monotonic()
+        self._buffer.append(row)
+        self.count += 1
+        if len(self._buffer) >= self.batch_size or time.monotonic() - self._buffered_at >= self.max_delay:
+            self.flush()
+
+    def write_many(self, rows: Iterable[dict]) -> int:
+        """
+        Consume an iterable of rows (typically a scraper generator).
+
+        Args:
+            rows: Rows to write
+
+        Returns:
+            Number of rows written by this call
+        """
+        start = self.count
+        for row in rows:
+            self.write(row)
+        return self.count - start
+
+    def flush(self) -> None:
+        """Write buffered rows to disk."""
+        if self._buffer:
+            self._write_batch(self._buffer)
+            self._buffer = []
+
+    def close(self) -> None:
+        """Flush and close the file."""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self.flush()
+        finally:
+            self._close()
+
+    @abstractmethod
+    def _write_batch(self, rows: List[dict]) -> None:
+        """Append rows to the file, opening it on the first call."""
+
+    def _close(self) -> None:
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class CsvSink(RowSink):
+    """CSV file with a header row; unknown keys are dropped, missing ones left empty."""
+
+    _file = None
+    _writer = None
+
+    def _write_batch(self, rows):
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            has_header = self.append and self.path.exists() and self.path.stat().st_size > 0
+            self._file = open(self.path, "a" if self.append else "w", newline="", encoding="utf-8")
+            self._writer = csv.DictWriter(self._file, fieldnames=self.fieldnames, extrasaction="ignore")
+            if not has_header:
+                self._writer.writeheader()
+        self._writer.writerows(rows)
+        self._file.flush()
+
+    def _close(self):
+        if self._file is not None:
+            self._file.close()
+
+
+class JsonlSink(RowSink):
+    """One JSON object per line, keys limited to fieldnames like the CSV columns."""
+
+    _file = None
+
+    def _write_batch(self, rows):
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, "a" if self.append else "w", encoding="utf-8")
+        for row in rows:
+            record = {name: row.get(name) for name in self.fieldnames}
+            self._file.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+        self._file.flush()
+
+    def _close(self):
+        if self._file is not None:
+            self._file.close()
+
+
+class ParquetSink(RowSink):
+    """
+    Parquet file written one row group per batch (requires pyarrow).
+
+    Values are stored as strings, as in the CSV output, so a column that is
+    sometimes a number and sometimes 'N/A' does not break the schema. The file
+    footer is written on close(), so use the sink as a context manager. A
+    finished Parquet file cannot be appended to.
+    """
+
+    _writer = None
+
+    def __init__(self, path, fieldnames=None, batch_size=1000, max_delay=DEFAULT_MAX_DELAY, append=False):
+        if append:
+            raise ValueError("Parquet files cannot be appended to; resume into a .csv or .jsonl file")
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError("Parquet output needs pyarrow: pip install pyarrow") from e
+        super().__init__(path, fieldnames, batch_size, max_delay)
+        self._pa = pa
+        self._pq = pq
+
+    def _write_batch(self, rows):
+        pa = self._pa
+        if self._writer is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            schema = pa.schema([(name, pa.string()) for name in self.fieldnames])
+            self._writer = self._pq.ParquetWriter(str(self.path), schema)
+        columns = {
+            name: [None if row.get(name) is None else str(row.get(name)) for row in rows]
+            for name in self.fieldnames
+        }
+        self._writer.write_table(pa.table(columns, schema=self._writer.schema))
+
+    def _close(self):
+        if self._writer is not None:
+            self._writer.close()
+
+
+_SINKS = {
+    ".csv": CsvSink,
+    ".jsonl": JsonlSink,
+    ".parquet": ParquetSink,
+}
+
+
+def open_sink(path, fieldnames: Optional[List[str]] = None, **kwargs) -> RowSink:
+    """
+    Open the sink matching a file's extension.
+
+    Args:
+        path: Output file ending in .csv, .jsonl or .parquet
+        fieldnames: Column order, defaults to the keys of the first row
+        **kwargs: batch_size / max_delay / append
+
+    Returns:
+        A RowSink
+
+    Raises:
+        ValueError: If the extension is not supported
+    """
+    suffix = Path(path).suffix.lower()
+    if suffix not in _SINKS:
+        raise ValueError(f"Unsupported output format {suffix!r}, use one of {', '.join(_SINKS)}")
+    return _SINKS[suffix](path, fieldnames, **kwargs)
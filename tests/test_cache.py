@@ -0,0 +1,116 @@
+import io
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+import requests
+
+from scrapers.utils import http
+from scrapers.utils.cache import ResponseCache, cache_key
+
+
+def response(status=200, body=b"", headers=None, url="https://example.com/page"):
+    resp = requests.Response()
+    resp.status_code = status
+    resp.url = url
+    resp.headers.update(headers or {})
+    resp._content = body
+    resp.raw = io.BytesIO()
+    return resp
+
+
+class FakeSession:
+    """Answers requests from a list of canned responses and records what was sent."""
+
+    def __init__(self, *responses):
+        self.headers = requests.structures.CaseInsensitiveDict()
+        self.responses = list(responses)
+        self.sent = []
+
+    def request(self, method, url, headers=None, **kwargs):
+        self.sent.append(dict(headers or {}))
+        return self.responses.pop(0)
+
+
+class ResponseCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = ResponseCache(self.tmp.name, ttl=60)
+
+    def tearDown(self):
+        self.cache.close()
+        self.tmp.cleanup()
+
+    def test_entry_is_fresh_until_the_ttl(self):
+        self.cache.store("k", response(body=b"hello", headers={"ETag": '"v1"'}))
+        entry = self.cache.get("k")
+
+        self.assertTrue(entry.is_fresh(60))
+        with mock.patch("scrapers.utils.cache.time.time", return_value=time.time() + 61):
+            self.assertFalse(entry.is_fresh(60))
+        self.assertEqual(entry.validators(), {"If-None-Match": '"v1"'})
+
+    def test_no_store_responses_are_not_kept(self):
+        self.cache.store("k", response(body=b"secret", headers={"Cache-Control": "no-store"}))
+
+        self.assertIsNone(self.cache.get("k"))
+
+    def test_key_depends_on_representation_headers(self):
+        url = "https://example.com/page"
+
+        self.assertNotEqual(cache_key("GET", url, {"Accept-Language": "en"}),
+                            cache_key("GET", url, {"Accept-Language": "hi"}))
+        self.assertEqual(cache_key("get", url, {}), cache_key("GET", url, {"User-Agent": "x"}))
+
+
+class FetchCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        http.enable_cache(self.tmp.name, ttl=60)
+        self.addCleanup(self.tmp.cleanup)
+        self.addCleanup(http.disable_cache)
+
+    def fetch(self, session, **kwargs):
+        with mock.patch.object(http, "_session", session):
+            return http.fetch("https://example.com/page", rate_limit=False, **kwargs)
+
+    def test_fresh_entry_is_served_without_a_request(self):
+        session = FakeSession(response(body=b"v1"))
+        self.fetch(session)
+        resp = self.fetch(session)
+
+        self.assertEqual(len(session.sent), 1)
+        self.assertTrue(resp.from_cache)
+        self.assertFalse(resp.revalidated)
+        self.assertEqual(resp.content, b"v1")
+
+    def test_stale_entry_is_revalidated_with_a_304(self):
+        session = FakeSession(response(body=b"v1", headers={"ETag": '"v1"', "X-Quota": "10"}),
+                              response(status=304, headers={"X-Quota": "9"}))
+        self.fetch(session)
+        resp = self.fetch(session, cache_ttl=0)
+
+        self.assertEqual(session.sent[1]["If-None-Match"], '"v1"')
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.content, b"v1")
+        self.assertTrue(resp.from_cache)
+        self.assertTrue(resp.revalidated)
+        self.assertEqual(resp.headers["X-Quota"], "9")
+
+    def test_changed_page_replaces_the_entry(self):
+        session = FakeSession(response(body=b"v1", headers={"ETag": '"v1"'}),
+                              response(body=b"v2", headers={"ETag": '"v2"'}))
+        self.fetch(session)
+        fresh = self.fetch(session, cache_ttl=0)
+        cached = self.fetch(session)
+
+        self.assertFalse(fresh.from_cache)
+        self.assertEqual(cached.content, b"v2")
+        self.assertEqual(len(session.sent), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+
+from scrapers.job_boards.job_details import CARD_CLASSIFIER, NAUKRI_CLASSIFIER, DetailClassifier
+
+TEXTS = [
+    "₹15,000 - ₹25,000 per month",
+    "Fresher",
+    "2-5 Yrs",
+    "3 years experience",
+    "Bangalore",
+    "Hybrid - Bengaluru, Hyderabad",
+    "Koramangala, Bengaluru",
+    "5-8 Lacs PA",
+    "12 LPA",
+    "Not disclosed",
+    "Delivery Executive",
+    "",
+    "   ",
+    "Work from home",
+    "Gurgaon / Noida",
+    "Acme Technologies Pvt Ltd",
+    "10 openings",
+]
+
+
+class ClassifyManyTest(unittest.TestCase):
+
+    def assert_matches_classify(self, classifier, texts):
+        self.assertEqual(classifier.classify_many(texts), [classifier.classify(t) for t in texts])
+
+    def test_card_classifier(self):
+        self.assert_matches_classify(CARD_CLASSIFIER, TEXTS)
+
+    def test_naukri_classifier(self):
+        self.assert_matches_classify(NAUKRI_CLASSIFIER, TEXTS)
+
+    def test_length_fallback(self):
+        classifier = DetailClassifier([('salary', r'₹')], fallback_max_len=12, fallback_digits=False)
+        self.assert_matches_classify(classifier, TEXTS)
+
+    def test_naukri_locations_come_from_the_gazetteer(self):
+        self.assertEqual(NAUKRI_CLASSIFIER.classify("Hybrid - Pune"), ('location', "Hybrid - Pune"))
+        self.assertIsNone(NAUKRI_CLASSIFIER.classify("Acme Technologies Pvt Ltd"))
+
+    def test_first_rule_wins(self):
+        self.assertEqual(NAUKRI_CLASSIFIER.classify("2-5 Yrs, 5-8 Lacs PA")[0], 'experience')
+        self.assertEqual(CARD_CLASSIFIER.classify("₹20,000 for 2 years experience")[0], 'salary')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+from unittest import mock
+
+from scrapers.ecommerce import olx
+from scrapers.ecommerce.olx import CategoryShard, crawl_rows, hand_over_quota, new_items
+
+
+def batch(prefix, start, stop):
+    return {"data": [{"ad": {"id": f"{prefix}{n}", "title": f"{prefix} {n}"}} for n in range(start, stop)]}
+
+
+def fake_listing(sizes):
+    """fetch_batch stand-in serving sizes[category id] ads per category."""
+    def fetch_batch(category_id, offset):
+        return batch(category_id, offset, min(offset + olx.LIMIT, sizes[category_id]))
+    return fetch_batch
+
+
+class HandOverQuotaTest(unittest.TestCase):
+
+    def test_exhausted_category_splits_its_quota_among_the_open_ones(self):
+        done, a, b = CategoryShard("done", "1", 10), CategoryShard("a", "2", 5), CategoryShard("b", "3", 5)
+        done.end_offset = done.next_offset = 80
+        with redirect_stdout(StringIO()):
+            hand_over_quota(done, [done, a, b])
+
+        self.assertEqual((done.remaining, a.remaining, b.remaining), (0, 10, 10))
+
+    def test_category_with_batches_in_flight_keeps_its_quota(self):
+        busy, other = CategoryShard("busy", "1", 10), CategoryShard("other", "2", 5)
+        busy.end_offset = busy.next_offset = 40
+        busy.in_flight = 1
+        hand_over_quota(busy, [busy, other])
+
+        self.assertEqual((busy.remaining, other.remaining), (10, 5))
+
+
+class CrawlRowsTest(unittest.TestCase):
+
+    def crawl(self, sizes, quota):
+        categories = {name: name for name in sizes}
+        with mock.patch.object(olx, "fetch_batch", fake_listing(sizes)), redirect_stdout(StringIO()):
+            return list(crawl_rows(categories, quota=quota, shards=3))
+
+    def test_short_category_passes_its_quota_on(self):
+        rows = self.crawl({"bikes": 60, "mobiles": 1000}, quota=100)
+
+        titles = [row["Title"] for row in rows]
+        self.assertEqual(len(rows), 200)
+        self.assertEqual(len(set(titles)), 200)
+        self.assertEqual(sum(title.startswith("bikes") for title in titles), 60)
+
+    def test_nothing_left_to_hand_over_to(self):
+        rows = self.crawl({"bikes": 30, "mobiles": 50}, quota=100)
+
+        self.assertEqual(len(rows), 80)
+
+    def test_ads_cut_by_the_quota_are_not_marked_seen(self):
+        seen = set()
+        first = new_items(batch("x", 1, 6), seen, limit=2)
+
+        self.assertEqual([row["Title"] for row in first], ["x 1", "x 2"])
+        self.assertEqual(len(new_items(batch("x", 1, 6), seen)), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
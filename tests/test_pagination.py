@@ -0,0 +1,51 @@
+import asyncio
+import threading
+import time
+import unittest
+
+from scrapers.utils.pagination import iter_pages, iter_pages_async
+
+
+class IterPagesTest(unittest.TestCase):
+
+    def test_pages_come_back_in_order_up_to_the_first_empty_one(self):
+        started = []
+        lock = threading.Lock()
+
+        def fetch_page(page):
+            with lock:
+                started.append(page)
+            # Later pages finish first, so the empty page 4 is seen before pages 1-3
+            time.sleep(0.01 * (5 - page) if page < 5 else 0)
+            return [] if page == 4 else [f"row {page}"]
+
+        results = list(iter_pages(fetch_page, range(1, 21), concurrency=4))
+
+        self.assertEqual(results, [(1, ["row 1"]), (2, ["row 2"]), (3, ["row 3"])])
+        self.assertLess(max(started), 20)
+
+    def test_failed_page_does_not_end_the_listing_with_custom_is_empty(self):
+        def fetch_page(page):
+            if page == 2:
+                return None
+            return [] if page == 4 else [page]
+
+        results = list(iter_pages(fetch_page, range(1, 10), concurrency=3,
+                                  is_empty=lambda rows: rows is not None and not rows))
+
+        self.assertEqual([page for page, _ in results], [1, 2, 3])
+        self.assertIsNone(results[1][1])
+
+    def test_coroutine_pages_are_awaited(self):
+        async def fetch_page(page):
+            await asyncio.sleep(0.001 * (4 - page))
+            return page if page < 3 else None
+
+        async def collect():
+            return [page async for page, _ in iter_pages_async(fetch_page, range(1, 6), concurrency=3)]
+
+        self.assertEqual(asyncio.run(collect()), [1, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+import unittest
+from unittest import mock
+
+from scrapers.utils import ratelimit
+from scrapers.utils.ratelimit import HostRateLimiter, TokenBucket
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TokenBucketTest(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = mock.patch.object(ratelimit.time, "monotonic", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_burst_is_free_then_requests_wait_one_interval_each(self):
+        bucket = TokenBucket(rate=2.0, burst=2)
+
+        self.assertEqual(bucket.reserve(), 0.0)
+        self.assertEqual(bucket.reserve(), 0.0)
+        self.assertAlmostEqual(bucket.reserve(), 0.5)
+        self.assertAlmostEqual(bucket.reserve(), 1.0)
+
+    def test_time_spent_elsewhere_refills_the_bucket(self):
+        bucket = TokenBucket(rate=1.0, burst=1)
+        bucket.reserve()
+
+        self.clock.now += 0.75
+        self.assertAlmostEqual(bucket.reserve(), 0.25)
+
+    def test_acquire_sleeps_for_the_reserved_delay(self):
+        bucket = TokenBucket(rate=4.0, burst=1)
+        with mock.patch.object(ratelimit.time, "sleep") as sleep:
+            bucket.acquire()
+            bucket.acquire()
+
+        sleep.assert_called_once()
+        self.assertAlmostEqual(sleep.call_args[0][0], 0.25)
+
+    def test_update_with_wait_empties_the_bucket(self):
+        bucket = TokenBucket(rate=1.0, burst=5)
+        bucket.update(1.0, wait=10)
+
+        self.assertAlmostEqual(bucket.reserve(), 10.0)
+
+
+class HostRateLimiterTest(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = mock.patch.object(ratelimit.time, "monotonic", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.limiter = HostRateLimiter()
+
+    def test_unconfigured_host_is_not_limited(self):
+        self.assertIsNone(self.limiter.bucket("example.com"))
+        self.assertEqual(self.limiter.acquire("example.com"), 0.0)
+
+    def test_default_rate_is_opt_in(self):
+        self.limiter.set_default_rate(0.5, burst=1)
+
+        self.assertEqual(self.limiter.bucket("Example.com").rate, 0.5)
+        self.limiter.set_default_rate(None)
+        self.assertIsNone(self.limiter.bucket("example.com"))
+
+    def test_keep_existing_leaves_a_retuned_host_alone(self):
+        self.limiter.set_rate("api.example.com", rate=1.0)
+        self.limiter.spread("api.example.com", remaining=30, reset_in=10)
+        self.limiter.set_rate("api.example.com", rate=1.0, keep_existing=True)
+
+        self.assertAlmostEqual(self.limiter.bucket("api.example.com").rate, 3.0)
+
+    def test_spread_paces_remaining_quota_over_the_window(self):
+        self.limiter.set_rate("api.example.com", rate=1.0)
+
+        rate = self.limiter.spread("api.example.com", remaining=100, reset_in=50, in_flight=10)
+
+        self.assertAlmostEqual(rate, 90 / 50)
+        self.assertAlmostEqual(self.limiter.bucket("api.example.com").rate, 90 / 50)
+
+    def test_spread_with_quota_used_up_waits_for_the_reset(self):
+        self.limiter.set_rate("api.example.com", rate=1.0, burst=3)
+
+        self.assertEqual(self.limiter.spread("api.example.com", remaining=2, reset_in=20, in_flight=2), 0.0)
+        self.assertAlmostEqual(self.limiter.bucket("api.example.com").reserve(), 20.0)
+
+    def test_spread_limits_an_unconfigured_host(self):
+        self.limiter.spread("api.example.com", remaining=20, reset_in=10)
+
+        self.assertAlmostEqual(self.limiter.bucket("api.example.com").rate, 2.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
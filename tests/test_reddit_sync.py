@@ -0,0 +1,49 @@
+import csv
+import tempfile
+import unittest
+from pathlib import Path
+
+from scrapers.social_media.reddit_sync import upsert_csv
+
+FIELDNAMES = ["id", "title", "score", "num_comments"]
+
+
+def post(post_id, score=1, num_comments=0):
+    return {"id": post_id, "title": f"post {post_id}", "score": score, "num_comments": num_comments}
+
+
+def read_rows(path):
+    with open(path, newline="", encoding="utf-8") as f:
+        return list(csv.DictReader(f))
+
+
+class UpsertCsvTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "posts.csv"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_new_post_listed_twice_is_added_once(self):
+        # The same post fetched under both 'hot' and 'new' in one sync
+        added, changed = upsert_csv(self.path, [post("a", score=5), post("b"), post("a", score=7)], FIELDNAMES)
+
+        self.assertEqual((added, changed), (2, 0))
+        rows = read_rows(self.path)
+        self.assertEqual([row["id"] for row in rows], ["a", "b"])
+        self.assertEqual(rows[0]["score"], "7")
+
+    def test_known_post_updates_only_moving_fields(self):
+        upsert_csv(self.path, [post("a", score=1)], FIELDNAMES)
+        added, changed = upsert_csv(self.path, [dict(post("a", score=9), title="edited"), post("c")], FIELDNAMES)
+
+        self.assertEqual((added, changed), (1, 1))
+        rows = {row["id"]: row for row in read_rows(self.path)}
+        self.assertEqual(rows["a"]["score"], "9")
+        self.assertEqual(rows["a"]["title"], "post a")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+import csv
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from scrapers.utils.checkpoint import Checkpoint
+from scrapers.utils.sinks import CsvSink, RowSink, open_sink
+
+
+def read_rows(path):
+    with open(path, newline="", encoding="utf-8") as f:
+        return list(csv.DictReader(f))
+
+
+class SinkTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_rows_are_written_in_batches(self):
+        path = self.dir / "rows.csv"
+        sink = CsvSink(path, fieldnames=["n"], batch_size=2)
+
+        sink.write({"n": 1})
+        self.assertFalse(path.exists())
+        sink.write({"n": 2})
+        self.assertEqual(read_rows(path), [{"n": "1"}, {"n": "2"}])
+        sink.write({"n": 3})
+        self.assertEqual(len(read_rows(path)), 2)
+        sink.close()
+        self.assertEqual(len(read_rows(path)), 3)
+
+    def test_buffer_is_flushed_when_the_crawl_fails(self):
+        path = self.dir / "rows.jsonl"
+
+        def rows():
+            yield {"n": 1, "extra": "dropped"}
+            raise RuntimeError("crawl died")
+
+        with self.assertRaises(RuntimeError):
+            with open_sink(path, fieldnames=["n"]) as sink:
+                sink.write_many(rows())
+        self.assertEqual([json.loads(line) for line in path.read_text().splitlines()], [{"n": 1}])
+
+    def test_a_sink_needs_a_batch_writer(self):
+        class Incomplete(RowSink):
+            pass
+
+        with self.assertRaises(TypeError):
+            Incomplete(self.dir / "rows.csv")
+
+
+class CheckpointResumeTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+        self.state = self.dir / "checkpoint.json"
+        self.output = self.dir / "rows.csv"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def crash_after_page_one(self):
+        checkpoint = Checkpoint(self.state)
+        sink = CsvSink(self.output, fieldnames=["page"], batch_size=1)
+        checkpoint.track(sink)
+        sink.write({"page": 1})
+        checkpoint.commit(1)
+        sink.write({"page": 2})   # on disk, but page 2 never committed
+        sink.close()
+
+    def test_resume_cuts_rows_written_after_the_last_commit(self):
+        self.crash_after_page_one()
+
+        checkpoint = Checkpoint(self.state, resume=True)
+        self.assertTrue(checkpoint.restore_output(self.output))
+        self.assertEqual(checkpoint.pending([1, 2, 3]), [2, 3])
+        with CsvSink(self.output, fieldnames=["page"], append=True) as sink:
+            sink.write({"page": 2})
+        self.assertEqual([row["page"] for row in read_rows(self.output)], ["1", "2"])
+
+    def test_fresh_run_discards_the_checkpoint(self):
+        self.crash_after_page_one()
+
+        checkpoint = Checkpoint(self.state)
+        self.assertFalse(self.state.exists())
+        self.assertFalse(checkpoint.restore_output(self.output))
+
+    def test_resume_before_any_commit_starts_afresh(self):
+        Checkpoint(self.state).commit()
+
+        checkpoint = Checkpoint(self.state, resume=True)
+        self.assertFalse(checkpoint.restore_output(self.output))
+
+
+if __name__ == "__main__":
+    unittest.main()